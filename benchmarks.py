@@ -0,0 +1,295 @@
+"""
+Search Benchmarks
+
+Measures throughput and convergence speed of MultiAgentSearchCoordinator on
+the example search spaces (neural network, preprocessing pipeline, projection
+pursuit and diagnostic thresholds) across seeds and agent counts. Results are
+written as JSON so runs of different versions can be compared for regressions.
+
+Usage:
+    python benchmarks.py --seeds 0 1 2 --agents 2 4 8 --output results.json
+    python benchmarks.py --output new.json --compare results.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from multi_agent_search import MultiAgentSearchCoordinator
+from instrumentation import format_profile
+from examples import (
+    NEURAL_NETWORK_SEARCH_SPACE,
+    PIPELINE_SEARCH_SPACE,
+    evaluate_nn_config,
+    evaluate_pipeline
+)
+from spinebil_integration import (
+    PROJECTION_PURSUIT_SEARCH_SPACE,
+    DIAGNOSTIC_THRESHOLD_SEARCH_SPACE,
+    evaluate_projection_config,
+    evaluate_thresholds
+)
+
+
+# name -> (search space, evaluation function, target score)
+BENCHMARKS = {
+    'neural_network': (NEURAL_NETWORK_SEARCH_SPACE, evaluate_nn_config, 0.97),
+    'pipeline': (PIPELINE_SEARCH_SPACE, evaluate_pipeline, 0.90),
+    'projection_pursuit': (PROJECTION_PURSUIT_SEARCH_SPACE, evaluate_projection_config, 0.97),
+    'thresholds': (DIAGNOSTIC_THRESHOLD_SEARCH_SPACE, evaluate_thresholds, 0.97),
+}
+
+
+class TimedEvaluation:
+    """Wraps an evaluation function to time it and track convergence."""
+
+    def __init__(self, evaluation_fn: Callable[[Dict[str, Any]], float], target_score: float):
+        self.evaluation_fn = evaluation_fn
+        self.target_score = target_score
+        self.elapsed = 0.0
+        self.count = 0
+        self.evaluations_to_target = None
+
+    def __call__(self, config: Dict[str, Any]) -> float:
+        started = time.perf_counter()
+        score = self.evaluation_fn(config)
+        self.elapsed += time.perf_counter() - started
+        self.count += 1
+        if self.evaluations_to_target is None and score >= self.target_score:
+            self.evaluations_to_target = self.count
+        return score
+
+
+def run_benchmark(
+    name: str,
+    seed: int,
+    num_agents: int,
+    num_iterations: int = 100,
+    communication_interval: int = 10,
+    measure_memory: bool = True,
+    profile: bool = False
+) -> Dict[str, Any]:
+    """
+    Run one benchmark configuration.
+
+    Args:
+        name: Key into BENCHMARKS
+        seed: Random seed
+        num_agents: Number of agents
+        num_iterations: Search iterations
+        communication_interval: How often agents share knowledge
+        measure_memory: Whether to repeat the run under tracemalloc to
+            record peak memory (kept separate so it does not skew timings)
+        profile: Whether to record the coordinator's per-phase profile
+
+    Returns:
+        Dictionary of measurements
+    """
+    search_space, evaluation_fn, target_score = BENCHMARKS[name]
+
+    def run() -> tuple:
+        random.seed(seed)
+        timed = TimedEvaluation(evaluation_fn, target_score)
+        coordinator = MultiAgentSearchCoordinator(
+            search_space=search_space,
+            evaluation_fn=timed,
+            num_agents=num_agents,
+            profile=profile
+        )
+        started = time.perf_counter()
+        coordinator.search(
+            num_iterations=num_iterations,
+            communication_interval=communication_interval,
+            verbose=False
+        )
+        return coordinator, timed, time.perf_counter() - started
+
+    coordinator, timed, wall_time = run()
+
+    peak_memory = None
+    if measure_memory:
+        tracemalloc.start()
+        run()
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    stats = coordinator.get_statistics()
+    evaluations = timed.count
+    return {
+        'benchmark': name,
+        'seed': seed,
+        'num_agents': num_agents,
+        'num_iterations': num_iterations,
+        'evaluations': evaluations,
+        'wall_time': wall_time,
+        'evaluation_time': timed.elapsed,
+        'evaluations_per_second': evaluations / wall_time if wall_time else 0.0,
+        'overhead_per_evaluation': (
+            (wall_time - timed.elapsed) / evaluations if evaluations else None
+        ),
+        'proposal_yield': stats['proposal_yield'],
+        'peak_memory_bytes': peak_memory,
+        'best_score': stats['best_score'],
+        'target_score': target_score,
+        'evaluations_to_target': timed.evaluations_to_target,
+        'profile': stats['profile'],
+    }
+
+
+def summarize(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Aggregate per-seed results by benchmark and agent count.
+
+    Args:
+        results: Output of run_benchmark for several seeds
+
+    Returns:
+        One summary record per (benchmark, num_agents)
+    """
+    groups = {}
+    for result in results:
+        groups.setdefault((result['benchmark'], result['num_agents']), []).append(result)
+
+    summary = []
+    for (name, num_agents), group in sorted(groups.items()):
+        reached = [r['evaluations_to_target'] for r in group
+                   if r['evaluations_to_target'] is not None]
+        memory = [r['peak_memory_bytes'] for r in group if r['peak_memory_bytes'] is not None]
+        summary.append({
+            'benchmark': name,
+            'num_agents': num_agents,
+            'runs': len(group),
+            'evaluations_per_second': statistics.median(
+                r['evaluations_per_second'] for r in group
+            ),
+            'overhead_per_evaluation': statistics.median(
+                r['overhead_per_evaluation'] for r in group
+                if r['overhead_per_evaluation'] is not None
+            ),
+            'peak_memory_bytes': max(memory) if memory else None,
+            'target_reached_fraction': len(reached) / len(group),
+            'median_evaluations_to_target': statistics.median(reached) if reached else None,
+            'mean_best_score': float(np.mean([r['best_score'] for r in group])),
+        })
+    return summary
+
+
+def compare(
+    summary: List[Dict[str, Any]],
+    baseline: List[Dict[str, Any]],
+    tolerance: float = 0.2
+) -> List[str]:
+    """
+    Compare a summary against a baseline summary.
+
+    Args:
+        summary: Current summary records
+        baseline: Baseline summary records
+        tolerance: Allowed relative slowdown before flagging a regression
+
+    Returns:
+        Human-readable descriptions of every regression found
+    """
+    previous = {(r['benchmark'], r['num_agents']): r for r in baseline}
+    regressions = []
+    for record in summary:
+        key = (record['benchmark'], record['num_agents'])
+        if key not in previous:
+            continue
+        old = previous[key]
+        label = f"{record['benchmark']} ({record['num_agents']} agents)"
+
+        if record['evaluations_per_second'] < (1 - tolerance) * old['evaluations_per_second']:
+            regressions.append(
+                f"{label}: throughput {record['evaluations_per_second']:.0f}/s "
+                f"vs {old['evaluations_per_second']:.0f}/s"
+            )
+        old_steps = old['median_evaluations_to_target']
+        new_steps = record['median_evaluations_to_target']
+        if old_steps is not None and (new_steps is None or new_steps > (1 + tolerance) * old_steps):
+            regressions.append(
+                f"{label}: evaluations to target {new_steps} vs {old_steps}"
+            )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--benchmarks', nargs='+', default=list(BENCHMARKS),
+                        choices=list(BENCHMARKS))
+    parser.add_argument('--seeds', nargs='+', type=int, default=[0, 1, 2])
+    parser.add_argument('--agents', nargs='+', type=int, default=[2, 4, 8])
+    parser.add_argument('--iterations', type=int, default=100)
+    parser.add_argument('--communication-interval', type=int, default=10)
+    parser.add_argument('--no-memory', action='store_true',
+                        help='skip the tracemalloc pass')
+    parser.add_argument('--profile', action='store_true',
+                        help='record and print per-phase timings')
+    parser.add_argument('--output', help='write JSON results to this file')
+    parser.add_argument('--compare', help='baseline JSON results to check for regressions')
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    results = []
+    for name in args.benchmarks:
+        for num_agents in args.agents:
+            for seed in args.seeds:
+                results.append(run_benchmark(
+                    name, seed, num_agents,
+                    num_iterations=args.iterations,
+                    communication_interval=args.communication_interval,
+                    measure_memory=not args.no_memory,
+                    profile=args.profile
+                ))
+                if args.profile:
+                    print(f"{name}, {num_agents} agents, seed {seed}:")
+                    for line in format_profile(results[-1]['profile']):
+                        print(f"  {line}")
+    summary = summarize(results)
+
+    print(f"{'benchmark':<20}{'agents':>7}{'evals/s':>12}{'overhead us':>13}"
+          f"{'peak KiB':>10}{'to target':>11}")
+    for record in summary:
+        memory = record['peak_memory_bytes']
+        steps = record['median_evaluations_to_target']
+        print(f"{record['benchmark']:<20}{record['num_agents']:>7}"
+              f"{record['evaluations_per_second']:>12.0f}"
+              f"{record['overhead_per_evaluation'] * 1e6:>13.1f}"
+              f"{(f'{memory / 1024:.0f}' if memory is not None else '-'):>10}"
+              f"{(steps if steps is not None else '-'):>11}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({
+                'metadata': {
+                    'python': platform.python_version(),
+                    'numpy': np.__version__,
+                    'platform': platform.platform(),
+                    'timestamp': time.time(),
+                    'arguments': vars(args),
+                },
+                'results': results,
+                'summary': summary,
+            }, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['summary']
+        regressions = compare(summary, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+"""
+Search Checkpointing
+
+Periodic checkpoints let a long MultiAgentSearchCoordinator.search resume
+after the process is pre-empted. A checkpoint directory holds two files:
+
+- journal.jsonl: an append-only log with one [agent_id, fingerprint, score]
+  record per evaluation. Each checkpoint only appends the records produced
+  since the previous one, so agent histories are never re-dumped.
+- state.pkl: a small snapshot of everything else (iteration, random module
+  state, agent bests and parameters, history statistics, counters),
+  replaced atomically.
+
+The snapshot records how many journal records it covers, so records written
+by an interrupted checkpoint are discarded on resume.
+"""
+
+import io
+import json
+import os
+import pickle
+import random
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+
+JOURNAL_FILE = 'journal.jsonl'
+STATE_FILE = 'state.pkl'
+FORMAT_VERSION = 1
+
+
+class _SpacePickler(pickle.Pickler):
+    """Pickles references to the coordinator's search space by name."""
+
+    def __init__(self, file, space):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.space = space
+
+    def persistent_id(self, obj):
+        if obj is self.space:
+            return 'space'
+        return None
+
+
+class _SpaceUnpickler(pickle.Unpickler):
+    """Resolves search space references back to the coordinator's space."""
+
+    def __init__(self, file, space):
+        super().__init__(file)
+        self.space = space
+
+    def persistent_load(self, pid):
+        if pid == 'space':
+            return self.space
+        raise pickle.UnpicklingError(f"Unknown persistent id {pid!r}")
+
+
+class SearchCheckpoint:
+    """Writes and restores checkpoints of a MultiAgentSearchCoordinator."""
+
+    def __init__(self, directory: str):
+        """
+        Initialize a checkpoint location.
+
+        Args:
+            directory: Directory holding the journal and snapshot files
+        """
+        self.directory = directory
+        self.journal_path = os.path.join(directory, JOURNAL_FILE)
+        self.state_path = os.path.join(directory, STATE_FILE)
+        self.num_records = 0
+        self._pending = []
+
+    def exists(self) -> bool:
+        """Whether a snapshot has been written to this directory."""
+        return os.path.exists(self.state_path)
+
+    def reset(self):
+        """Remove any previous checkpoint so a fresh search starts clean."""
+        for path in (self.journal_path, self.state_path):
+            if os.path.exists(path):
+                os.remove(path)
+        self.num_records = 0
+        self._pending = []
+
+    def record(self, agent_id: int, fingerprint: int, score: float):
+        """
+        Buffer one evaluation until the next save().
+
+        Args:
+            agent_id: Agent that received the result
+            fingerprint: Fingerprint of the evaluated architecture
+            score: Its score
+        """
+        self._pending.append((agent_id, fingerprint, score))
+
+    def save(self, coordinator, iteration: int):
+        """
+        Append buffered evaluations to the journal and snapshot the state.
+
+        Args:
+            coordinator: The coordinator to checkpoint
+            iteration: Last fully completed iteration
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        if self._pending:
+            with open(self.journal_path, 'a') as journal:
+                journal.writelines(
+                    json.dumps([int(agent_id), int(fingerprint), float(score)]) + '\n'
+                    for agent_id, fingerprint, score in self._pending
+                )
+                journal.flush()
+                os.fsync(journal.fileno())
+            self.num_records += len(self._pending)
+            self._pending = []
+
+        state = {
+            'version': FORMAT_VERSION,
+            'iteration': iteration,
+            'journal_records': self.num_records,
+            'random_state': random.getstate(),
+            'coordinator': coordinator.get_state(),
+            'agents': [agent.get_state() for agent in coordinator.agents],
+            # Saved rather than recomputed so resumed statistics match bit for bit
+            'history_stats': [agent.history.stats for agent in coordinator.agents],
+        }
+        buffer = io.BytesIO()
+        _SpacePickler(buffer, coordinator.space).dump(state)
+
+        temporary = self.state_path + '.tmp'
+        with open(temporary, 'wb') as f:
+            f.write(buffer.getvalue())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, self.state_path)
+
+    def restore(self, coordinator) -> Tuple[int, List[Tuple[int, int, float]]]:
+        """
+        Restore a coordinator from this checkpoint.
+
+        Agent histories are rebuilt from the journal, everything else from the
+        snapshot, and the random module is put back in the state it had when
+        the snapshot was taken.
+
+        Args:
+            coordinator: A freshly constructed coordinator with the same
+                search space and agent configuration
+
+        Returns:
+            The last completed iteration and the journal records replayed
+        """
+        with open(self.state_path, 'rb') as f:
+            state = _SpaceUnpickler(f, coordinator.space).load()
+        if state['version'] != FORMAT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version {state['version']}")
+        if len(state['agents']) != len(coordinator.agents):
+            raise ValueError(
+                f"Checkpoint has {len(state['agents'])} agents, "
+                f"coordinator has {len(coordinator.agents)}"
+            )
+
+        records = self._read_journal(state['journal_records'])
+        self.num_records = len(records)
+        self._pending = []
+
+        per_agent: Dict[int, List[Tuple[int, float]]] = {}
+        for agent_id, fingerprint, score in records:
+            per_agent.setdefault(agent_id, []).append((fingerprint, score))
+        for agent, agent_state in zip(coordinator.agents, state['agents']):
+            rows = per_agent.get(agent.agent_id, [])
+            if rows:
+                indices = np.array([coordinator.space.unpack(fp) for fp, _ in rows])
+                agent.history.extend(indices, np.array([score for _, score in rows]))
+            # After the history, which agents may rebuild derived state from
+            agent.set_state(agent_state)
+        for agent, stats in zip(coordinator.agents, state.get('history_stats', ())):
+            agent.history.stats = stats
+
+        coordinator.evaluated_architectures = {fingerprint for _, fingerprint, _ in records}
+        coordinator.set_state(state['coordinator'])
+        coordinator.iteration = state['iteration']
+        random.setstate(state['random_state'])
+        return state['iteration'], records
+
+    def _read_journal(self, num_records: int) -> List[Tuple[int, int, float]]:
+        """Read the first num_records journal entries, dropping any others."""
+        records = []
+        if num_records == 0:
+            if os.path.exists(self.journal_path):
+                os.truncate(self.journal_path, 0)
+            return records
+
+        with open(self.journal_path, 'rb+') as journal:
+            while len(records) < num_records:
+                line = journal.readline()
+                if not line:
+                    raise ValueError(
+                        f"Journal holds {len(records)} records, snapshot expects {num_records}"
+                    )
+                agent_id, fingerprint, score = json.loads(line)
+                records.append((agent_id, fingerprint, score))
+            # Discard records from a checkpoint that never completed
+            journal.truncate(journal.tell())
+        return records
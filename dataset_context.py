@@ -0,0 +1,431 @@
+"""
+Dataset Context
+
+Per-dataset preprocessing shared by every evaluation that runs on the same
+data. A DatasetContext computes intermediates lazily, on first use: the
+mean, covariance, sphering, group scatter, nearest neighbours and prepared
+projection indices. It memoizes them in an LRU cache keyed on their
+parameters, so a multi-agent sweep pays for them once rather than once per
+configuration.
+
+For process-based evaluation, share() copies the data into shared memory
+once and returns a small picklable SharedDataset handle. Workers attach to
+it read-only, without copying the data. Each worker attaches only once and
+keeps its own cache across the jobs it runs.
+
+Contexts over memory-mapped files (from_file, or any np.memmap) stream
+instead. The mean, covariance and group scatter are accumulated chunk by
+chunk. Computations that need individual observations (sphered data,
+neighbours, holes and central mass) use a random row subsample. Memory is
+therefore bounded by the chunk and sample sizes rather than the number of
+rows. Pickling such a context sends the file name, not the data, so
+workers map the same pages.
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+import numpy as np
+
+from dataset_io import (
+    DEFAULT_CHUNK_ROWS,
+    DEFAULT_SAMPLE_SIZE,
+    StreamingGroupMoments,
+    StreamingMoments,
+    iter_chunks,
+    open_dataset,
+    subsample
+)
+from projection_indices import covariance, group_scatter, make_index, whitening_matrix
+
+
+class DatasetContext:
+    """Lazily computed, LRU-cached preprocessing of one dataset."""
+
+    def __init__(
+        self,
+        data: np.ndarray,
+        labels: Optional[np.ndarray] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        max_entries: int = 32,
+        chunk_size: Optional[int] = None,
+        sample_size: int = DEFAULT_SAMPLE_SIZE,
+        sample_seed: int = 0
+    ):
+        """
+        Wrap a dataset.
+
+        Args:
+            data: Array of shape (n, p), one observation per row
+            labels: Class of every observation, if the data is labelled
+            metadata: Small picklable extras travelling with the dataset
+            max_entries: Cached intermediates kept before the least recently
+                used one is evicted
+            chunk_size: Rows per chunk; setting it (or passing an np.memmap)
+                switches the context to streaming mode
+            sample_size: Rows subsampled in streaming mode for computations
+                needing individual observations
+            sample_seed: Seed of the subsample
+        """
+        self.streaming = chunk_size is not None or isinstance(data, np.memmap)
+        if not self.streaming:
+            data = np.asarray(data, dtype=np.float64)
+        if data.ndim != 2 or data.shape[1] < 2:
+            raise ValueError("data must have shape (n, p) with p >= 2")
+        if labels is not None:
+            # asanyarray keeps memory-mapped labels mapped
+            labels = np.asanyarray(labels)
+            if labels.shape != (len(data),):
+                raise ValueError("labels must hold one class per observation")
+        self.data = data
+        self.labels = labels
+        self.metadata = metadata or {}
+        self.max_entries = max_entries
+        self.chunk_size = chunk_size or DEFAULT_CHUNK_ROWS
+        self.sample_size = sample_size
+        self.sample_seed = sample_seed
+        self.num_observations, self.num_variables = data.shape
+        self._cache = OrderedDict()
+        self._lock = threading.RLock()
+        self._shared_memory = []
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def cached(self, name: str, compute: Callable[[], Any], **params) -> Any:
+        """
+        Return the intermediate called name, computing it on first use.
+
+        Args:
+            name: What is computed
+            compute: Zero-argument function computing it
+            **params: Preprocessing parameters; every distinct combination
+                is cached separately
+
+        Returns:
+            The cached or freshly computed value
+        """
+        key = (name, tuple(sorted(params.items())))
+        with self._lock:
+            if key in self._cache:
+                self.hits += 1
+                self._cache.move_to_end(key)
+                return self._cache[key]
+            self.misses += 1
+            value = compute()
+            self._cache[key] = value
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+                self.evictions += 1
+            return value
+
+    @classmethod
+    def from_file(
+        cls,
+        path: str,
+        labels: Optional[np.ndarray] = None,
+        dtype: str = 'float64',
+        num_variables: Optional[int] = None,
+        offset: int = 0,
+        **kwargs
+    ) -> 'DatasetContext':
+        """
+        A streaming context over a memory-mapped .npy or raw binary file.
+
+        Args:
+            path: Data file (see dataset_io.open_dataset)
+            labels: Class of every row, e.g. itself a memory-mapped array
+            dtype: Value type of a raw file
+            num_variables: Columns of a raw file
+            offset: Bytes to skip at the start of a raw file
+            **kwargs: Further DatasetContext arguments
+        """
+        return cls(open_dataset(path, dtype, num_variables, offset), labels, **kwargs)
+
+    def cache_info(self) -> Dict[str, int]:
+        """Hit, miss and eviction counts and the current cache size."""
+        return {'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions, 'size': len(self._cache)}
+
+    def moments(self) -> StreamingMoments:
+        """Count, mean and scatter accumulated over the data in chunks."""
+        def compute():
+            moments = StreamingMoments(self.num_variables)
+            for chunk in iter_chunks(self.data, self.chunk_size):
+                moments.update(chunk)
+            return moments
+
+        return self.cached('moments', compute)
+
+    def observations(self) -> np.ndarray:
+        """The data, or in streaming mode a random subsample of its rows."""
+        if not self.streaming:
+            return self.data
+        return self.cached('observations', lambda: subsample(
+            self.data, self.sample_size, np.random.default_rng(self.sample_seed), self.chunk_size
+        )[0], size=self.sample_size, seed=self.sample_seed)
+
+    def mean(self) -> np.ndarray:
+        """Column means, shape (p,)."""
+        if self.streaming:
+            return self.moments().mean
+        return self.cached('mean', lambda: self.data.mean(axis=0))
+
+    def covariance(self) -> np.ndarray:
+        """Sample covariance, shape (p, p)."""
+        if self.streaming:
+            return self.cached('covariance', lambda: self.moments().covariance())
+        return self.cached('covariance', lambda: covariance(self.data))
+
+    def whitening(self) -> np.ndarray:
+        """Whitening matrix W with W S W = I, shape (p, p)."""
+        return self.cached('whitening', lambda: whitening_matrix(self.covariance()))
+
+    def centered(self) -> np.ndarray:
+        """Observations minus the column means."""
+        return self.cached('centered', lambda: self.observations() - self.mean())
+
+    def sphered(self) -> np.ndarray:
+        """Centered observations transformed to identity covariance."""
+        return self.cached('sphered', lambda: self.centered() @ self.whitening())
+
+    def group_scatter(self, sphered: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """(within, between) group scatter of the raw or sphered data."""
+        if self.labels is None:
+            raise ValueError("the dataset has no class labels")
+
+        def compute():
+            if not sphered and self.streaming:
+                moments = StreamingGroupMoments(self.num_variables)
+                for chunk, labels in zip(iter_chunks(self.data, self.chunk_size),
+                                         iter_chunks(self.labels, self.chunk_size)):
+                    moments.update(chunk, labels)
+                return moments.scatter()
+            if not sphered:
+                return group_scatter(self.data, self.labels)
+            whitening = self.whitening()
+            within, between = self.group_scatter()
+            return whitening @ within @ whitening, whitening @ between @ whitening
+
+        return self.cached('group_scatter', compute, sphered=sphered)
+
+    def neighbours(self, k: int = 5, sphered: bool = True,
+                   chunk_size: Optional[int] = None) -> np.ndarray:
+        """
+        Indices of every observation's k nearest neighbours, nearest first.
+
+        Distances are computed chunk by chunk, so memory stays at
+        O(chunk_size * n) rather than O(n^2); by default a chunk holds about
+        four million distances. In streaming mode the
+        neighbours are searched within the subsample and index into it.
+
+        Returns:
+            Array of shape (n, k), or (sample size, k) in streaming mode
+        """
+        if not 0 < k < min(self.num_observations, len(self.observations())):
+            raise ValueError("k must be between 1 and the number of observations - 1")
+
+        def compute():
+            points = self.sphered() if sphered else self.observations()
+            norms = np.einsum('ij,ij->i', points, points)
+            result = np.empty((len(points), k), dtype=np.int64)
+            rows = chunk_size or max(1, (1 << 22) // len(points))
+            for start in range(0, len(points), rows):
+                block = points[start:start + rows]
+                distances = norms[start:start + len(block), None] + norms - 2 * block @ points.T
+                distances[np.arange(len(block)), np.arange(start, start + len(block))] = np.inf
+                nearest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+                order = np.argsort(np.take_along_axis(distances, nearest, axis=1), axis=1)
+                result[start:start + len(block)] = np.take_along_axis(nearest, order, axis=1)
+            return result
+
+        return self.cached('neighbours', compute, k=k, sphered=sphered)
+
+    def index(self, name: str, sphered: bool = True, **params):
+        """
+        The named projection pursuit index prepared on this dataset.
+
+        Intermediates the index needs (sphered data, group scatter,
+        covariance) come from the context's cache.
+
+        Args:
+            name: One of projection_indices.INDEX_FUNCTIONS
+            sphered: Prepare the index on the sphered data, as for a tourr
+                guided tour. The stringy index needs sphered=False, because
+                sphered data has the same variance in every direction.
+            **params: Index parameters, e.g. lambda_ for pda
+        """
+        if name == 'stringy' and sphered:
+            raise ValueError("the stringy index is constant on sphered data; use sphered=False")
+
+        def compute():
+            data = self.sphered() if sphered else self.observations()
+            precomputed = {}
+            if name in ('lda', 'pda'):
+                precomputed['scatter'] = self.group_scatter(sphered=sphered)
+                return make_index(name, data, self.labels, **params, **precomputed)
+            if name in ('holes', 'central_mass'):
+                precomputed['sphered'] = self.sphered()
+            elif name == 'stringy':
+                precomputed['covariance_matrix'] = self.covariance()
+            return make_index(name, data, **params, **precomputed)
+
+        return self.cached('index', compute, index_name=name, sphered=sphered, **params)
+
+    def share(self) -> 'SharedDataset':
+        """
+        Copy the data and labels into shared memory for worker processes.
+
+        The caller owns the blocks and must call unlink() on the returned
+        handle (or use it as a context manager) once the workers are done.
+        """
+        return SharedDataset.create(self)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        state['_shared_memory'] = []
+        if isinstance(self.data, np.memmap):
+            # Send the mapping, not the rows, and only the (p, p) entries that
+            # would cost workers a pass over the file
+            state['data'] = _mapping(self.data)
+            state['_cache'] = OrderedDict(
+                (key, value) for key, value in self._cache.items()
+                if key[0] in ('moments', 'covariance')
+            )
+        else:
+            # In-memory contexts carry the data but not the cache
+            state['_cache'] = OrderedDict()
+        if isinstance(self.labels, np.memmap):
+            state['labels'] = _mapping(self.labels)
+        return state
+
+    def __setstate__(self, state):
+        for name in ('data', 'labels'):
+            if isinstance(state[name], tuple):
+                state[name] = _reopen(*state[name])
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+
+def _mapping(array: np.memmap) -> tuple:
+    """What is needed to map a memory-mapped array again in another process."""
+    return (array.filename, array.dtype.str, array.shape, array.offset,
+            array.flags.f_contiguous)
+
+
+def _reopen(filename: str, dtype: str, shape: tuple, offset: int, fortran: bool) -> np.memmap:
+    """Map an array described by _mapping() read-only."""
+    return np.memmap(filename, dtype=dtype, mode='r', offset=offset,
+                     shape=shape, order='F' if fortran else 'C')
+
+
+def _attach_block(name: str) -> shared_memory.SharedMemory:
+    """Attach to a block without letting this process's tracker unlink it."""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    # Older versions register every attachment, and the tracker would unlink
+    # the block when this process exits (or, for forked workers sharing the
+    # creator's tracker, forget the creator's registration)
+    register = resource_tracker.register
+    resource_tracker.register = lambda *args: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+# Contexts attached in this process, by data block name
+_ATTACHED: Dict[str, DatasetContext] = {}
+
+
+class SharedDataset:
+    """Picklable handle to a dataset in shared memory."""
+
+    def __init__(self, data_name: str, shape: Tuple[int, int], label_name: Optional[str],
+                 classes: Optional[np.ndarray], metadata: Dict[str, Any], max_entries: int):
+        self.data_name = data_name
+        self.shape = shape
+        self.label_name = label_name
+        self.classes = classes
+        self.metadata = metadata
+        self.max_entries = max_entries
+        self._blocks = []
+
+    @classmethod
+    def create(cls, context: DatasetContext) -> 'SharedDataset':
+        """Copy a context's data and labels into new shared memory blocks."""
+        blocks = []
+        data_block = shared_memory.SharedMemory(create=True, size=max(context.data.nbytes, 1))
+        np.ndarray(context.data.shape, np.float64, data_block.buf)[:] = context.data
+        blocks.append(data_block)
+
+        label_name = None
+        classes = None
+        if context.labels is not None:
+            # Labels travel as integer codes so any label type fits in shared memory
+            classes, codes = np.unique(context.labels, return_inverse=True)
+            label_block = shared_memory.SharedMemory(create=True, size=max(codes.nbytes, 1))
+            np.ndarray(codes.shape, np.int64, label_block.buf)[:] = codes
+            blocks.append(label_block)
+            label_name = label_block.name
+
+        handle = cls(data_block.name, context.data.shape, label_name, classes,
+                     context.metadata, context.max_entries)
+        handle._blocks = blocks
+        return handle
+
+    def attach(self) -> DatasetContext:
+        """
+        A read-only DatasetContext over the shared blocks.
+
+        Repeated calls in one process return the same context, so its cache
+        is reused across evaluations. Its labels are the integer class codes
+        into self.classes.
+        """
+        context = _ATTACHED.get(self.data_name)
+        if context is not None:
+            return context
+
+        blocks = [_attach_block(self.data_name)]
+        data = np.ndarray(self.shape, np.float64, blocks[0].buf)
+        data.flags.writeable = False
+        labels = None
+        if self.label_name is not None:
+            blocks.append(_attach_block(self.label_name))
+            labels = np.ndarray((self.shape[0],), np.int64, blocks[1].buf)
+            labels.flags.writeable = False
+
+        context = DatasetContext(data, labels, self.metadata, self.max_entries)
+        context._shared_memory = blocks
+        _ATTACHED[self.data_name] = context
+        return context
+
+    def unlink(self):
+        """Release the shared memory blocks; only the creating process should call this."""
+        _ATTACHED.pop(self.data_name, None)
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_blocks'] = []
+        return state
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.unlink()
+
+
+def resolve_context(context: Union[DatasetContext, SharedDataset]) -> DatasetContext:
+    """The DatasetContext behind a context or shared handle."""
+    if isinstance(context, SharedDataset):
+        return context.attach()
+    return context
@@ -0,0 +1,158 @@
+"""
+Dataset I/O
+
+Bounded-memory access to datasets too large to hold in every evaluation
+worker. open_dataset maps a .npy or raw binary file with numpy.memmap, so
+rows are paged in on demand, and processes mapping the same file share the
+pages through the OS page cache. The covariance, moments and group scatter
+are accumulated chunk by chunk with pairwise (Chan et al.) updates, and
+neighbour-based computations run on a random row subsample.
+"""
+
+import os
+from typing import Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+
+# Rows read per chunk when streaming
+DEFAULT_CHUNK_ROWS = 65536
+
+# Rows kept for computations that need individual observations
+DEFAULT_SAMPLE_SIZE = 100_000
+
+
+def open_dataset(
+    path: str,
+    dtype: str = 'float64',
+    num_variables: Optional[int] = None,
+    offset: int = 0
+) -> np.memmap:
+    """
+    Map a data matrix file read-only.
+
+    Args:
+        path: A .npy file, or a raw binary file of row-major values
+        dtype: Value type of a raw file (ignored for .npy)
+        num_variables: Columns of a raw file (required for raw files)
+        offset: Bytes to skip at the start of a raw file
+
+    Returns:
+        Memory-mapped array of shape (n, p)
+    """
+    if path.endswith('.npy'):
+        data = np.load(path, mmap_mode='r')
+        if data.ndim != 2:
+            raise ValueError(f"{path} holds an array of shape {data.shape}, expected (n, p)")
+        return data
+    if num_variables is None:
+        raise ValueError("num_variables is required for raw binary files")
+    row_bytes = np.dtype(dtype).itemsize * num_variables
+    num_rows = (os.path.getsize(path) - offset) // row_bytes
+    return np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=(num_rows, num_variables))
+
+
+def iter_chunks(array: np.ndarray, chunk_size: int = DEFAULT_CHUNK_ROWS) -> Iterator[np.ndarray]:
+    """Yield consecutive row blocks of array."""
+    for start in range(0, len(array), chunk_size):
+        yield array[start:start + chunk_size]
+
+
+class StreamingMoments:
+    """Count, mean and co-moment matrix accumulated over row chunks."""
+
+    def __init__(self, num_variables: int):
+        self.count = 0
+        self.mean = np.zeros(num_variables)
+        self._m2 = np.zeros((num_variables, num_variables))
+
+    def update(self, chunk: np.ndarray) -> 'StreamingMoments':
+        """Fold a (rows, p) chunk into the moments."""
+        chunk = np.asarray(chunk, dtype=np.float64)
+        if len(chunk) == 0:
+            return self
+        chunk_mean = chunk.mean(axis=0)
+        centered = chunk - chunk_mean
+        return self._merge(len(chunk), chunk_mean, centered.T @ centered)
+
+    def merge(self, other: 'StreamingMoments') -> 'StreamingMoments':
+        """Fold another accumulator (e.g. from a different worker) into this one."""
+        return self._merge(other.count, other.mean, other._m2)
+
+    def _merge(self, count: int, mean: np.ndarray, m2: np.ndarray) -> 'StreamingMoments':
+        if count == 0:
+            return self
+        total = self.count + count
+        delta = mean - self.mean
+        self._m2 += m2 + np.outer(delta, delta) * (self.count * count / total)
+        self.mean = self.mean + delta * (count / total)
+        self.count = total
+        return self
+
+    def scatter(self) -> np.ndarray:
+        """Sum of outer products of the centered rows, shape (p, p)."""
+        return self._m2.copy()
+
+    def covariance(self) -> np.ndarray:
+        """Sample covariance, shape (p, p)."""
+        if self.count < 2:
+            raise ValueError("at least two rows are needed for a covariance")
+        return self._m2 / (self.count - 1)
+
+
+class StreamingGroupMoments:
+    """Per-class moments for the within- and between-group scatter."""
+
+    def __init__(self, num_variables: int):
+        self.num_variables = num_variables
+        self.groups: Dict[object, StreamingMoments] = {}
+
+    def update(self, chunk: np.ndarray, labels: np.ndarray) -> 'StreamingGroupMoments':
+        """Fold a chunk and the labels of its rows into the moments."""
+        chunk = np.asarray(chunk, dtype=np.float64)
+        labels = np.asarray(labels)
+        classes, groups = np.unique(labels, return_inverse=True)
+        for position, label in enumerate(classes.tolist()):
+            moments = self.groups.setdefault(label, StreamingMoments(self.num_variables))
+            moments.update(chunk[groups == position])
+        return self
+
+    def scatter(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(within, between) group scatter, as projection_indices.group_scatter."""
+        if len(self.groups) < 2:
+            raise ValueError("at least two classes are needed")
+        total = StreamingMoments(self.num_variables)
+        within = np.zeros((self.num_variables, self.num_variables))
+        for moments in self.groups.values():
+            total.merge(moments)
+            within += moments.scatter()
+        return within, total.scatter() - within
+
+
+def subsample(
+    array: np.ndarray,
+    size: int,
+    rng: Optional[np.random.Generator] = None,
+    chunk_size: int = DEFAULT_CHUNK_ROWS
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Uniform random rows of an array, read without touching the others.
+
+    Args:
+        array: Array of shape (n, p), typically memory-mapped
+        size: Rows to draw (all rows if size >= n)
+        rng: NumPy generator (a fresh default one if omitted)
+        chunk_size: Rows gathered per read
+
+    Returns:
+        (rows as float64 in file order, their row numbers)
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    if size >= len(array):
+        rows = np.arange(len(array))
+    else:
+        rows = np.sort(rng.choice(len(array), size=size, replace=False))
+    sample = np.empty((len(rows), array.shape[1]))
+    for start in range(0, len(rows), chunk_size):
+        sample[start:start + chunk_size] = array[rows[start:start + chunk_size]]
+    return sample, rows
@@ -0,0 +1,492 @@
+"""
+Distributed Evaluation
+
+A SQLite-backed job queue that lets any number of worker processes - on this
+host or on others sharing the queue file - evaluate configurations for a
+MultiAgentSearchCoordinator. No external broker is needed.
+
+The coordinator side is QueueExecutor, a concurrent.futures.Executor, so it
+plugs into the coordinator's executor option unchanged:
+
+    coordinator = MultiAgentSearchCoordinator(
+        search_space, evaluate_projection_config,
+        executor=QueueExecutor('jobs.sqlite')
+    )
+
+Workers are started separately:
+
+    python distributed.py worker jobs.sqlite --processes 8
+
+Jobs are leased to workers for a limited time. Workers extend their lease
+while an evaluation runs; if a worker dies its lease expires and the job is
+requeued for another worker.
+"""
+
+import argparse
+import importlib
+import json
+import multiprocessing
+import os
+import socket
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+
+class JobQueue:
+    """Job table shared by the coordinator and its workers."""
+
+    def __init__(self, path: str, lease_timeout: float = 60.0, max_attempts: int = 3):
+        """
+        Open (or create) a job queue.
+
+        Args:
+            path: SQLite database file
+            lease_timeout: Seconds a leased job may go without a heartbeat
+                before it is handed to another worker
+            max_attempts: Leases per submitted job before it is marked failed
+                (recorded with each job, so workers need not agree on it)
+        """
+        self.path = path
+        self.lease_timeout = lease_timeout
+        self.max_attempts = max_attempts
+        self._local = threading.local()
+        with self._connection() as connection:
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS jobs ('
+                'id INTEGER PRIMARY KEY AUTOINCREMENT, '
+                'function TEXT NOT NULL, '
+                'payload TEXT NOT NULL, '
+                "status TEXT NOT NULL DEFAULT 'pending', "
+                'worker TEXT, '
+                'lease_expires REAL, '
+                'attempts INTEGER NOT NULL DEFAULT 0, '
+                'max_attempts INTEGER NOT NULL, '
+                'result REAL, '
+                'error TEXT)'
+            )
+            connection.execute('CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, id)')
+
+    def _connection(self) -> sqlite3.Connection:
+        """One connection per thread, as SQLite connections are not shareable."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+            connection.execute('PRAGMA busy_timeout=30000')
+            self._local.connection = connection
+        return connection
+
+    def _transaction(self):
+        connection = self._connection()
+        connection.execute('BEGIN IMMEDIATE')
+        return connection
+
+    def submit(self, function: str, config: Dict[str, Any], *args: Any) -> int:
+        """
+        Enqueue one evaluation.
+
+        Args:
+            function: Evaluation function as 'module:qualified_name'
+            config: Configuration to evaluate
+            *args: Further JSON-serializable positional arguments, e.g. the
+                budget of a multi-fidelity evaluation
+
+        Returns:
+            The job id
+        """
+        cursor = self._connection().execute(
+            'INSERT INTO jobs (function, payload, max_attempts) VALUES (?, ?, ?)',
+            (function, json.dumps([config, *args]), self.max_attempts)
+        )
+        return cursor.lastrowid
+
+    def lease(self, worker: str) -> Optional[Tuple[int, str, List[Any]]]:
+        """
+        Take the oldest pending job.
+
+        Args:
+            worker: Identifier of the leasing worker
+
+        Returns:
+            (job_id, function, arguments), where arguments starts with the
+            config, or None when nothing is pending
+        """
+        connection = self._transaction()
+        try:
+            self._requeue_expired(connection)
+            row = connection.execute(
+                "SELECT id, function, payload FROM jobs WHERE status = 'pending' "
+                'ORDER BY id LIMIT 1'
+            ).fetchone()
+            if row is not None:
+                connection.execute(
+                    "UPDATE jobs SET status = 'leased', worker = ?, lease_expires = ?, "
+                    'attempts = attempts + 1 WHERE id = ?',
+                    (worker, time.time() + self.lease_timeout, row[0])
+                )
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        if row is None:
+            return None
+        return row[0], row[1], json.loads(row[2])
+
+    def heartbeat(self, job_id: int, worker: str) -> bool:
+        """
+        Extend a lease.
+
+        Returns:
+            False if the worker no longer holds the lease
+        """
+        cursor = self._connection().execute(
+            "UPDATE jobs SET lease_expires = ? WHERE id = ? AND worker = ? AND status = 'leased'",
+            (time.time() + self.lease_timeout, job_id, worker)
+        )
+        return cursor.rowcount == 1
+
+    def complete(self, job_id: int, score: float):
+        """
+        Store the score of a job.
+
+        A late result from a worker whose lease expired is still accepted,
+        since the evaluation is just as valid.
+        """
+        self._connection().execute(
+            "UPDATE jobs SET status = 'done', result = ?, lease_expires = NULL "
+            "WHERE id = ? AND status != 'done'",
+            (float(score), job_id)
+        )
+
+    def fail(self, job_id: int, error: str):
+        """Record a failed attempt, requeueing the job while attempts remain."""
+        self._connection().execute(
+            "UPDATE jobs SET error = ?, lease_expires = NULL, worker = NULL, "
+            "status = CASE WHEN attempts < max_attempts THEN 'pending' ELSE 'failed' END "
+            "WHERE id = ? AND status = 'leased'",
+            (error, job_id)
+        )
+
+    def requeue_expired(self) -> int:
+        """
+        Return jobs whose lease expired to the pending state.
+
+        Returns:
+            Number of jobs requeued (or failed after max_attempts)
+        """
+        connection = self._transaction()
+        try:
+            count = self._requeue_expired(connection)
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        return count
+
+    def _requeue_expired(self, connection: sqlite3.Connection) -> int:
+        cursor = connection.execute(
+            "UPDATE jobs SET worker = NULL, lease_expires = NULL, "
+            "error = COALESCE(error, 'lease expired'), "
+            "status = CASE WHEN attempts < max_attempts THEN 'pending' ELSE 'failed' END "
+            "WHERE status = 'leased' AND lease_expires < ?",
+            (time.time(),)
+        )
+        return cursor.rowcount
+
+    def finished(self, job_ids: List[int]) -> List[Tuple[int, str, Optional[float], Optional[str]]]:
+        """
+        Look up which of the given jobs are done or failed.
+
+        Returns:
+            (job_id, status, result, error) for every finished job
+        """
+        rows = []
+        for start in range(0, len(job_ids), 500):
+            chunk = job_ids[start:start + 500]
+            rows.extend(self._connection().execute(
+                f"SELECT id, status, result, error FROM jobs WHERE id IN "
+                f"({','.join('?' * len(chunk))}) AND status IN ('done', 'failed')",
+                chunk
+            ))
+        return rows
+
+    def started(self, job_ids: List[int]) -> List[int]:
+        """Which of the given jobs have been leased by a worker at least once."""
+        rows = []
+        for start in range(0, len(job_ids), 500):
+            chunk = job_ids[start:start + 500]
+            rows.extend(job_id for job_id, in self._connection().execute(
+                f"SELECT id FROM jobs WHERE id IN "
+                f"({','.join('?' * len(chunk))}) AND attempts > 0",
+                chunk
+            ))
+        return rows
+
+    def cancel(self, job_ids: List[int]):
+        """Drop jobs that have not been leased yet."""
+        for start in range(0, len(job_ids), 500):
+            chunk = job_ids[start:start + 500]
+            self._connection().execute(
+                f"UPDATE jobs SET status = 'cancelled' WHERE id IN "
+                f"({','.join('?' * len(chunk))}) AND status = 'pending'",
+                chunk
+            )
+
+    def counts(self) -> Dict[str, int]:
+        """Number of jobs in each status."""
+        return dict(self._connection().execute(
+            'SELECT status, COUNT(*) FROM jobs GROUP BY status'
+        ))
+
+
+def function_name(fn: Callable) -> str:
+    """'module:qualified_name' reference that workers can import."""
+    module = fn.__module__
+    if module == '__main__':
+        # Workers cannot import the coordinator's __main__; use its file name
+        main_file = getattr(sys.modules['__main__'], '__file__', None)
+        if main_file is None:
+            raise ValueError("Evaluation functions defined interactively cannot be distributed")
+        module = os.path.splitext(os.path.basename(main_file))[0]
+    if '<locals>' in fn.__qualname__:
+        raise ValueError(f"{fn.__qualname__} is not importable; define it at module level")
+    return f"{module}:{fn.__qualname__}"
+
+
+def resolve_function(name: str) -> Callable:
+    """Import a function from a 'module:qualified_name' reference."""
+    module_name, _, qualname = name.partition(':')
+    target = importlib.import_module(module_name)
+    for attribute in qualname.split('.'):
+        target = getattr(target, attribute)
+    return target
+
+
+class QueueExecutor(Executor):
+    """
+    Executor that publishes evaluations to a JobQueue.
+
+    submit(fn, config, *args) enqueues config (and any JSON-serializable
+    extra arguments, such as a budget) for fn, which must be importable by
+    the workers. A background thread polls for leased and finished jobs,
+    marks their futures running or resolves them, drops the jobs of futures
+    cancelled while still pending, and requeues jobs whose worker stopped
+    heartbeating.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        lease_timeout: float = 60.0,
+        max_attempts: int = 3,
+        poll_interval: float = 0.05
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            path: SQLite queue file shared with the workers
+            lease_timeout: Seconds without heartbeat before a job is requeued
+            max_attempts: Leases per job before its future fails
+            poll_interval: Seconds between result polls
+        """
+        self.queue = JobQueue(path, lease_timeout, max_attempts)
+        self.poll_interval = poll_interval
+        self._futures: Dict[int, Future] = {}
+        # Jobs no worker has leased yet
+        self._pending: Set[int] = set()
+        self._lock = threading.Lock()
+        self._shutdown = threading.Event()
+        self._poller = threading.Thread(target=self._poll, name='QueueExecutor', daemon=True)
+        self._poller.start()
+
+    def submit(self, fn: Callable, *args: Any, **kwargs: Any) -> Future:
+        if self._shutdown.is_set():
+            raise RuntimeError('cannot submit after shutdown')
+        if not args or kwargs:
+            raise TypeError('QueueExecutor.submit expects fn(config, *args)')
+        future = Future()
+        job_id = self.queue.submit(function_name(fn), *args)
+        with self._lock:
+            self._futures[job_id] = future
+            self._pending.add(job_id)
+        return future
+
+    def _poll(self):
+        last_requeue = 0.0
+        while not self._shutdown.is_set() or self._futures:
+            with self._lock:
+                job_ids = list(self._futures)
+            if job_ids:
+                self._mark_started()
+                for job_id, status, result, error in self.queue.finished(job_ids):
+                    with self._lock:
+                        future = self._futures.pop(job_id)
+                    if future.cancelled():
+                        continue
+                    if status == 'done':
+                        future.set_result(result)
+                    else:
+                        future.set_exception(RuntimeError(f"Job {job_id} failed: {error}"))
+                now = time.monotonic()
+                if now - last_requeue >= self.queue.lease_timeout / 4:
+                    # Workers also requeue when leasing, but with every worker
+                    # gone only the coordinator can notice
+                    self.queue.requeue_expired()
+                    last_requeue = now
+            self._shutdown.wait(self.poll_interval)
+
+    def _mark_started(self):
+        """Mark the futures of newly leased jobs running and drop cancelled jobs."""
+        with self._lock:
+            pending = list(self._pending)
+        if not pending:
+            return
+        cancelled = []
+        for job_id in self.queue.started(pending):
+            with self._lock:
+                self._pending.discard(job_id)
+                future = self._futures[job_id]
+            future.set_running_or_notify_cancel()
+        with self._lock:
+            for job_id in list(self._pending):
+                if self._futures[job_id].cancelled():
+                    self._pending.discard(job_id)
+                    del self._futures[job_id]
+                    cancelled.append(job_id)
+        self.queue.cancel(cancelled)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        if cancel_futures:
+            with self._lock:
+                futures = dict(self._futures)
+                self._futures.clear()
+                self._pending.clear()
+            self.queue.cancel(list(futures))
+            for future in futures.values():
+                if not future.cancel() and not future.done():
+                    future.set_exception(RuntimeError('cancelled at shutdown'))
+        self._shutdown.set()
+        if wait:
+            self._poller.join()
+
+
+def run_worker(
+    path: str,
+    evaluation_fn: Optional[Callable[..., float]] = None,
+    worker_id: Optional[str] = None,
+    lease_timeout: float = 60.0,
+    poll_interval: float = 0.5,
+    max_jobs: Optional[int] = None,
+    idle_timeout: Optional[float] = None
+) -> int:
+    """
+    Evaluate jobs from a queue until stopped.
+
+    Args:
+        path: SQLite queue file
+        evaluation_fn: Function to run for every job; by default the
+            function recorded with each job is imported
+        worker_id: Identifier used for leases (defaults to host, pid, uuid)
+        lease_timeout: Lease duration; a heartbeat renews it every third
+        poll_interval: Seconds to sleep when no job is pending
+        max_jobs: Stop after this many jobs
+        idle_timeout: Stop after this many seconds without a job
+
+    Returns:
+        Number of jobs processed
+    """
+    queue = JobQueue(path, lease_timeout)
+    worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+    functions: Dict[str, Callable] = {}
+    processed = 0
+    idle_since = time.monotonic()
+
+    while max_jobs is None or processed < max_jobs:
+        job = queue.lease(worker_id)
+        if job is None:
+            if idle_timeout is not None and time.monotonic() - idle_since >= idle_timeout:
+                break
+            time.sleep(poll_interval)
+            continue
+
+        job_id, function, arguments = job
+        done = threading.Event()
+
+        def heartbeat():
+            while not done.wait(lease_timeout / 3):
+                if not queue.heartbeat(job_id, worker_id):
+                    return
+
+        beat = threading.Thread(target=heartbeat, daemon=True)
+        beat.start()
+        try:
+            fn = evaluation_fn
+            if fn is None:
+                if function not in functions:
+                    functions[function] = resolve_function(function)
+                fn = functions[function]
+            score = fn(*arguments)
+        except Exception as exc:
+            queue.fail(job_id, f"{type(exc).__name__}: {exc}")
+        else:
+            queue.complete(job_id, score)
+        finally:
+            done.set()
+            beat.join()
+        processed += 1
+        idle_since = time.monotonic()
+    return processed
+
+
+def _worker_process(path: str, function: Optional[str], options: Dict[str, Any]):
+    evaluation_fn = resolve_function(function) if function else None
+    run_worker(path, evaluation_fn, **options)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Distributed evaluation worker')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    worker = subparsers.add_parser('worker', help='evaluate jobs from a queue')
+    worker.add_argument('queue', help='SQLite queue file')
+    worker.add_argument('--fn', help="evaluation function as 'module:name' "
+                                     "(defaults to the one recorded with each job)")
+    worker.add_argument('--processes', type=int, default=1)
+    worker.add_argument('--lease-timeout', type=float, default=60.0)
+    worker.add_argument('--poll-interval', type=float, default=0.5)
+    worker.add_argument('--idle-timeout', type=float)
+
+    status = subparsers.add_parser('status', help='print job counts')
+    status.add_argument('queue', help='SQLite queue file')
+
+    args = parser.parse_args(argv)
+    if args.command == 'status':
+        for state, count in sorted(JobQueue(args.queue).counts().items()):
+            print(f"{state:<10}{count:>8}")
+        return 0
+
+    sys.path.insert(0, os.getcwd())
+    options = {
+        'lease_timeout': args.lease_timeout,
+        'poll_interval': args.poll_interval,
+        'idle_timeout': args.idle_timeout,
+    }
+    processes = [
+        multiprocessing.Process(target=_worker_process, args=(args.queue, args.fn, options))
+        for _ in range(args.processes)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
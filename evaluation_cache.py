@@ -0,0 +1,140 @@
+"""
+Persistent Evaluation Cache
+
+This module provides an on-disk cache of evaluation scores so that a
+configuration that was already evaluated - in this run or in an earlier one -
+is never passed to the evaluation function again.
+"""
+
+import hashlib
+import json
+import sqlite3
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+def config_digest(config: Dict[str, Any]) -> str:
+    """
+    Compute a stable digest of a configuration.
+
+    Unlike the built-in hash(), the digest does not depend on PYTHONHASHSEED,
+    so it is identical across processes, machines and runs.
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        Hex digest of the canonical JSON form of the configuration
+    """
+    canonical = json.dumps(config, sort_keys=True, separators=(',', ':'), default=repr)
+    return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class EvaluationCache:
+    """SQLite-backed mapping from configuration digest to score."""
+
+    def __init__(self, path: str = ':memory:'):
+        """
+        Open (or create) an evaluation cache.
+
+        Args:
+            path: SQLite database file, or ':memory:' for a process-local cache
+        """
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._connection = sqlite3.connect(path)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS scores ('
+            'digest TEXT PRIMARY KEY, config TEXT NOT NULL, score REAL NOT NULL)'
+        )
+        self._connection.commit()
+
+    def get(self, config: Dict[str, Any]) -> Optional[float]:
+        """
+        Look up the cached score of a configuration.
+
+        Args:
+            config: Configuration dictionary
+
+        Returns:
+            The cached score, or None if the configuration was never stored
+        """
+        return self.get_many([config])[0]
+
+    def get_many(self, configs: List[Dict[str, Any]]) -> List[Optional[float]]:
+        """
+        Look up cached scores for several configurations at once.
+
+        Args:
+            configs: Configuration dictionaries
+
+        Returns:
+            Cached scores (None for misses) in the same order as configs
+        """
+        digests = [config_digest(config) for config in configs]
+        found = {}
+        # Stay well below SQLite's host parameter limit
+        for start in range(0, len(digests), 500):
+            chunk = digests[start:start + 500]
+            rows = self._connection.execute(
+                f"SELECT digest, score FROM scores WHERE digest IN ({','.join('?' * len(chunk))})",
+                chunk
+            )
+            found.update(rows)
+
+        scores = [found.get(digest) for digest in digests]
+        hits = sum(score is not None for score in scores)
+        self.hits += hits
+        self.misses += len(scores) - hits
+        return scores
+
+    def put(self, config: Dict[str, Any], score: float):
+        """
+        Store the score of a configuration.
+
+        Args:
+            config: Configuration dictionary
+            score: Its evaluation score
+        """
+        self.put_many([(config, score)])
+
+    def put_many(self, results: Iterable[Tuple[Dict[str, Any], float]]):
+        """
+        Store several scores in a single transaction.
+
+        Args:
+            results: (config, score) pairs
+        """
+        rows = [
+            (config_digest(config), json.dumps(config, sort_keys=True, default=repr), float(score))
+            for config, score in results
+        ]
+        with self._connection:
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO scores (digest, config, score) VALUES (?, ?, ?)',
+                rows
+            )
+
+    def __contains__(self, config: Dict[str, Any]) -> bool:
+        row = self._connection.execute(
+            'SELECT 1 FROM scores WHERE digest = ?', (config_digest(config),)
+        ).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        return self._connection.execute('SELECT COUNT(*) FROM scores').fetchone()[0]
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get cache hit/miss statistics."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'size': len(self)
+        }
+
+    def close(self):
+        """Close the underlying database connection."""
+        self._connection.close()
@@ -0,0 +1,69 @@
+"""
+Search Event Log
+
+Append-only JSON Lines log of the events produced by
+MultiAgentSearchCoordinator.iter_search. Every line is one event, such as an
+evaluation with its agent, fingerprint and score, or an iteration summary
+with timings. The file is flushed after each iteration, so dashboards can
+tail it while the search runs, and read_events() streams it back without
+loading the whole file.
+"""
+
+import json
+from typing import Any, Dict, Iterator, Optional
+
+
+class EventLog:
+    """Appends search events to a JSON Lines file."""
+
+    def __init__(self, path: str):
+        """
+        Open a log for appending.
+
+        Args:
+            path: File to append events to (created if missing)
+        """
+        self.path = path
+        self._file = open(path, 'a')
+        self.num_events = 0
+
+    def write(self, event: Dict[str, Any]):
+        """Append one event, flushing at iteration boundaries."""
+        self._file.write(json.dumps(event) + '\n')
+        self.num_events += 1
+        if event['event'] in ('iteration', 'end'):
+            self._file.flush()
+
+    def close(self):
+        """Flush and close the file."""
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_events(path: str, event: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Stream events back from a log.
+
+    A partially written last line (from a search that is still running or
+    was killed mid-write) is skipped.
+
+    Args:
+        path: Log file
+        event: Only yield events of this type
+
+    Yields:
+        Event dictionaries in the order they were written
+    """
+    with open(path) as f:
+        for line in f:
+            if not line.endswith('\n'):
+                break
+            record = json.loads(line)
+            if event is None or record['event'] == event:
+                yield record
@@ -10,54 +10,95 @@ from multi_agent_search import (
 import random
 
 
+# Define search space for neural network
+NEURAL_NETWORK_SEARCH_SPACE = {
+    'num_layers': [2, 3, 4, 5],
+    'layer_size': [64, 128, 256],
+    'dropout': [0.0, 0.1, 0.2, 0.3],
+    'learning_rate': [0.001, 0.01, 0.1],
+    'optimizer': ['adam', 'sgd', 'rmsprop']
+}
+
+
+def evaluate_nn_config(config):
+    """Simulate neural network training performance"""
+    score = 0.6
+    
+    # Deeper networks help
+    score += config['num_layers'] * 0.03
+    
+    # Medium layer size is best
+    if config['layer_size'] == 128:
+        score += 0.1
+    elif config['layer_size'] == 256:
+        score += 0.05
+    
+    # Some dropout helps
+    if 0.1 <= config['dropout'] <= 0.2:
+        score += 0.08
+    
+    # Learning rate preference
+    if config['learning_rate'] == 0.01:
+        score += 0.1
+    
+    # Optimizer preference
+    if config['optimizer'] == 'adam':
+        score += 0.08
+    
+    # Add noise
+    score += random.uniform(-0.03, 0.03)
+    
+    return max(0, min(1, score))
+
+
+# Define search space for preprocessing pipeline
+PIPELINE_SEARCH_SPACE = {
+    'scaling': ['standard', 'minmax', 'robust', 'none'],
+    'feature_selection': ['variance', 'correlation', 'mutual_info', 'none'],
+    'dimensionality_reduction': ['pca', 'ica', 'lda', 'none'],
+    'n_components': [5, 10, 20, 30],
+    'handle_outliers': ['clip', 'remove', 'keep']
+}
+
+
+def evaluate_pipeline(config):
+    """Simulate preprocessing pipeline performance"""
+    score = 0.5
+    
+    # Scaling helps
+    if config['scaling'] in ['standard', 'robust']:
+        score += 0.12
+    
+    # Feature selection helps
+    if config['feature_selection'] != 'none':
+        score += 0.1
+    
+    # Dimensionality reduction can help
+    if config['dimensionality_reduction'] in ['pca', 'ica']:
+        score += 0.08
+        # Optimal number of components
+        if config['n_components'] in [10, 20]:
+            score += 0.05
+    
+    # Outlier handling
+    if config['handle_outliers'] in ['clip', 'remove']:
+        score += 0.08
+    
+    # Add noise
+    score += random.uniform(-0.04, 0.04)
+    
+    return max(0, min(1, score))
+
+
 def example_1_neural_network_search():
     """Example 1: Neural Network Hyperparameter Search"""
     print("="*70)
     print("Example 1: Neural Network Hyperparameter Search")
     print("="*70 + "\n")
     
-    # Define search space for neural network
-    search_space = {
-        'num_layers': [2, 3, 4, 5],
-        'layer_size': [64, 128, 256],
-        'dropout': [0.0, 0.1, 0.2, 0.3],
-        'learning_rate': [0.001, 0.01, 0.1],
-        'optimizer': ['adam', 'sgd', 'rmsprop']
-    }
-    
-    def evaluate_nn_config(config):
-        """Simulate neural network training performance"""
-        score = 0.6
-        
-        # Deeper networks help
-        score += config['num_layers'] * 0.03
-        
-        # Medium layer size is best
-        if config['layer_size'] == 128:
-            score += 0.1
-        elif config['layer_size'] == 256:
-            score += 0.05
-        
-        # Some dropout helps
-        if 0.1 <= config['dropout'] <= 0.2:
-            score += 0.08
-        
-        # Learning rate preference
-        if config['learning_rate'] == 0.01:
-            score += 0.1
-        
-        # Optimizer preference
-        if config['optimizer'] == 'adam':
-            score += 0.08
-        
-        # Add noise
-        score += random.uniform(-0.03, 0.03)
-        
-        return max(0, min(1, score))
-    
     # Run search
     coordinator = MultiAgentSearchCoordinator(
-        search_space=search_space,
+        search_space=NEURAL_NETWORK_SEARCH_SPACE,
         evaluation_fn=evaluate_nn_config,
         num_agents=6
     )
@@ -80,46 +121,9 @@ def example_2_data_preprocessing_pipeline():
     print("Example 2: Data Preprocessing Pipeline Optimization")
     print("="*70 + "\n")
     
-    # Define search space for preprocessing pipeline
-    search_space = {
-        'scaling': ['standard', 'minmax', 'robust', 'none'],
-        'feature_selection': ['variance', 'correlation', 'mutual_info', 'none'],
-        'dimensionality_reduction': ['pca', 'ica', 'lda', 'none'],
-        'n_components': [5, 10, 20, 30],
-        'handle_outliers': ['clip', 'remove', 'keep']
-    }
-    
-    def evaluate_pipeline(config):
-        """Simulate preprocessing pipeline performance"""
-        score = 0.5
-        
-        # Scaling helps
-        if config['scaling'] in ['standard', 'robust']:
-            score += 0.12
-        
-        # Feature selection helps
-        if config['feature_selection'] != 'none':
-            score += 0.1
-        
-        # Dimensionality reduction can help
-        if config['dimensionality_reduction'] in ['pca', 'ica']:
-            score += 0.08
-            # Optimal number of components
-            if config['n_components'] in [10, 20]:
-                score += 0.05
-        
-        # Outlier handling
-        if config['handle_outliers'] in ['clip', 'remove']:
-            score += 0.08
-        
-        # Add noise
-        score += random.uniform(-0.04, 0.04)
-        
-        return max(0, min(1, score))
-    
     # Run search with mixed agents
     coordinator = MultiAgentSearchCoordinator(
-        search_space=search_space,
+        search_space=PIPELINE_SEARCH_SPACE,
         evaluation_fn=evaluate_pipeline,
         num_agents=4,
         agent_types=['random', 'greedy', 'greedy', 'greedy']
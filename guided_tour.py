@@ -0,0 +1,278 @@
+"""
+Guided Tour
+
+A projection pursuit optimizer in the style of tourr's guided tour. The
+tour keeps a current projection basis and repeatedly draws a batch of
+candidate bases near it (search_better). All candidates of a round are
+scored in one call of a vectorized ProjectionIndex, and the tour moves to
+the best one. The neighbourhood size alpha shrinks under a cooling schedule.
+With a positive temperature, worse candidates are sometimes accepted as in
+tourr's search_better_random annealing.
+
+The 'little' and 'grand' paths are the unguided tours: the little tour
+walks through the axis-parallel planes, and the grand tour samples random
+bases. Both keep the best projection they pass.
+"""
+
+import math
+from itertools import combinations
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from projection_indices import orthonormalize, random_bases
+
+
+TOUR_PATHS = ('guided', 'little', 'grand')
+COOLING_SCHEDULES = ('linear', 'exponential', 'geometric')
+
+
+def cooling_factor(schedule: str, step: int, num_steps: int, rate: float = 0.9) -> float:
+    """
+    Fraction of the initial step size left after step rounds.
+
+    Args:
+        schedule: 'linear' (to zero over num_steps), 'exponential' (to e^-3
+            over num_steps) or 'geometric' (rate per round, as tourr's cooling)
+        step: Rounds completed
+        num_steps: Planned number of rounds
+        rate: Per-round factor of the geometric schedule
+
+    Returns:
+        Factor in (0, 1]
+    """
+    if schedule == 'linear':
+        return max(1 - step / num_steps, 1 / num_steps)
+    if schedule == 'exponential':
+        return math.exp(-3 * step / num_steps)
+    if schedule == 'geometric':
+        return rate ** step
+    raise ValueError(f"Unknown cooling schedule '{schedule}', expected one of {COOLING_SCHEDULES}")
+
+
+def bases_nearby(basis: np.ndarray, alpha: float, k: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Draw k bases near basis, as tourr's basis_nearby.
+
+    Args:
+        basis: Current basis of shape (p, d)
+        alpha: Step size in [0, 1]; 0 stays put, 1 is a random basis
+        k: Number of candidates
+        rng: NumPy generator
+
+    Returns:
+        Array of shape (k, p, d) with orthonormal columns
+    """
+    p, d = basis.shape
+    return orthonormalize((1 - alpha) * basis + alpha * random_bases(p, k, rng, d))
+
+
+def subspace_overlap(basis: np.ndarray, target: np.ndarray) -> float:
+    """
+    How much of target's plane basis recovers.
+
+    Args:
+        basis: Orthonormal basis of shape (p, d)
+        target: Orthonormal basis of shape (p, t)
+
+    Returns:
+        Mean squared cosine of the principal angles, 1.0 when the planes
+        coincide and 0.0 when they are orthogonal
+    """
+    return float(np.sum((target.T @ basis) ** 2) / min(basis.shape[1], target.shape[1]))
+
+
+class TourResult:
+    """Outcome of one tour."""
+
+    __slots__ = ('basis', 'index_value', 'trace', 'num_evaluations', 'num_steps', 'converged')
+
+    def __init__(self, basis: np.ndarray, index_value: float, trace: List[float],
+                 num_evaluations: int, num_steps: int, converged: bool):
+        """
+        Args:
+            basis: Best basis found, shape (p, d)
+            index_value: Index value of basis
+            trace: Index value of the current basis after every round
+            num_evaluations: Bases scored, including the start
+            num_steps: Rounds run
+            converged: Whether the tour stopped on its convergence criteria
+                rather than on max_steps
+        """
+        self.basis = basis
+        self.index_value = index_value
+        self.trace = trace
+        self.num_evaluations = num_evaluations
+        self.num_steps = num_steps
+        self.converged = converged
+
+    def __repr__(self):
+        return (f"TourResult(index_value={self.index_value:.4f}, "
+                f"num_evaluations={self.num_evaluations}, converged={self.converged})")
+
+
+class GuidedTour:
+    """Projection pursuit optimizer over batches of candidate bases."""
+
+    def __init__(
+        self,
+        index: Callable[[np.ndarray], np.ndarray],
+        num_variables: Optional[int] = None,
+        dimension: int = 2,
+        tour_path: str = 'guided',
+        cooling: str = 'geometric',
+        alpha: float = 0.5,
+        max_tries: int = 25,
+        batch_size: int = 16,
+        convergence_threshold: float = 1e-4,
+        max_steps: int = 100,
+        temperature: float = 0.0,
+        rate: float = 0.9,
+        rng: Optional[np.random.Generator] = None
+    ):
+        """
+        Configure a tour.
+
+        Args:
+            index: Vectorized index taking a (k, p, d) stack of bases, e.g. a
+                ProjectionIndex
+            num_variables: Data dimension p (read from a ProjectionIndex if omitted)
+            dimension: Projection dimension d
+            tour_path: 'guided', 'little' or 'grand'
+            cooling: Cooling schedule of the guided tour's step size and temperature
+            alpha: Initial step size of the guided tour
+            max_tries: Consecutive rounds without improvement before the
+                guided or grand tour gives up
+            batch_size: Candidate bases scored per round
+            convergence_threshold: The guided tour stops once an accepted
+                move improves the index by less than this
+            max_steps: Upper bound on rounds, i.e. the tour length
+            temperature: Initial annealing temperature; 0 only accepts improvements
+            rate: Per-round factor of the geometric schedule
+            rng: NumPy generator (a fresh default one if omitted)
+        """
+        if tour_path not in TOUR_PATHS:
+            raise ValueError(f"Unknown tour path '{tour_path}', expected one of {TOUR_PATHS}")
+        if cooling not in COOLING_SCHEDULES:
+            raise ValueError(
+                f"Unknown cooling schedule '{cooling}', expected one of {COOLING_SCHEDULES}"
+            )
+        if num_variables is None:
+            num_variables = getattr(index, 'num_variables', None)
+            if num_variables is None:
+                raise ValueError("num_variables is required for a plain index function")
+        self.index = index
+        self.num_variables = num_variables
+        self.dimension = dimension
+        self.tour_path = tour_path
+        self.cooling = cooling
+        self.alpha = alpha
+        self.max_tries = max_tries
+        self.batch_size = batch_size
+        self.convergence_threshold = convergence_threshold
+        self.max_steps = max_steps
+        self.temperature = temperature
+        self.rate = rate
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+    def run(self, start: Optional[np.ndarray] = None) -> TourResult:
+        """
+        Run the tour.
+
+        Args:
+            start: Initial basis of shape (p, d) (random if omitted)
+
+        Returns:
+            The best basis found and how the tour got there
+        """
+        if self.tour_path == 'little':
+            return self._little()
+        if start is None:
+            start = random_bases(self.num_variables, 1, self.rng, self.dimension)[0]
+        else:
+            start = orthonormalize(start)
+        if self.tour_path == 'grand':
+            return self._grand(start)
+        return self._guided(start)
+
+    def _guided(self, current: np.ndarray) -> TourResult:
+        """search_better rounds with a cooling step size and optional annealing."""
+        value = float(self.index(current[None])[0])
+        best, best_value = current, value
+        trace = [value]
+        evaluations = 1
+        failures = 0
+        converged = False
+        step = 0
+        while step < self.max_steps:
+            factor = cooling_factor(self.cooling, step, self.max_steps, self.rate)
+            candidates = bases_nearby(current, self.alpha * factor, self.batch_size, self.rng)
+            values = self.index(candidates)
+            evaluations += len(candidates)
+            step += 1
+
+            position = int(np.argmax(values))
+            gain = float(values[position]) - value
+            if gain > 0:
+                current, value = candidates[position], float(values[position])
+                failures = 0
+                if value > best_value:
+                    best, best_value = current, value
+                if gain < self.convergence_threshold:
+                    converged = True
+            else:
+                failures += 1
+                temperature = self.temperature * factor
+                if temperature > 0 and self.rng.random() < math.exp(gain / temperature):
+                    current, value = candidates[position], float(values[position])
+            trace.append(value)
+            if converged or failures >= self.max_tries:
+                converged = True
+                break
+        return TourResult(best, best_value, trace, evaluations, step, converged)
+
+    def _grand(self, start: np.ndarray) -> TourResult:
+        """Random bases, keeping the best, until max_tries rounds bring nothing better."""
+        best = start
+        best_value = float(self.index(start[None])[0])
+        trace = [best_value]
+        evaluations = 1
+        failures = 0
+        step = 0
+        while step < self.max_steps and failures < self.max_tries:
+            candidates = random_bases(self.num_variables, self.batch_size, self.rng, self.dimension)
+            values = self.index(candidates)
+            evaluations += len(candidates)
+            step += 1
+            position = int(np.argmax(values))
+            if values[position] > best_value:
+                best, best_value = candidates[position], float(values[position])
+                failures = 0
+            else:
+                failures += 1
+            trace.append(best_value)
+        return TourResult(best, best_value, trace, evaluations, step, failures >= self.max_tries)
+
+    def _little(self) -> TourResult:
+        """Walk once through the axis-parallel frames, interpolating between them."""
+        identity = np.eye(self.num_variables)
+        frames = [identity[:, list(columns)]
+                  for columns in combinations(range(self.num_variables), self.dimension)]
+        best = frames[0]
+        best_value = float(self.index(best[None])[0])
+        trace = [best_value]
+        evaluations = 1
+        step = 0
+        weights = np.linspace(0, 1, self.batch_size + 1)[1:, None, None]
+        for origin, destination in zip(frames, frames[1:]):
+            if step >= self.max_steps:
+                break
+            path = orthonormalize((1 - weights) * origin + weights * destination)
+            values = self.index(path)
+            evaluations += len(path)
+            step += 1
+            position = int(np.argmax(values))
+            if values[position] > best_value:
+                best, best_value = path[position], float(values[position])
+            trace.append(best_value)
+        return TourResult(best, best_value, trace, evaluations, step, step == len(frames) - 1)
@@ -0,0 +1,137 @@
+"""
+Search Instrumentation
+
+Per-phase timers, counters and hooks for the search hot path. The coordinator
+only touches a profiler when one is configured, so leaving instrumentation
+off costs a single None check per phase.
+"""
+
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List
+
+
+PHASES = ('propose', 'fingerprint', 'evaluate', 'update', 'communicate')
+
+
+class SearchProfiler:
+    """Accumulates wall-clock time and call counts for each search phase."""
+
+    def __init__(self):
+        self.totals = defaultdict(float)
+        self.calls = defaultdict(int)
+        self.counters = defaultdict(int)
+        self._before_hooks = defaultdict(list)
+        self._after_hooks = defaultdict(list)
+
+    def add_hook(self, phase: str, callback: Callable, when: str = 'after'):
+        """
+        Register a callback around a phase.
+
+        'before' callbacks are called as callback(phase, context); 'after'
+        callbacks as callback(phase, elapsed_seconds, context). The context
+        dictionary carries phase-specific details such as the agent or the
+        number of configurations evaluated.
+
+        Args:
+            phase: One of PHASES
+            callback: Function to call
+            when: 'before' or 'after'
+        """
+        if phase not in PHASES:
+            raise ValueError(f"Unknown phase '{phase}', expected one of {PHASES}")
+        if when == 'before':
+            self._before_hooks[phase].append(callback)
+        elif when == 'after':
+            self._after_hooks[phase].append(callback)
+        else:
+            raise ValueError("when must be 'before' or 'after'")
+
+    def start(self, phase: str, **context: Any) -> float:
+        """
+        Mark the start of a phase.
+
+        Returns:
+            Start timestamp to pass to stop()
+        """
+        for callback in self._before_hooks.get(phase, ()):
+            callback(phase, context)
+        return time.perf_counter()
+
+    def stop(self, phase: str, started: float, **context: Any):
+        """
+        Mark the end of a phase started with start().
+
+        Args:
+            phase: Phase name
+            started: Value returned by start()
+            context: Details forwarded to 'after' hooks
+        """
+        elapsed = time.perf_counter() - started
+        self.totals[phase] += elapsed
+        self.calls[phase] += 1
+        for callback in self._after_hooks.get(phase, ()):
+            callback(phase, elapsed, context)
+
+    def count(self, name: str, amount: int = 1):
+        """Increment a named counter."""
+        self.counters[name] += amount
+
+    def timed(self, phase: str, fn: Callable) -> Callable:
+        """
+        Wrap a function so that every call is accounted to a phase.
+
+        Hooks of the phase run around every call, including hooks added after
+        wrapping. Their context holds the call's positional args, and for
+        'after' hooks also its result.
+        """
+        totals = self.totals
+        calls = self.calls
+        before = self._before_hooks[phase]
+        after = self._after_hooks[phase]
+
+        def wrapper(*args, **kwargs):
+            for callback in before:
+                callback(phase, {'args': args})
+            started = time.perf_counter()
+            try:
+                result = fn(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                totals[phase] += elapsed
+                calls[phase] += 1
+            for callback in after:
+                callback(phase, elapsed, {'args': args, 'result': result})
+            return result
+
+        return wrapper
+
+    def summary(self) -> Dict[str, Any]:
+        """Per-phase totals, call counts and means, plus counters."""
+        phases = {}
+        for phase in PHASES:
+            if self.calls[phase]:
+                phases[phase] = {
+                    'calls': self.calls[phase],
+                    'total': self.totals[phase],
+                    'mean': self.totals[phase] / self.calls[phase],
+                }
+        return {'phases': phases, 'counters': dict(self.counters)}
+
+    def reset(self):
+        """Clear all timings and counters (hooks are kept)."""
+        self.totals.clear()
+        self.calls.clear()
+        self.counters.clear()
+
+
+def format_profile(summary: Dict[str, Any]) -> List[str]:
+    """Render a profiler summary as printable lines."""
+    lines = []
+    total = sum(stats['total'] for phase, stats in summary['phases'].items()
+                if phase != 'fingerprint')
+    for phase, stats in summary['phases'].items():
+        share = stats['total'] / total * 100 if total else 0.0
+        lines.append(f"{phase:<12} {stats['calls']:>8} calls {stats['total']:>10.4f}s "
+                     f"{stats['mean'] * 1e6:>10.1f}us/call {share:>6.1f}%")
+    return lines
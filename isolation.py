@@ -0,0 +1,200 @@
+"""
+Isolated Evaluation
+
+A process pool for evaluation functions that may hang or crash. Every task
+runs in a worker process under an optional deadline; a worker that overruns
+it is killed and replaced, so a runaway evaluation (e.g. a tour that never
+converges) frees its core instead of blocking the search. Unlike
+concurrent.futures.ProcessPoolExecutor, a worker dying only fails the task
+it was running.
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, Future
+from multiprocessing.connection import wait as wait_connections
+from typing import Any, Callable, Optional
+
+
+class EvaluationTimeout(Exception):
+    """Raised when an evaluation exceeds its time limit."""
+
+
+class WorkerCrashed(Exception):
+    """Raised when the process running an evaluation dies."""
+
+
+def _worker_main(connection):
+    """Run tasks received over connection until told to stop."""
+    while True:
+        try:
+            task = connection.recv()
+        except EOFError:
+            return
+        if task is None:
+            return
+        fn, args, kwargs = task
+        try:
+            result = ('ok', fn(*args, **kwargs))
+        except BaseException as exc:
+            result = ('error', exc)
+        try:
+            connection.send(result)
+        except Exception as exc:
+            # The result or exception could not be pickled
+            connection.send(('error', RuntimeError(f"Unpicklable evaluation result: {exc!r}")))
+
+
+class _Worker:
+    """One worker process and the task it is running."""
+
+    def __init__(self, context):
+        self.connection, child = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child,), daemon=True)
+        self.process.start()
+        child.close()
+        self.future = None
+        self.deadline = None
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+    def stop(self):
+        try:
+            self.connection.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join()
+        self.connection.close()
+
+
+class IsolatedProcessExecutor(Executor):
+    """Process pool that kills and replaces workers running past a deadline."""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+        mp_context=None
+    ):
+        """
+        Start the pool.
+
+        Args:
+            max_workers: Number of worker processes (defaults to the CPU count)
+            timeout: Seconds a task may run before its worker is killed and
+                its future fails with EvaluationTimeout (None for no limit)
+            mp_context: multiprocessing context used to start workers
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self.num_timeouts = 0
+        self.num_crashes = 0
+        self._context = mp_context or multiprocessing.get_context()
+        self._queue = deque()
+        self._lock = threading.Lock()
+        self._wake_reader, self._wake_writer = self._context.Pipe(duplex=False)
+        self._shutdown = False
+        self._workers = [_Worker(self._context) for _ in range(self.max_workers)]
+        self._manager = threading.Thread(target=self._manage, daemon=True)
+        self._manager.start()
+
+    def submit(self, fn: Callable, *args: Any, **kwargs: Any) -> Future:
+        """Schedule fn(*args, **kwargs) on a worker process."""
+        future = Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            self._queue.append((future, fn, args, kwargs))
+            self._wake_writer.send(None)
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        """Stop the pool once queued and running tasks have finished or timed out."""
+        with self._lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            if cancel_futures:
+                while self._queue:
+                    self._queue.popleft()[0].cancel()
+            self._wake_writer.send(None)
+        if wait:
+            self._manager.join()
+
+    def _manage(self):
+        """Hand out tasks, collect results and enforce deadlines."""
+        while True:
+            with self._lock:
+                stopping = self._shutdown
+                for worker in self._workers:
+                    # Skip over cancelled tasks until one is actually running
+                    while worker.future is None and self._queue:
+                        self._start(worker, *self._queue.popleft())
+            busy = [worker for worker in self._workers if worker.future is not None]
+            if stopping and not busy and not self._queue:
+                break
+
+            now = time.monotonic()
+            deadlines = [worker.deadline for worker in busy if worker.deadline is not None]
+            wait_time = max(min(deadlines) - now, 0) if deadlines else None
+            ready = wait_connections(
+                [worker.connection for worker in busy] + [self._wake_reader], wait_time
+            )
+            if self._wake_reader in ready:
+                while self._wake_reader.poll():
+                    self._wake_reader.recv()
+
+            now = time.monotonic()
+            for position, worker in enumerate(self._workers):
+                if worker.future is None:
+                    continue
+                if worker.connection in ready:
+                    try:
+                        status, value = worker.connection.recv()
+                    except (EOFError, OSError):
+                        worker.process.join(1)
+                        self.num_crashes += 1
+                        self._replace(position, WorkerCrashed(
+                            f"Worker exited with code {worker.process.exitcode}"
+                        ))
+                        continue
+                    future, worker.future, worker.deadline = worker.future, None, None
+                    if status == 'ok':
+                        future.set_result(value)
+                    else:
+                        future.set_exception(value)
+                elif worker.deadline is not None and now >= worker.deadline:
+                    self.num_timeouts += 1
+                    self._replace(position, EvaluationTimeout(
+                        f"Evaluation exceeded {self.timeout} seconds"
+                    ))
+
+        for worker in self._workers:
+            worker.stop()
+        self._wake_reader.close()
+
+    def _start(self, worker: _Worker, future: Future, fn: Callable, args, kwargs):
+        """Send a task to an idle worker unless it was cancelled."""
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            worker.connection.send((fn, args, kwargs))
+        except Exception as exc:
+            future.set_exception(exc)
+            return
+        worker.future = future
+        worker.deadline = time.monotonic() + self.timeout if self.timeout is not None else None
+
+    def _replace(self, position: int, error: Exception):
+        """Kill a worker, fail its task and start a fresh process."""
+        worker = self._workers[position]
+        future = worker.future
+        worker.kill()
+        self._workers[position] = _Worker(self._context)
+        future.set_exception(error)
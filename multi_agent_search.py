@@ -5,52 +5,761 @@ This module implements a multi-agent architecture search system where multiple
 agents collaborate to search for optimal architectures or configurations.
 """
 
+import heapq
+import math
+import os
 import random
-from typing import List, Dict, Any, Callable, Optional
+import tempfile
+from collections import deque
+from typing import List, Dict, Any, Callable, Iterator, Optional, Sequence, Tuple, Union
 from abc import ABC, abstractmethod
-import json
+from concurrent.futures import (
+    Executor, Future, ThreadPoolExecutor, ProcessPoolExecutor, FIRST_COMPLETED, wait
+)
+import time
+
+import numpy as np
+
+from evaluation_cache import EvaluationCache, config_digest
+from instrumentation import SearchProfiler
+from isolation import EvaluationTimeout, IsolatedProcessExecutor
+from checkpoint import SearchCheckpoint
+from event_log import EventLog
+from multi_fidelity import hyperband_brackets, successive_halving_rungs
+from topologies import TOPOLOGIES, Topology
+
+
+EXECUTOR_TYPES = ('serial', 'thread', 'process', 'isolated')
+
+# Seconds between checks for queued evaluations that have started running,
+# whose evaluation_timeout clock then starts
+DEADLINE_POLL_INTERVAL = 0.05
+
+
+class SearchSpace:
+    """
+    Indexed view of a search space.
+    
+    Every configuration is identified by the index of each of its values in
+    the corresponding dimension's value list. The index vector is packed into
+    a single mixed-radix integer (the fingerprint), which is collision-free,
+    identical across processes and runs, and can be decoded back into a
+    configuration.
+    """
+    
+    def __init__(self, search_space: Dict[str, List[Any]]):
+        """
+        Index a search space.
+        
+        Args:
+            search_space: Dictionary defining the search space
+        """
+        self.names = list(search_space.keys())
+        self.values = [list(values) for values in search_space.values()]
+        self.radices = [len(values) for values in self.values]
+        if not all(self.radices):
+            raise ValueError("Every search space dimension needs at least one value")
+        
+        # The last dimension varies fastest
+        self.strides = [1] * len(self.radices)
+        for i in range(len(self.radices) - 2, -1, -1):
+            self.strides[i] = self.strides[i + 1] * self.radices[i + 1]
+        self.size = self.strides[0] * self.radices[0] if self.radices else 1
+        
+        self._lookup = []
+        for values in self.values:
+            lookup = {}
+            for i, value in enumerate(values):
+                try:
+                    lookup.setdefault(value, i)
+                except TypeError:
+                    # Unhashable values are resolved by a linear scan
+                    lookup = None
+                    break
+            self._lookup.append(lookup)
+        self._value_arrays = None
+    
+    def __len__(self):
+        return self.size
+    
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, SearchSpace):
+            return NotImplemented
+        return self.names == other.names and self.values == other.values
+    
+    def __hash__(self):
+        return hash((tuple(self.names), tuple(self.radices)))
+    
+    def to_dict(self) -> Dict[str, List[Any]]:
+        """Return the search space as a plain dictionary."""
+        return dict(zip(self.names, self.values))
+    
+    def index_of(self, dimension: int, value: Any) -> int:
+        """
+        Find the index of a value within one dimension.
+        
+        Args:
+            dimension: Position of the dimension in the search space
+            value: Value to look up
+        
+        Returns:
+            Index of value in the dimension's value list
+        """
+        lookup = self._lookup[dimension]
+        try:
+            if lookup is not None:
+                return lookup[value]
+            return self.values[dimension].index(value)
+        except (KeyError, TypeError, ValueError):
+            raise ValueError(
+                f"{value!r} is not a valid value for '{self.names[dimension]}'"
+            ) from None
+    
+    def indices_of(self, config: Dict[str, Any]) -> List[int]:
+        """Convert a configuration into its per-dimension index vector."""
+        return [self.index_of(i, config[name]) for i, name in enumerate(self.names)]
+    
+    def config_of(self, indices: List[int]) -> Dict[str, Any]:
+        """Convert an index vector into a configuration."""
+        return {
+            name: values[index]
+            for name, values, index in zip(self.names, self.values, indices)
+        }
+    
+    def fingerprint(self, indices: List[int]) -> int:
+        """Pack an index vector into its mixed-radix fingerprint."""
+        fingerprint = 0
+        for index, stride in zip(indices, self.strides):
+            fingerprint += index * stride
+        return fingerprint
+    
+    def unpack(self, fingerprint: int) -> List[int]:
+        """Unpack a fingerprint into its index vector."""
+        if not 0 <= fingerprint < self.size:
+            raise ValueError(f"Fingerprint {fingerprint} is outside the search space")
+        return [(fingerprint // stride) % radix
+                for stride, radix in zip(self.strides, self.radices)]
+    
+    def encode(self, config: Dict[str, Any]) -> int:
+        """Compute the fingerprint of a configuration."""
+        return self.fingerprint(self.indices_of(config))
+    
+    def decode(self, fingerprint: int) -> Dict[str, Any]:
+        """Convert a fingerprint back into a configuration."""
+        return self.config_of(self.unpack(fingerprint))
+    
+    def random_indices(self) -> List[int]:
+        """Draw a uniformly random index vector."""
+        return [random.randrange(radix) for radix in self.radices]
+    
+    def fingerprints(self, indices: np.ndarray) -> np.ndarray:
+        """
+        Pack many index vectors at once.
+        
+        Args:
+            indices: Integer array of shape (n, num_dimensions)
+        
+        Returns:
+            Array of n fingerprints (object dtype if they exceed 64 bits)
+        """
+        if self.size > np.iinfo(np.int64).max:
+            strides = np.array(self.strides, dtype=object)
+            return indices.astype(object) @ strides
+        return indices.astype(np.int64) @ np.array(self.strides, dtype=np.int64)
+    
+    def value_arrays(self) -> List[np.ndarray]:
+        """Per-dimension value lists as NumPy arrays, for vectorized lookups."""
+        if self._value_arrays is None:
+            arrays = []
+            for values in self.values:
+                array = np.asarray(values)
+                if array.dtype.kind not in 'biuf' and not all(isinstance(v, str) for v in values):
+                    array = np.array(values, dtype=object)
+                arrays.append(array)
+            self._value_arrays = arrays
+        return self._value_arrays
+
+
+class ConfigBatch:
+    """
+    A batch of configurations in columnar form.
+    
+    Batch evaluation functions receive one of these instead of a list of
+    dictionaries: batch.indices holds the (n, num_dimensions) index matrix
+    and batch[name] returns the values of one dimension as a NumPy array.
+    """
+    
+    def __init__(self, indices: np.ndarray, space: SearchSpace):
+        """
+        Initialize a batch.
+        
+        Args:
+            indices: Integer array of shape (n, num_dimensions)
+            space: The search space the indices refer to
+        """
+        self.indices = indices
+        self.space = space
+    
+    def __len__(self):
+        return len(self.indices)
+    
+    def __getitem__(self, name: str) -> np.ndarray:
+        dimension = self.space.names.index(name)
+        return self.space.value_arrays()[dimension][self.indices[:, dimension]]
+    
+    def configs(self) -> List[Dict[str, Any]]:
+        """Materialize the batch as a list of configuration dictionaries."""
+        return [self.space.config_of(row) for row in self.indices.tolist()]
 
 
 class Architecture:
-    """Represents a candidate architecture or configuration."""
+    """
+    Represents a candidate architecture or configuration.
+    
+    Architectures proposed by agents store only their index vector into the
+    search space; the configuration dictionary is built on demand.
+    """
+    
+    __slots__ = ('_config', 'indices', 'space', 'score', 'id')
     
-    def __init__(self, config: Dict[str, Any], score: Optional[float] = None):
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        score: Optional[float] = None,
+        space: Optional[SearchSpace] = None
+    ):
         """
         Initialize an architecture.
         
         Args:
             config: Dictionary containing architecture configuration
             score: Optional fitness/performance score
+            space: Optional search space; when given, the id is the config's
+                mixed-radix fingerprint instead of a content digest
         """
-        self.config = config
         self.score = score
-        self.id = hash(json.dumps(config, sort_keys=True))
+        self.space = space
+        if space is not None:
+            self._config = None
+            self.indices = tuple(space.indices_of(config))
+            self.id = space.fingerprint(self.indices)
+        else:
+            self._config = config
+            self.indices = None
+            self.id = int(config_digest(config)[:16], 16)
+    
+    @classmethod
+    def from_indices(
+        cls,
+        indices: Sequence[int],
+        space: SearchSpace,
+        score: Optional[float] = None
+    ) -> 'Architecture':
+        """
+        Create an architecture directly from a search space index vector.
+        
+        Args:
+            indices: Index of each dimension's value in the search space
+            space: The search space the indices refer to
+            score: Optional fitness/performance score
+        """
+        architecture = cls.__new__(cls)
+        architecture._config = None
+        architecture.score = score
+        architecture.space = space
+        architecture.indices = tuple(indices)
+        architecture.id = space.fingerprint(architecture.indices)
+        return architecture
+    
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Configuration dictionary (materialized from the indices if needed)."""
+        if self._config is not None:
+            return self._config
+        return self.space.config_of(self.indices)
     
     def __repr__(self):
         return f"Architecture(config={self.config}, score={self.score})"
     
     def __eq__(self, other):
-        return self.id == other.id
+        if not isinstance(other, Architecture):
+            return NotImplemented
+        # Fingerprints and digests are only comparable within one id scheme
+        if self.space is not None and other.space is not None and self.space == other.space:
+            return self.id == other.id
+        if self.space is None and other.space is None:
+            return self.id == other.id
+        return self.config == other.config
     
     def __hash__(self):
-        return self.id
+        # Hash the content digest so that equal architectures hash equally
+        # regardless of which id scheme they use
+        if self.space is None:
+            return self.id
+        return int(config_digest(self.config)[:16], 16)
+
+
+class RunningStatistics:
+    """
+    Streaming summary of every result an agent has recorded.
+    
+    Count, mean and variance are merged in with Welford's / Chan's update,
+    and per-dimension value counts are kept as a (num_dimensions, max_radix)
+    array, so none of them require the stored rows. Results with a NaN
+    score only contribute to the value counts.
+    """
+    
+    def __init__(self, space: SearchSpace):
+        """
+        Initialize empty statistics.
+        
+        Args:
+            space: Search space the recorded index vectors refer to
+        """
+        self.count = 0
+        self.mean = 0.0
+        self.best_score = None
+        self.best_indices = None
+        self.value_counts = np.zeros(
+            (len(space.radices), max(space.radices, default=1)), dtype=np.int64
+        )
+        self._dimensions = np.arange(len(space.radices))
+        self._m2 = 0.0
+    
+    def update_one(self, indices: Sequence[int], score: float):
+        """Fold a single result into the statistics."""
+        self.value_counts[self._dimensions, indices] += 1
+        if score is None or math.isnan(score):
+            return
+        self.count += 1
+        delta = score - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (score - self.mean)
+        if self.best_score is None or score > self.best_score:
+            self.best_score = score
+            self.best_indices = tuple(indices)
+    
+    def update(self, indices: np.ndarray, scores: np.ndarray):
+        """Fold a batch of results into the statistics."""
+        indices = np.asarray(indices)
+        if len(indices) == 0:
+            return
+        np.add.at(self.value_counts, (np.broadcast_to(self._dimensions, indices.shape), indices), 1)
+        scores = np.asarray(scores, dtype=np.float64)
+        valid = ~np.isnan(scores)
+        scores = scores[valid]
+        if len(scores) == 0:
+            return
+        batch_mean = float(scores.mean())
+        total = self.count + len(scores)
+        delta = batch_mean - self.mean
+        self._m2 += float(((scores - batch_mean) ** 2).sum()) + delta ** 2 * self.count * len(scores) / total
+        self.mean += delta * len(scores) / total
+        self.count = total
+        best = int(np.argmax(scores))
+        if self.best_score is None or scores[best] > self.best_score:
+            self.best_score = float(scores[best])
+            self.best_indices = tuple(indices[valid][best].tolist())
+    
+    @property
+    def variance(self) -> float:
+        """Sample variance of the recorded scores."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+    
+    @property
+    def std(self) -> float:
+        """Sample standard deviation of the recorded scores."""
+        return math.sqrt(self.variance)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Scalar statistics as a dictionary."""
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'std': self.std,
+            'best_score': self.best_score,
+        }
+
+
+HISTORY_POLICIES = ('unbounded', 'ring', 'top_k', 'spill')
+
+
+class ArchitectureHistory:
+    """
+    Columnar record of the architectures an agent has evaluated.
+    
+    Index vectors and scores are kept in preallocated NumPy arrays rather than
+    as one Architecture object per evaluation. Indexing and iteration rebuild
+    lightweight Architecture views on demand.
+    
+    The policy bounds how much is kept: 'unbounded' keeps everything, 'ring'
+    the last max_size results, 'top_k' the best max_size results and 'spill'
+    everything, but with at most max_size rows in memory and the rest in a
+    file on disk. Running statistics always cover every recorded result.
+    """
+    
+    def __init__(
+        self,
+        space: SearchSpace,
+        initial_capacity: int = 64,
+        policy: str = 'unbounded',
+        max_size: Optional[int] = None,
+        spill_path: Optional[str] = None
+    ):
+        """
+        Initialize an empty history.
+        
+        Args:
+            space: Search space the stored index vectors refer to
+            initial_capacity: Number of rows allocated up front
+            policy: One of HISTORY_POLICIES
+            max_size: Row limit for the 'ring', 'top_k' and 'spill' policies
+            spill_path: File the 'spill' policy writes to (an anonymous
+                temporary file by default)
+        """
+        if policy not in HISTORY_POLICIES:
+            raise ValueError(f"Unknown history policy '{policy}', expected one of {HISTORY_POLICIES}")
+        if policy != 'unbounded' and not max_size:
+            raise ValueError(f"History policy '{policy}' requires max_size")
+        
+        self.space = space
+        self.policy = policy
+        self.max_size = max_size
+        self.spill_path = spill_path
+        self.stats = RunningStatistics(space)
+        
+        max_radix = max(space.radices, default=1)
+        if max_radix <= np.iinfo(np.uint8).max + 1:
+            dtype = np.uint8
+        elif max_radix <= np.iinfo(np.uint16).max + 1:
+            dtype = np.uint16
+        else:
+            dtype = np.int64
+        if max_size:
+            initial_capacity = min(initial_capacity, max_size)
+        self._indices = np.empty((initial_capacity, len(space.radices)), dtype=dtype)
+        self._scores = np.empty(initial_capacity, dtype=np.float64)
+        self._size = 0
+        self._next = 0  # oldest row once a ring buffer is full
+        self._record_dtype = np.dtype([
+            ('indices', dtype, (len(space.radices),)), ('score', np.float64)
+        ])
+        self._spill_file = None
+        self._spilled = 0
+    
+    def append(self, architecture: Architecture):
+        """
+        Record an evaluated architecture.
+        
+        Args:
+            architecture: Architecture with its score set
+        """
+        if architecture.indices is not None and architecture.space == self.space:
+            indices = architecture.indices
+        else:
+            indices = self.space.indices_of(architecture.config)
+        score = np.nan if architecture.score is None else architecture.score
+        
+        if self.policy != 'unbounded':
+            self.extend(np.array([indices]), np.array([score], dtype=np.float64))
+            return
+        
+        self.stats.update_one(indices, score)
+        if self._size == len(self._scores):
+            capacity = max(2 * self._size, 1)
+            self._indices = np.resize(self._indices, (capacity, self._indices.shape[1]))
+            self._scores = np.resize(self._scores, capacity)
+        self._indices[self._size] = indices
+        self._scores[self._size] = score
+        self._size += 1
+    
+    def extend(self, indices: np.ndarray, scores: np.ndarray):
+        """
+        Record a batch of evaluated index vectors.
+        
+        Args:
+            indices: Integer array of shape (n, num_dimensions)
+            scores: Their scores
+        """
+        indices = np.asarray(indices)
+        scores = np.asarray(scores, dtype=np.float64)
+        self.stats.update(indices, scores)
+        
+        if self.policy == 'ring':
+            # Fill up to max_size, then overwrite the oldest rows
+            take = min(len(scores), self.max_size - self._size)
+            self._append_rows(indices[:take], scores[:take])
+            if take < len(scores):
+                indices, scores = indices[take:][-self.max_size:], scores[take:][-self.max_size:]
+                positions = (self._next + np.arange(len(scores))) % self.max_size
+                self._indices[positions] = indices
+                self._scores[positions] = scores
+                self._next = (self._next + len(scores)) % self.max_size
+        elif self.policy == 'top_k':
+            self._keep_top(indices, scores)
+        elif self.policy == 'spill':
+            start = 0
+            while start < len(scores):
+                take = min(len(scores) - start, self.max_size - self._size)
+                self._append_rows(indices[start:start + take], scores[start:start + take])
+                start += take
+                if self._size == self.max_size:
+                    self._spill()
+        else:
+            self._append_rows(indices, scores)
+    
+    def _append_rows(self, indices: np.ndarray, scores: np.ndarray):
+        """Append rows to the in-memory arrays, growing them by doubling."""
+        required = self._size + len(scores)
+        if required > len(self._scores):
+            capacity = max(2 * len(self._scores), required)
+            if self.max_size:
+                capacity = min(capacity, self.max_size)
+            self._indices = np.resize(self._indices, (capacity, self._indices.shape[1]))
+            self._scores = np.resize(self._scores, capacity)
+        self._indices[self._size:required] = indices
+        self._scores[self._size:required] = scores
+        self._size = required
+    
+    def _keep_top(self, indices: np.ndarray, scores: np.ndarray):
+        """Merge rows into a top-k store, dropping the lowest scores."""
+        if self._size + len(scores) <= self.max_size:
+            self._append_rows(indices, scores)
+            return
+        if len(scores) == 1 and self._size == self.max_size:
+            # Single insert into a full store: replace the minimum if beaten
+            stored = np.where(np.isnan(self._scores), -np.inf, self._scores)
+            worst = int(np.argmin(stored))
+            if scores[0] > stored[worst]:
+                self._indices[worst] = indices[0]
+                self._scores[worst] = scores[0]
+            return
+        merged_indices = np.concatenate([self.indices, indices.astype(self._indices.dtype)])
+        merged_scores = np.concatenate([self.scores, scores])
+        if len(merged_scores) > self.max_size:
+            ranked = np.where(np.isnan(merged_scores), -np.inf, merged_scores)
+            keep = np.sort(np.argpartition(-ranked, self.max_size - 1)[:self.max_size])
+            merged_indices, merged_scores = merged_indices[keep], merged_scores[keep]
+        self._size = 0
+        self._append_rows(merged_indices, merged_scores)
+    
+    def _spill(self):
+        """Move the in-memory rows to the spill file."""
+        if self._spill_file is None:
+            self._spill_file = (open(self.spill_path, 'w+b') if self.spill_path
+                                else tempfile.TemporaryFile())
+        records = np.empty(self._size, dtype=self._record_dtype)
+        records['indices'] = self._indices[:self._size]
+        records['score'] = self._scores[:self._size]
+        self._spill_file.seek(0, os.SEEK_END)
+        self._spill_file.write(records.tobytes())
+        self._spilled += self._size
+        self._size = 0
+    
+    def _read_spilled(self) -> np.ndarray:
+        """All records written to the spill file."""
+        if self._spill_file is None:
+            return np.empty(0, dtype=self._record_dtype)
+        self._spill_file.flush()
+        self._spill_file.seek(0)
+        return np.frombuffer(self._spill_file.read(), dtype=self._record_dtype)
+    
+    @property
+    def indices(self) -> np.ndarray:
+        """Index vectors of all retained architectures, one row each."""
+        if self._spilled:
+            return np.concatenate([self._read_spilled()['indices'], self._indices[:self._size]])
+        if self._next:
+            return np.concatenate([self._indices[self._next:self._size],
+                                   self._indices[:self._next]])
+        return self._indices[:self._size]
+    
+    @property
+    def scores(self) -> np.ndarray:
+        """Scores of all retained architectures."""
+        if self._spilled:
+            return np.concatenate([self._read_spilled()['score'], self._scores[:self._size]])
+        if self._next:
+            return np.concatenate([self._scores[self._next:self._size], self._scores[:self._next]])
+        return self._scores[:self._size]
+    
+    def __len__(self):
+        return self._spilled + self._size
+    
+    def __getitem__(self, position: int) -> Architecture:
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError("history index out of range")
+        if self._spilled or self._next:
+            return Architecture.from_indices(
+                self.indices[position].tolist(), self.space, float(self.scores[position])
+            )
+        return Architecture.from_indices(
+            self._indices[position].tolist(), self.space, float(self._scores[position])
+        )
+    
+    def __iter__(self):
+        for row, score in zip(self.indices.tolist(), self.scores.tolist()):
+            yield Architecture.from_indices(row, self.space, score)
+    
+    def close(self):
+        """Close the spill file, if one was opened."""
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+
+
+class EliteArchive:
+    """
+    Bounded archive of the top-k distinct architectures found by any agent.
+    
+    The coordinator owns one archive and agents read it when proposing, so
+    the population's best regions are visible to everyone without copying
+    architectures between agents. Entries live in a min-heap keyed on score,
+    making an insert O(log k); a sorted view is rebuilt lazily for readers.
+    """
+    
+    def __init__(self, space: SearchSpace, capacity: int = 10):
+        """
+        Initialize an empty archive.
+        
+        Args:
+            space: Search space the archived index vectors refer to
+            capacity: Maximum number of elites kept
+        """
+        self.space = space
+        self.capacity = capacity
+        self._heap = []  # min-heap of (score, sequence, fingerprint)
+        self._members = set()
+        self._sequence = 0
+        self._sorted = None
+    
+    def add(self, architecture: Architecture) -> bool:
+        """
+        Offer an evaluated architecture to the archive.
+        
+        Args:
+            architecture: Architecture with its score set
+        
+        Returns:
+            Whether it was admitted
+        """
+        if architecture.space is self.space:
+            fingerprint = architecture.id
+        else:
+            fingerprint = self.space.encode(architecture.config)
+        return self._offer(fingerprint, architecture.score)
+    
+    def add_batch(self, indices: np.ndarray, scores: np.ndarray) -> int:
+        """
+        Offer a batch of evaluated index vectors.
+        
+        Returns:
+            Number of rows admitted
+        """
+        scores = np.asarray(scores, dtype=np.float64)
+        candidates = np.flatnonzero(scores > self.threshold)
+        if len(candidates) == 0:
+            return 0
+        fingerprints = self.space.fingerprints(np.asarray(indices)[candidates]).tolist()
+        return sum(self._offer(fingerprint, score)
+                   for fingerprint, score in zip(fingerprints, scores[candidates].tolist()))
+    
+    @property
+    def threshold(self) -> float:
+        """Score an architecture must beat to enter a full archive."""
+        if len(self._heap) < self.capacity:
+            return -np.inf
+        return self._heap[0][0]
+    
+    def elites(self) -> List[Architecture]:
+        """Archived architectures, best first."""
+        return [Architecture.from_indices(self.space.unpack(fingerprint), self.space, score)
+                for score, fingerprint in self.entries()]
+    
+    def best(self) -> Optional[Architecture]:
+        """The best archived architecture, or None while empty."""
+        view = self.entries()
+        if not view:
+            return None
+        score, fingerprint = view[0]
+        return Architecture.from_indices(self.space.unpack(fingerprint), self.space, score)
+    
+    def sample(self) -> Optional[Architecture]:
+        """A uniformly random elite, or None while empty."""
+        view = self.entries()
+        if not view:
+            return None
+        score, fingerprint = random.choice(view)
+        return Architecture.from_indices(self.space.unpack(fingerprint), self.space, score)
+    
+    def indices(self) -> np.ndarray:
+        """Index vectors of the elites, best first, one row each."""
+        return np.array([self.space.unpack(fingerprint) for _, fingerprint in self.entries()],
+                        dtype=np.int64).reshape(len(self._heap), len(self.space.radices))
+    
+    def scores(self) -> np.ndarray:
+        """Scores of the elites, best first."""
+        return np.array([score for score, _ in self.entries()], dtype=np.float64)
+    
+    def __len__(self):
+        return len(self._heap)
+    
+    def __contains__(self, fingerprint: int) -> bool:
+        return fingerprint in self._members
+    
+    def _offer(self, fingerprint: int, score: Optional[float]) -> bool:
+        """Insert a fingerprint if it is new and good enough."""
+        if score is None or math.isnan(score) or fingerprint in self._members:
+            return False
+        self._sequence += 1
+        if len(self._heap) < self.capacity:
+            heapq.heappush(self._heap, (score, self._sequence, fingerprint))
+        elif score > self._heap[0][0]:
+            _, _, evicted = heapq.heapreplace(self._heap, (score, self._sequence, fingerprint))
+            self._members.discard(evicted)
+        else:
+            return False
+        self._members.add(fingerprint)
+        self._sorted = None
+        return True
+    
+    def entries(self) -> List[Tuple[float, int]]:
+        """(score, fingerprint) pairs sorted best first, cached until the next insert."""
+        if self._sorted is None:
+            self._sorted = [(score, fingerprint) for score, _, fingerprint
+                            in sorted(self._heap, key=lambda entry: (-entry[0], entry[1]))]
+        return self._sorted
 
 
 class Agent(ABC):
     """Abstract base class for search agents."""
     
-    def __init__(self, agent_id: int, search_space: Dict[str, List[Any]]):
+    def __init__(
+        self,
+        agent_id: int,
+        search_space: Union[Dict[str, List[Any]], SearchSpace]
+    ):
         """
         Initialize an agent.
         
         Args:
             agent_id: Unique identifier for the agent
-            search_space: Dictionary defining the search space
+            search_space: Dictionary defining the search space, or an already
+                indexed SearchSpace to share between agents
         """
+        if not isinstance(search_space, SearchSpace):
+            search_space = SearchSpace(search_space)
         self.agent_id = agent_id
-        self.search_space = search_space
+        self.space = search_space
+        self.search_space = search_space.to_dict()
         self.best_architecture = None
-        self.history = []
+        self.history = ArchitectureHistory(search_space)
+        # Shared EliteArchive, assigned by the coordinator when it keeps one
+        self.archive = None
     
     @abstractmethod
     def propose_architecture(self) -> Architecture:
@@ -68,6 +777,30 @@ class Agent(ABC):
         """
         pass
     
+    def propose_batch(self, n: int) -> np.ndarray:
+        """
+        Propose several architectures at once.
+        
+        Args:
+            n: Number of proposals
+        
+        Returns:
+            Integer array of shape (n, num_dimensions) of search space indices
+        """
+        rows = [self._indices_of(self.propose_architecture()) for _ in range(n)]
+        return np.array(rows, dtype=np.int64).reshape(n, len(self.space.radices))
+    
+    def update_batch(self, indices: np.ndarray, scores: np.ndarray):
+        """
+        Update the agent with a batch of evaluation results.
+        
+        Args:
+            indices: Integer array of shape (n, num_dimensions)
+            scores: Their scores
+        """
+        for row, score in zip(indices.tolist(), scores.tolist()):
+            self.update(Architecture.from_indices(row, self.space), score)
+    
     def share_knowledge(self, other_agent: 'Agent'):
         """
         Share knowledge with another agent.
@@ -78,6 +811,44 @@ class Agent(ABC):
         if self.best_architecture and other_agent.best_architecture:
             if self.best_architecture.score > other_agent.best_architecture.score:
                 other_agent.best_architecture = self.best_architecture
+    
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Snapshot the agent's state for checkpointing.
+        
+        The history is excluded because checkpoints journal it separately,
+        and the shared archive because the coordinator snapshots it; everything
+        else in the instance dictionary is included, so subclasses only need
+        to override this for state that cannot be pickled.
+        """
+        excluded = ('agent_id', 'space', 'search_space', 'history', 'archive')
+        return {key: value for key, value in vars(self).items() if key not in excluded}
+    
+    def set_state(self, state: Dict[str, Any]):
+        """Restore state produced by get_state()."""
+        vars(self).update(state)
+    
+    def _batch_rng(self) -> np.random.Generator:
+        """NumPy generator seeded from the global random stream, so seeding
+        the random module also makes batched proposals reproducible."""
+        return np.random.default_rng(random.getrandbits(64))
+    
+    def _record_batch(self, indices: np.ndarray, scores: np.ndarray):
+        """Append a batch to the history and track the best architecture."""
+        self.history.extend(indices, scores)
+        if len(scores) == 0:
+            return
+        best = int(np.argmax(scores))
+        if self.best_architecture is None or scores[best] > self.best_architecture.score:
+            self.best_architecture = Architecture.from_indices(
+                indices[best].tolist(), self.space, float(scores[best])
+            )
+    
+    def _indices_of(self, architecture: Architecture) -> List[int]:
+        """Index vector of an architecture within this agent's search space."""
+        if architecture.indices is not None and architecture.space == self.space:
+            return architecture.indices
+        return self.space.indices_of(architecture.config)
 
 
 class RandomSearchAgent(Agent):
@@ -85,10 +856,11 @@ class RandomSearchAgent(Agent):
     
     def propose_architecture(self) -> Architecture:
         """Generate a random architecture from the search space."""
-        config = {}
-        for key, values in self.search_space.items():
-            config[key] = random.choice(values)
-        return Architecture(config)
+        return Architecture.from_indices(self.space.random_indices(), self.space)
+    
+    def propose_batch(self, n: int) -> np.ndarray:
+        """Draw n random index vectors in one vectorized call."""
+        return self._batch_rng().integers(0, self.space.radices, size=(n, len(self.space.radices)))
     
     def update(self, architecture: Architecture, score: float):
         """Update the agent with new evaluation results."""
@@ -97,12 +869,20 @@ class RandomSearchAgent(Agent):
         
         if self.best_architecture is None or score > self.best_architecture.score:
             self.best_architecture = architecture
+    
+    def update_batch(self, indices: np.ndarray, scores: np.ndarray):
+        """Update the agent with a batch of evaluation results."""
+        self._record_batch(indices, scores)
 
 
 class GreedySearchAgent(Agent):
     """Agent that performs greedy search by exploiting best configurations."""
     
-    def __init__(self, agent_id: int, search_space: Dict[str, List[Any]]):
+    def __init__(
+        self,
+        agent_id: int,
+        search_space: Union[Dict[str, List[Any]], SearchSpace]
+    ):
         super().__init__(agent_id, search_space)
         self.exploration_rate = 0.3  # Probability of random exploration
     
@@ -110,17 +890,40 @@ class GreedySearchAgent(Agent):
         """Generate architecture based on best known configuration."""
         if self.best_architecture is None or random.random() < self.exploration_rate:
             # Explore: random configuration
-            config = {}
-            for key, values in self.search_space.items():
-                config[key] = random.choice(values)
+            indices = self.space.random_indices()
         else:
-            # Exploit: modify best configuration slightly
-            config = self.best_architecture.config.copy()
+            # Exploit: modify best configuration (or a shared elite) slightly
+            if self.archive is not None and len(self.archive):
+                indices = list(self._indices_of(self.archive.sample()))
+            else:
+                indices = list(self._indices_of(self.best_architecture))
             # Mutate one random parameter
-            key_to_mutate = random.choice(list(self.search_space.keys()))
-            config[key_to_mutate] = random.choice(self.search_space[key_to_mutate])
+            dimension = random.randrange(len(indices))
+            indices[dimension] = random.randrange(self.space.radices[dimension])
+        
+        return Architecture.from_indices(indices, self.space)
+    
+    def propose_batch(self, n: int) -> np.ndarray:
+        """Propose n architectures, mutating the best one in a vectorized way."""
+        rng = self._batch_rng()
+        num_dimensions = len(self.space.radices)
+        radices = np.array(self.space.radices)
+        proposals = rng.integers(0, radices, size=(n, num_dimensions))
+        if self.best_architecture is None:
+            return proposals
         
-        return Architecture(config)
+        # Exploit rows start from the best config with one mutated parameter
+        exploit = rng.random(n) >= self.exploration_rate
+        rows = np.flatnonzero(exploit)
+        dimensions = rng.integers(0, num_dimensions, size=len(rows))
+        if self.archive is not None and len(self.archive):
+            elites = self.archive.indices()
+            mutated = elites[rng.integers(0, len(elites), size=len(rows))]
+        else:
+            mutated = np.tile(np.array(self._indices_of(self.best_architecture)), (len(rows), 1))
+        mutated[np.arange(len(rows)), dimensions] = rng.integers(0, radices[dimensions])
+        proposals[rows] = mutated
+        return proposals
     
     def update(self, architecture: Architecture, score: float):
         """Update the agent with new evaluation results."""
@@ -129,6 +932,366 @@ class GreedySearchAgent(Agent):
         
         if self.best_architecture is None or score > self.best_architecture.score:
             self.best_architecture = architecture
+    
+    def update_batch(self, indices: np.ndarray, scores: np.ndarray):
+        """Update the agent with a batch of evaluation results."""
+        self._record_batch(indices, scores)
+
+
+class TPESearchAgent(Agent):
+    """
+    Agent that proposes architectures with a Tree-structured Parzen Estimator.
+    
+    Observations are split into a good set (the top gamma fraction by score)
+    and a bad set, each summarized by per-dimension value counts. Candidates
+    are sampled from the good-set distribution l(x) and the one maximizing
+    l(x) / g(x) is proposed. Two heaps keep the split current, so recording an
+    observation costs O(log n + d) instead of a refit over the whole history.
+    """
+    
+    def __init__(
+        self,
+        agent_id: int,
+        search_space: Union[Dict[str, List[Any]], SearchSpace],
+        gamma: float = 0.25,
+        num_candidates: int = 24,
+        min_observations: int = 10,
+        prior_weight: float = 1.0
+    ):
+        """
+        Initialize a TPE agent.
+        
+        Args:
+            agent_id: Unique identifier for the agent
+            search_space: Dictionary defining the search space, or a SearchSpace
+            gamma: Fraction of observations treated as good
+            num_candidates: Candidates drawn from l(x) per proposal
+            min_observations: Observations before the model is used; proposals
+                are random until then
+            prior_weight: Pseudo-count added to every value of every dimension
+        """
+        super().__init__(agent_id, search_space)
+        self.gamma = gamma
+        self.num_candidates = num_candidates
+        self.min_observations = min_observations
+        self.prior_weight = prior_weight
+        
+        radices = np.array(self.space.radices)
+        self._dimensions = np.arange(len(radices))
+        self._valid = np.arange(max(radices, default=1)) < radices[:, None]
+        self._reset_model()
+    
+    def _reset_model(self):
+        """Forget every observation."""
+        self._good_counts = np.zeros(self._valid.shape)
+        self._bad_counts = np.zeros(self._valid.shape)
+        self._good = []  # min-heap of (score, sequence, indices)
+        self._bad = []   # min-heap of (-score, sequence, indices)
+        self._observed = set()
+        self._sequence = 0
+    
+    def propose_architecture(self) -> Architecture:
+        """Propose the candidate with the best expected improvement ratio."""
+        self._absorb_best()
+        if len(self._observed) < self.min_observations:
+            return Architecture.from_indices(self.space.random_indices(), self.space)
+        return Architecture.from_indices(self._propose_rows(1)[0].tolist(), self.space)
+    
+    def propose_batch(self, n: int) -> np.ndarray:
+        """Propose n architectures, scoring all candidates in one vectorized pass."""
+        self._absorb_best()
+        if len(self._observed) < self.min_observations:
+            return self._batch_rng().integers(
+                0, self.space.radices, size=(n, len(self.space.radices))
+            )
+        return self._propose_rows(n)
+    
+    def update(self, architecture: Architecture, score: float):
+        """Update the agent and its model with new evaluation results."""
+        architecture.score = score
+        self.history.append(architecture)
+        
+        if self.best_architecture is None or score > self.best_architecture.score:
+            self.best_architecture = architecture
+        indices = tuple(self._indices_of(architecture))
+        self._observe(indices, score, self.space.fingerprint(indices))
+    
+    def update_batch(self, indices: np.ndarray, scores: np.ndarray):
+        """Update the agent and its model with a batch of evaluation results."""
+        self._record_batch(indices, scores)
+        fingerprints = self.space.fingerprints(indices).tolist()
+        for row, score, fingerprint in zip(indices.tolist(), scores.tolist(), fingerprints):
+            self._observe(tuple(row), score, fingerprint)
+    
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Snapshot the agent for checkpointing.
+        
+        The model's observations grow with every evaluation and are left out;
+        set_state() rebuilds them from the history replayed from the journal.
+        """
+        excluded = ('_good_counts', '_bad_counts', '_good', '_bad', '_observed', '_sequence')
+        return {key: value for key, value in super().get_state().items()
+                if key not in excluded}
+    
+    def set_state(self, state: Dict[str, Any]):
+        """
+        Restore state produced by get_state() and refit the model.
+        
+        Observations shared by other agents are not in this agent's history;
+        the best architecture and the elite archive are absorbed again on the
+        next proposal.
+        """
+        super().set_state(state)
+        self._reset_model()
+        indices = self.history.indices
+        fingerprints = self.space.fingerprints(indices).tolist()
+        for row, score, fingerprint in zip(indices.tolist(), self.history.scores.tolist(),
+                                           fingerprints):
+            self._observe(tuple(row), score, fingerprint)
+    
+    def share_knowledge(self, other_agent: 'Agent'):
+        """
+        Share knowledge with another agent.
+        
+        Besides the best architecture, another TPE agent receives this agent's
+        good set as observations for its own model.
+        """
+        super().share_knowledge(other_agent)
+        if isinstance(other_agent, TPESearchAgent):
+            for score, _, indices in list(self._good):
+                other_agent._observe(indices, score, self.space.fingerprint(indices))
+    
+    def _propose_rows(self, n: int, attempts: int = 4) -> np.ndarray:
+        """
+        Draw num_candidates candidates from l(x) per proposal and keep the best.
+        
+        Candidates that were already observed are never kept. A proposal whose
+        candidates were all observed is redrawn from l(x), up to attempts
+        times, and then falls back to a random unobserved row.
+        """
+        rng = self._batch_rng()
+        radices = self.space.radices
+        good = (self._good_counts + self.prior_weight) * self._valid
+        bad = (self._bad_counts + self.prior_weight) * self._valid
+        good /= good.sum(axis=1, keepdims=True)
+        bad /= bad.sum(axis=1, keepdims=True)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            log_ratio = np.log(good) - np.log(bad)
+        
+        rows = np.empty((n, len(radices)), dtype=np.int64)
+        todo = np.arange(n)
+        for _ in range(attempts):
+            candidates = np.empty((len(todo) * self.num_candidates, len(radices)), dtype=np.int64)
+            for dimension, radix in enumerate(radices):
+                candidates[:, dimension] = rng.choice(
+                    radix, size=len(candidates), p=good[dimension, :radix]
+                )
+            scores = log_ratio[self._dimensions, candidates].sum(axis=1)
+            scores[self._seen(candidates)] = -np.inf
+            scores = scores.reshape(len(todo), self.num_candidates)
+            groups = scores.argmax(axis=1)
+            best = candidates.reshape(len(todo), self.num_candidates, len(radices))[
+                np.arange(len(todo)), groups
+            ]
+            found = ~np.isneginf(scores[np.arange(len(todo)), groups])
+            rows[todo[found]] = best[found]
+            todo = todo[~found]
+            if len(todo) == 0:
+                return rows
+        rows[todo] = self._unobserved_rows(len(todo), rng)
+        return rows
+    
+    def _seen(self, rows: np.ndarray) -> np.ndarray:
+        """Boolean mask of the index rows already observed."""
+        fingerprints = self.space.fingerprints(rows).tolist()
+        return np.fromiter((fingerprint in self._observed for fingerprint in fingerprints),
+                           dtype=bool, count=len(fingerprints))
+    
+    def _unobserved_rows(self, n: int, rng: np.random.Generator, attempts: int = 8) -> np.ndarray:
+        """Uniform random rows, redrawn up to attempts times where already observed."""
+        radices = self.space.radices
+        rows = rng.integers(0, radices, size=(n, len(radices)))
+        for _ in range(attempts):
+            seen = self._seen(rows)
+            if not seen.any():
+                break
+            rows[seen] = rng.integers(0, radices, size=(int(seen.sum()), len(radices)))
+        return rows
+    
+    def _observe(self, indices: Tuple[int, ...], score: float, fingerprint: int):
+        """Add one observation to the good/bad split, ignoring repeats."""
+        if fingerprint in self._observed or score is None or math.isnan(score):
+            return
+        self._observed.add(fingerprint)
+        self._sequence += 1
+        if self._good and score > self._good[0][0]:
+            heapq.heappush(self._good, (score, self._sequence, indices))
+            self._good_counts[self._dimensions, indices] += 1
+        else:
+            heapq.heappush(self._bad, (-score, self._sequence, indices))
+            self._bad_counts[self._dimensions, indices] += 1
+        
+        # Rebalance so the good set holds the top gamma fraction
+        target = max(1, math.ceil(self.gamma * len(self._observed)))
+        while len(self._good) > target:
+            score, sequence, moved = heapq.heappop(self._good)
+            heapq.heappush(self._bad, (-score, sequence, moved))
+            self._good_counts[self._dimensions, moved] -= 1
+            self._bad_counts[self._dimensions, moved] += 1
+        while len(self._good) < target and self._bad:
+            negative, sequence, moved = heapq.heappop(self._bad)
+            heapq.heappush(self._good, (-negative, sequence, moved))
+            self._bad_counts[self._dimensions, moved] -= 1
+            self._good_counts[self._dimensions, moved] += 1
+    
+    def _absorb_best(self):
+        """Treat a best architecture received from another agent, and the
+        shared elites, as observations."""
+        best = self.best_architecture
+        if best is not None and best.score is not None:
+            indices = tuple(self._indices_of(best))
+            self._observe(indices, best.score, self.space.fingerprint(indices))
+        if self.archive is not None:
+            for score, fingerprint in self.archive.entries():
+                if fingerprint not in self._observed:
+                    self._observe(tuple(self.space.unpack(fingerprint)), score, fingerprint)
+
+
+class EvolutionarySearchAgent(Agent):
+    """
+    Agent that evolves a population of index vectors.
+    
+    The population holds the best distinct architectures seen so far. Each
+    generation is bred in NumPy: tournament selection picks two parents per
+    child, uniform crossover mixes them and every gene mutates with
+    probability mutation_rate (at least one per child, so children differ
+    from their parents). propose_architecture() hands out a buffered
+    generation one row at a time.
+    """
+    
+    def __init__(
+        self,
+        agent_id: int,
+        search_space: Union[Dict[str, List[Any]], SearchSpace],
+        population_size: int = 20,
+        tournament_size: int = 3,
+        crossover_rate: float = 0.9,
+        mutation_rate: Optional[float] = None
+    ):
+        """
+        Initialize an evolutionary agent.
+        
+        Args:
+            agent_id: Unique identifier for the agent
+            search_space: Dictionary defining the search space, or a SearchSpace
+            population_size: Architectures kept as parents, and the size of
+                a generation
+            tournament_size: Contestants per tournament selection
+            crossover_rate: Probability a child mixes two parents rather than
+                copying the first
+            mutation_rate: Per-gene mutation probability (defaults to one
+                over the number of dimensions)
+        """
+        super().__init__(agent_id, search_space)
+        num_dimensions = len(self.space.radices)
+        self.population_size = population_size
+        self.tournament_size = tournament_size
+        self.crossover_rate = crossover_rate
+        self.mutation_rate = 1 / max(num_dimensions, 1) if mutation_rate is None else mutation_rate
+        self._population = np.empty((0, num_dimensions), dtype=np.int64)
+        self._fitness = np.empty(0, dtype=np.float64)
+        self._pending = []
+    
+    def propose_architecture(self) -> Architecture:
+        """Return the next child of the current generation."""
+        if not self._pending:
+            self._pending = self.propose_generation().tolist()[::-1]
+        return Architecture.from_indices(self._pending.pop(), self.space)
+    
+    def propose_batch(self, n: int) -> np.ndarray:
+        """Breed n children in one vectorized call."""
+        self._absorb_best()
+        rng = self._batch_rng()
+        radices = np.array(self.space.radices)
+        num_dimensions = len(radices)
+        if len(self._fitness) < 2:
+            return rng.integers(0, radices, size=(n, num_dimensions))
+        
+        # Tournament selection: the fittest of tournament_size random members
+        contestants = rng.integers(0, len(self._fitness), size=(2, n, self.tournament_size))
+        winners = np.take_along_axis(
+            contestants, self._fitness[contestants].argmax(axis=2)[..., None], axis=2
+        )[..., 0]
+        first, second = self._population[winners[0]], self._population[winners[1]]
+        
+        # Uniform crossover
+        mix = (rng.random((n, num_dimensions)) < 0.5) & (rng.random(n) < self.crossover_rate)[:, None]
+        children = np.where(mix, second, first)
+        
+        # Multi-gene mutation, forcing one gene where none was drawn
+        mutate = rng.random((n, num_dimensions)) < self.mutation_rate
+        unmutated = np.flatnonzero(~mutate.any(axis=1))
+        mutate[unmutated, rng.integers(0, num_dimensions, size=len(unmutated))] = True
+        return np.where(mutate, rng.integers(0, radices, size=(n, num_dimensions)), children)
+    
+    def propose_generation(self) -> np.ndarray:
+        """Breed a whole generation of population_size children."""
+        return self.propose_batch(self.population_size)
+    
+    def update(self, architecture: Architecture, score: float):
+        """Update the agent and its population with new evaluation results."""
+        architecture.score = score
+        self.history.append(architecture)
+        
+        if self.best_architecture is None or score > self.best_architecture.score:
+            self.best_architecture = architecture
+        self._admit(np.array([self._indices_of(architecture)]), np.array([score], dtype=np.float64))
+    
+    def update_batch(self, indices: np.ndarray, scores: np.ndarray):
+        """Update the agent and its population with a batch of evaluation results."""
+        self._record_batch(indices, scores)
+        self._admit(np.asarray(indices), np.asarray(scores, dtype=np.float64))
+    
+    def share_knowledge(self, other_agent: 'Agent'):
+        """
+        Share knowledge with another agent.
+        
+        Besides the best architecture, another evolutionary agent receives
+        this agent's population as migrants.
+        """
+        super().share_knowledge(other_agent)
+        if isinstance(other_agent, EvolutionarySearchAgent):
+            other_agent._admit(self._population, self._fitness)
+    
+    def _admit(self, indices: np.ndarray, scores: np.ndarray):
+        """Merge candidates into the population, keeping the fittest distinct ones."""
+        keep = ~np.isnan(scores)
+        candidates = np.concatenate([self._population, indices[keep].astype(np.int64)])
+        fitness = np.concatenate([self._fitness, scores[keep]])
+        _, first = np.unique(self.space.fingerprints(candidates), return_index=True)
+        candidates, fitness = candidates[first], fitness[first]
+        if len(fitness) > self.population_size:
+            fittest = np.argpartition(-fitness, self.population_size - 1)[:self.population_size]
+            candidates, fitness = candidates[fittest], fitness[fittest]
+        self._population, self._fitness = candidates, fitness
+    
+    def _absorb_best(self):
+        """Add a best architecture received from another agent, and the shared
+        elites, to the population."""
+        best = self.best_architecture
+        if best is not None and best.score is not None:
+            self._admit(np.array([self._indices_of(best)]), np.array([best.score], dtype=np.float64))
+        if self.archive is not None and len(self.archive):
+            self._admit(self.archive.indices(), self.archive.scores())
+
+
+AGENT_TYPES = {
+    'random': RandomSearchAgent,
+    'greedy': GreedySearchAgent,
+    'tpe': TPESearchAgent,
+    'evolutionary': EvolutionarySearchAgent,
+}
 
 
 class MultiAgentSearchCoordinator:
@@ -137,9 +1300,24 @@ class MultiAgentSearchCoordinator:
     def __init__(
         self,
         search_space: Dict[str, List[Any]],
-        evaluation_fn: Callable[[Dict[str, Any]], float],
+        evaluation_fn: Optional[Callable[[Dict[str, Any]], float]],
         num_agents: int = 4,
-        agent_types: Optional[List[str]] = None
+        agent_types: Optional[List[str]] = None,
+        executor: Union[str, Executor] = 'serial',
+        max_workers: Optional[int] = None,
+        cache: Optional[Union[str, EvaluationCache]] = None,
+        proposal_retries: int = 0,
+        exhaustion_fraction: float = 0.9,
+        batch_evaluation_fn: Optional[Callable[[ConfigBatch], Sequence[float]]] = None,
+        batch_size: int = 1,
+        profile: Union[bool, SearchProfiler] = False,
+        topology: Union[str, Topology] = 'random',
+        elite_archive_size: int = 0,
+        history_policy: str = 'unbounded',
+        history_size: Optional[int] = None,
+        evaluation_timeout: Optional[float] = None,
+        max_retries: int = 0,
+        failure_score: Optional[float] = None
     ):
         """
         Initialize the coordinator.
@@ -148,11 +1326,71 @@ class MultiAgentSearchCoordinator:
             search_space: Dictionary defining the search space
             evaluation_fn: Function to evaluate architecture performance
             num_agents: Number of agents to use
-            agent_types: List of agent type names ('random' or 'greedy')
+            agent_types: List of agent type names (keys of AGENT_TYPES:
+                'random', 'greedy', 'tpe' or 'evolutionary')
+            executor: How proposals of one iteration are evaluated: 'serial',
+                'thread', 'process' or an existing concurrent.futures.Executor.
+                The 'process' and 'isolated' backends require a picklable
+                (module-level) evaluation_fn.
+            max_workers: Worker count for the 'thread', 'process' and
+                'isolated' backends
+            cache: Evaluation cache, or a path to an SQLite file to open one.
+                Cached scores are reused instead of calling evaluation_fn or
+                batch_evaluation_fn.
+            proposal_retries: How many times an agent may re-propose in
+                search() when its proposal was already evaluated (0 keeps the
+                original behaviour of skipping the agent for that iteration)
+            exhaustion_fraction: Once this fraction of the search space has
+                been evaluated, retries draw directly from unvisited configs
+            batch_evaluation_fn: Vectorized scorer taking a ConfigBatch and
+                returning one score per row. When given, search() routes each
+                whole iteration through it (and evaluation_fn may be None)
+            batch_size: Proposals per agent per iteration in batched mode
+            profile: True (or a SearchProfiler with hooks attached) to time
+                the propose, fingerprint, evaluate, update and communicate
+                phases; the summary is reported by get_statistics()
+            topology: Who shares knowledge with whom: 'random' (the original
+                O(n^2) scheme), 'ring', 'k_regular', 'star', 'island' or a
+                topologies.Topology instance
+            elite_archive_size: Keep a shared EliteArchive of this many top
+                architectures that agents read when proposing (0 disables it)
+            history_policy: How much of each agent's history is kept: one of
+                HISTORY_POLICIES ('unbounded', 'ring', 'top_k' or 'spill')
+            history_size: Row limit for the bounded history policies
+            evaluation_timeout: Seconds an evaluation may run, counted from
+                when a worker starts it rather than when it is queued. The
+                'isolated' backend kills the worker process of a runaway
+                evaluation; 'thread' and 'process' stop waiting for it but
+                cannot reclaim the worker, and 'serial' cannot enforce it.
+                Not supported together with batch_evaluation_fn.
+            max_retries: Extra attempts for an evaluation (or, in batched
+                mode, a whole batch) that raised or timed out
+            failure_score: Score recorded for an evaluation that still fails
+                after its retries, instead of aborting the search (None
+                re-raises the error). Failure scores are never cached.
         """
+        if evaluation_fn is None and batch_evaluation_fn is None:
+            raise ValueError("Either evaluation_fn or batch_evaluation_fn is required")
+        if batch_evaluation_fn is not None and evaluation_timeout is not None:
+            raise ValueError("evaluation_timeout cannot be enforced on batch_evaluation_fn")
+        if isinstance(executor, str) and executor not in EXECUTOR_TYPES:
+            raise ValueError(
+                f"Unknown executor '{executor}', expected one of {EXECUTOR_TYPES} "
+                f"or a concurrent.futures.Executor"
+            )
+        if isinstance(topology, str) and topology not in TOPOLOGIES:
+            raise ValueError(
+                f"Unknown topology '{topology}', expected one of {tuple(TOPOLOGIES)} "
+                f"or a Topology instance"
+            )
+        
         self.search_space = search_space
         self.evaluation_fn = evaluation_fn
         self.num_agents = num_agents
+        self.executor = executor
+        self.max_workers = max_workers
+        self.cache = EvaluationCache(cache) if isinstance(cache, str) else cache
+        self.space = SearchSpace(search_space)
         
         # Initialize agents
         self.agents = []
@@ -163,76 +1401,941 @@ class MultiAgentSearchCoordinator:
         
         for i in range(num_agents):
             agent_type = agent_types[i] if i < len(agent_types) else 'random'
-            if agent_type == 'greedy':
-                agent = GreedySearchAgent(i, search_space)
-            else:
-                agent = RandomSearchAgent(i, search_space)
+            agent_class = AGENT_TYPES.get(agent_type, RandomSearchAgent)
+            agent = agent_class(i, self.space)
+            if history_policy != 'unbounded':
+                agent.history = ArchitectureHistory(
+                    self.space, policy=history_policy, max_size=history_size
+                )
             self.agents.append(agent)
         
+        self.archive = None
+        if elite_archive_size:
+            self.archive = EliteArchive(self.space, elite_archive_size)
+            for agent in self.agents:
+                agent.archive = self.archive
+        
         self.best_architecture = None
         self.evaluated_architectures = set()
         self.iteration = 0
+        
+        self.proposal_retries = proposal_retries
+        self.exhaustion_fraction = exhaustion_fraction
+        self.num_proposals = 0
+        self.num_unique_proposals = 0
+        # (proposals, unique proposals) of every search() iteration
+        self.proposal_history: List[Tuple[int, int]] = []
+        self.batch_evaluation_fn = batch_evaluation_fn
+        self.batch_size = batch_size
+        self._unvisited = None
+        self._unvisited_positions = None
+        
+        self._checkpoint = None
+        self._events = None
+        self.budget_spent = 0.0
+        self.evaluation_timeout = evaluation_timeout
+        self.max_retries = max_retries
+        self.failure_score = failure_score
+        self.num_failed_evaluations = 0
+        self.num_retries = 0
+        self.num_timeouts = 0
+        self.topology = TOPOLOGIES[topology]() if isinstance(topology, str) else topology
+        
+        self.profiler = SearchProfiler() if profile is True else (profile or None)
+        if self.profiler is not None:
+            # Shadow the bound method so fingerprinting is only timed when profiling
+            self.space.fingerprint = self.profiler.timed('fingerprint', self.space.fingerprint)
     
     def search(
         self,
         num_iterations: int = 100,
         communication_interval: int = 10,
-        verbose: bool = True
+        verbose: bool = True,
+        checkpoint: Optional[str] = None,
+        checkpoint_interval: int = 10,
+        resume_from: Optional[str] = None,
+        event_log: Optional[str] = None
     ) -> Architecture:
         """
         Run the multi-agent search process.
         
+        All proposals of an iteration are evaluated together on the configured
+        executor and fed back to the agents in agent order, so for a fixed
+        random seed and a deterministic evaluation_fn every executor backend
+        produces the same search trajectory.
+        
         Args:
             num_iterations: Number of search iterations
             communication_interval: How often agents share knowledge
             verbose: Whether to print progress
+            checkpoint: Directory to write checkpoints to (defaults to
+                resume_from when resuming)
+            checkpoint_interval: Iterations between checkpoints
+            resume_from: Checkpoint directory to resume from. The search
+                continues after the last checkpointed iteration up to
+                num_iterations, with the same random stream as an
+                uninterrupted run.
+            event_log: JSON Lines file to append every event of
+                iter_search() to while the search runs
         
         Returns:
             Best architecture found
         """
-        for iteration in range(num_iterations):
-            self.iteration = iteration
-            
-            # Each agent proposes and evaluates an architecture
-            for agent in self.agents:
-                architecture = agent.propose_architecture()
+        log = EventLog(event_log) if event_log is not None else None
+        try:
+            for event in self.iter_search(
+                num_iterations=num_iterations,
+                communication_interval=communication_interval,
+                verbose=verbose,
+                checkpoint=checkpoint,
+                checkpoint_interval=checkpoint_interval,
+                resume_from=resume_from,
+                evaluations=log is not None
+            ):
+                if log is not None:
+                    log.write(event)
+        finally:
+            if log is not None:
+                log.close()
+        
+        return self.best_architecture
+    
+    def iter_search(
+        self,
+        num_iterations: int = 100,
+        communication_interval: int = 10,
+        verbose: bool = False,
+        checkpoint: Optional[str] = None,
+        checkpoint_interval: int = 10,
+        resume_from: Optional[str] = None,
+        evaluations: bool = True
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Run search() as a generator of event dictionaries.
+        
+        Every event has an 'event' type:
+        
+        - 'evaluation': iteration, agent_id, fingerprint, score and
+          batch_seconds (wall time of the evaluation batch it came from)
+        - 'new_best': iteration, agent_id, fingerprint and score
+        - 'communication' and 'checkpoint': iteration
+        - 'iteration': iteration, evaluations, proposals, unique_proposals,
+          best_score and seconds
+        - 'end': best_score, best_fingerprint and num_evaluated
+        
+        Events of an iteration are yielded once it is complete, so the
+        search state seen by the consumer is always consistent. Closing the
+        generator stops the search and releases its executor.
+        
+        Args:
+            num_iterations, communication_interval, verbose, checkpoint,
+            checkpoint_interval, resume_from: As for search()
+            evaluations: Whether to emit per-evaluation events; iteration
+                summaries are always emitted
+        
+        Yields:
+            Event dictionaries
+        """
+        start_iteration = 0
+        if checkpoint is None:
+            checkpoint = resume_from
+        self._checkpoint = SearchCheckpoint(checkpoint) if checkpoint is not None else None
+        if resume_from is not None:
+            restored = SearchCheckpoint(resume_from)
+            last_iteration, records = restored.restore(self)
+            start_iteration = last_iteration + 1
+            if checkpoint == resume_from:
+                self._checkpoint = restored
+            else:
+                # A new checkpoint directory needs the full journal
+                for record in records:
+                    self._checkpoint.record(*record)
+            if verbose:
+                print(f"Resumed from {resume_from} at iteration {start_iteration}")
+        elif self._checkpoint is not None:
+            self._checkpoint.reset()
+        
+        executor = self._create_executor()
+        try:
+            for iteration in range(start_iteration, num_iterations):
+                self.iteration = iteration
+                started = time.perf_counter()
+                evaluated = len(self.evaluated_architectures)
+                proposed, unique = self.num_proposals, self.num_unique_proposals
+                self._events = [] if evaluations else None
                 
-                # Skip if already evaluated
-                if architecture.id in self.evaluated_architectures:
-                    continue
+                if self.batch_evaluation_fn is not None:
+                    self._run_batched_iteration(iteration, verbose)
+                else:
+                    self._run_iteration(executor, iteration, verbose)
+                events, self._events = self._events or [], None
+                proposed = self.num_proposals - proposed
+                unique = self.num_unique_proposals - unique
+                self.proposal_history.append((proposed, unique))
                 
-                # Evaluate architecture
-                score = self.evaluation_fn(architecture.config)
-                agent.update(architecture, score)
-                self.evaluated_architectures.add(architecture.id)
+                # Agents share knowledge periodically
+                if (iteration + 1) % communication_interval == 0:
+                    self._communicate(iteration=iteration)
+                    events.append({'event': 'communication', 'iteration': iteration})
+                    if verbose and self.best_architecture is not None:
+                        print(f"Iteration {iteration}: Agents shared knowledge. "
+                              f"Best score: {self.best_architecture.score:.4f}")
                 
-                # Update global best
-                if self.best_architecture is None or score > self.best_architecture.score:
-                    self.best_architecture = architecture
-                    if verbose:
-                        print(f"Iteration {iteration}, Agent {agent.agent_id}: "
-                              f"New best architecture with score {score:.4f}")
+                if self._checkpoint is not None and (
+                    (iteration + 1) % checkpoint_interval == 0 or iteration == num_iterations - 1
+                ):
+                    self._checkpoint.save(self, iteration)
+                    events.append({'event': 'checkpoint', 'iteration': iteration})
+                
+                events.append({
+                    'event': 'iteration',
+                    'iteration': iteration,
+                    'evaluations': len(self.evaluated_architectures) - evaluated,
+                    'proposals': proposed,
+                    'unique_proposals': unique,
+                    'best_score': (
+                        self.best_architecture.score if self.best_architecture else None
+                    ),
+                    'seconds': time.perf_counter() - started,
+                })
+                yield from events
             
-            # Agents share knowledge periodically
-            if (iteration + 1) % communication_interval == 0:
-                self._facilitate_communication()
+            yield {
+                'event': 'end',
+                'best_score': self.best_architecture.score if self.best_architecture else None,
+                'best_fingerprint': self.best_architecture.id if self.best_architecture else None,
+                'num_evaluated': len(self.evaluated_architectures),
+            }
+        finally:
+            self._events = None
+            self._release_executor(executor)
+            self._checkpoint = None
+    
+    def _run_iteration(self, executor: Optional[Executor], iteration: int, verbose: bool):
+        """Propose, evaluate and update one architecture per agent."""
+        profiler = self.profiler
+        
+        # Each agent proposes an architecture, skipping already evaluated ones
+        if profiler is not None:
+            started = profiler.start('propose', iteration=iteration)
+        proposals = []
+        for agent in self.agents:
+            architecture = self._propose_unique(agent, self.proposal_retries)
+            if architecture is None:
+                continue
+            self._mark_evaluated(architecture.id)
+            proposals.append((agent, architecture))
+        if profiler is not None:
+            profiler.stop('propose', started, iteration=iteration, proposals=proposals)
+            started = profiler.start('evaluate', iteration=iteration, proposals=proposals)
+        
+        # Evaluate all proposals of this iteration at once
+        evaluate_started = time.perf_counter()
+        scores = self._evaluate_batch(
+            executor, [architecture.config for _, architecture in proposals]
+        )
+        batch_seconds = time.perf_counter() - evaluate_started
+        if profiler is not None:
+            profiler.stop('evaluate', started, iteration=iteration, proposals=proposals,
+                          scores=scores)
+            profiler.count('evaluations', len(scores))
+            started = profiler.start('update', iteration=iteration)
+        
+        # Feed results back in agent order so every backend behaves the same
+        for (agent, architecture), score in zip(proposals, scores):
+            agent.update(architecture, score)
+            if self.archive is not None:
+                self.archive.add(architecture)
+            if self._checkpoint is not None:
+                self._checkpoint.record(agent.agent_id, architecture.id, score)
+            if self._events is not None:
+                self._events.append({
+                    'event': 'evaluation', 'iteration': iteration, 'agent_id': agent.agent_id,
+                    'fingerprint': architecture.id, 'score': float(score),
+                    'batch_seconds': batch_seconds,
+                })
+        
+            # Update global best
+            if self.best_architecture is None or score > self.best_architecture.score:
+                self.best_architecture = architecture
+                if self._events is not None:
+                    self._events.append({
+                        'event': 'new_best', 'iteration': iteration, 'agent_id': agent.agent_id,
+                        'fingerprint': architecture.id, 'score': float(score),
+                    })
                 if verbose:
-                    print(f"Iteration {iteration}: Agents shared knowledge. "
-                          f"Best score: {self.best_architecture.score:.4f}")
+                    print(f"Iteration {iteration}, Agent {agent.agent_id}: "
+                          f"New best architecture with score {score:.4f}")
+        if profiler is not None:
+            profiler.stop('update', started, iteration=iteration)
+    
+    def _run_batched_iteration(self, iteration: int, verbose: bool):
+        """Route a whole iteration of batch proposals through batch_evaluation_fn."""
+        profiler = self.profiler
+        if profiler is not None:
+            started = profiler.start('propose', iteration=iteration)
+        owners = []
+        blocks = []
+        for agent in self.agents:
+            indices = np.asarray(agent.propose_batch(self.batch_size))
+            fingerprints = self.space.fingerprints(indices).tolist()
+            self.num_proposals += len(fingerprints)
+            
+            # Keep the first occurrence of every config nobody evaluated yet
+            keep = []
+            for row, fingerprint in enumerate(fingerprints):
+                if fingerprint not in self.evaluated_architectures:
+                    self._mark_evaluated(fingerprint)
+                    keep.append(row)
+            self.num_unique_proposals += len(keep)
+            owners.append((agent, len(keep)))
+            blocks.append(indices[keep])
+        
+        indices = np.concatenate(blocks)
+        if profiler is not None:
+            profiler.stop('propose', started, iteration=iteration, indices=indices)
+        if len(indices) == 0:
+            return
+        
+        if profiler is not None:
+            started = profiler.start('evaluate', iteration=iteration, indices=indices)
+        evaluate_started = time.perf_counter()
+        scores = self._score_batch(indices)
+        batch_seconds = time.perf_counter() - evaluate_started
+        if profiler is not None:
+            profiler.stop('evaluate', started, iteration=iteration, indices=indices,
+                          scores=scores)
+            profiler.count('evaluations', len(scores))
+            started = profiler.start('update', iteration=iteration)
+        
+        # Feed results back in agent order
+        start = 0
+        for agent, count in owners:
+            agent.update_batch(indices[start:start + count], scores[start:start + count])
+            start += count
+        if self.archive is not None:
+            self.archive.add_batch(indices, scores)
+        if self._checkpoint is not None or self._events is not None:
+            fingerprints = self.space.fingerprints(indices).tolist()
+            owner_ids = [agent.agent_id for agent, count in owners for _ in range(count)]
+            for agent_id, fingerprint, score in zip(owner_ids, fingerprints, scores.tolist()):
+                if self._checkpoint is not None:
+                    self._checkpoint.record(agent_id, fingerprint, score)
+                if self._events is not None:
+                    self._events.append({
+                        'event': 'evaluation', 'iteration': iteration, 'agent_id': agent_id,
+                        'fingerprint': fingerprint, 'score': score,
+                        'batch_seconds': batch_seconds,
+                    })
+        if profiler is not None:
+            profiler.stop('update', started, iteration=iteration)
+        
+        best = int(np.argmax(scores))
+        if self.best_architecture is None or scores[best] > self.best_architecture.score:
+            self.best_architecture = Architecture.from_indices(
+                indices[best].tolist(), self.space, float(scores[best])
+            )
+            if self._events is not None:
+                owner = np.searchsorted(np.cumsum([count for _, count in owners]), best, side='right')
+                self._events.append({
+                    'event': 'new_best', 'iteration': iteration,
+                    'agent_id': owners[owner][0].agent_id,
+                    'fingerprint': self.best_architecture.id, 'score': float(scores[best]),
+                })
+            if verbose:
+                print(f"Iteration {iteration}: New best architecture with score "
+                      f"{scores[best]:.4f}")
+    
+    def search_steady_state(
+        self,
+        max_evaluations: int = 400,
+        communication_every: Optional[int] = None,
+        communication_seconds: Optional[float] = None,
+        max_proposal_attempts: int = 10,
+        verbose: bool = True
+    ) -> Architecture:
+        """
+        Run the search without a per-iteration barrier.
+        
+        Every agent keeps one evaluation in flight and proposes again as soon
+        as its own result comes back, so fast configurations are not held up
+        by slow ones. Failed evaluations are retried and scored as in
+        search(); evaluation_timeout is only enforced by the 'isolated'
+        backend here. Knowledge sharing is scheduled by evaluation count and/or
+        wall-clock time instead of iterations. Completion order depends on
+        evaluation timing, so runs are not reproducible across backends.
+        
+        Args:
+            max_evaluations: Total number of evaluations to run
+            communication_every: Share knowledge after this many completed
+                evaluations (defaults to 10 rounds' worth when no time
+                schedule is given)
+            communication_seconds: Share knowledge after this many seconds
+            max_proposal_attempts: Proposals an agent may make per submission
+                before it idles because everything it proposes was seen
+            verbose: Whether to print progress
+        
+        Returns:
+            Best architecture found
+        """
+        if communication_every is None and communication_seconds is None:
+            communication_every = 10 * self.num_agents
+        
+        executor = self._create_executor()
+        pending = {}
+        idle = []
+        submitted = 0
+        completed = 0
+        evaluations_since_sharing = 0
+        last_sharing = time.monotonic()
+        
+        profiler = self.profiler
+        
+        def submit(agent: Agent) -> bool:
+            nonlocal submitted
+            if profiler is not None:
+                started = profiler.start('propose', agent=agent)
+            architecture = self._propose_unique(agent, max_proposal_attempts - 1)
+            if profiler is not None:
+                profiler.stop('propose', started, agent=agent, architecture=architecture)
+            if architecture is None:
+                return False
+            self._mark_evaluated(architecture.id)
+            future, cached = self._submit_evaluation(executor, architecture.config)
+            pending[future] = (agent, architecture, cached, 0)
+            submitted += 1
+            return True
+        
+        try:
+            for agent in self.agents:
+                if submitted >= max_evaluations or not submit(agent):
+                    idle.append(agent)
+            
+            while pending:
+                # In this mode 'evaluate' measures time spent waiting for results
+                if profiler is not None:
+                    started = profiler.start('evaluate', in_flight=len(pending))
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                if profiler is not None:
+                    profiler.stop('evaluate', started, completed=len(done))
+                    profiler.count('evaluations', len(done))
+                
+                for future in done:
+                    agent, architecture, cached, attempt = pending.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        if isinstance(error, EvaluationTimeout):
+                            self.num_timeouts += 1
+                        if attempt < self.max_retries:
+                            self.num_retries += 1
+                            retry, _ = self._submit_evaluation(executor, architecture.config)
+                            pending[retry] = (agent, architecture, False, attempt + 1)
+                            continue
+                        if self.failure_score is None:
+                            raise error
+                        self.num_failed_evaluations += 1
+                        score = self.failure_score
+                    else:
+                        score = future.result()
+                        if self.cache is not None and not cached:
+                            self.cache.put(architecture.config, score)
+                    if profiler is not None:
+                        started = profiler.start('update', agent=agent)
+                    agent.update(architecture, score)
+                    if self.archive is not None:
+                        self.archive.add(architecture)
+                    if profiler is not None:
+                        profiler.stop('update', started, agent=agent, score=score)
+                    completed += 1
+                    evaluations_since_sharing += 1
+                    self.iteration = (completed - 1) // self.num_agents
+                    
+                    # Update global best
+                    if self.best_architecture is None or score > self.best_architecture.score:
+                        self.best_architecture = architecture
+                        if verbose:
+                            print(f"Evaluation {completed}, Agent {agent.agent_id}: "
+                                  f"New best architecture with score {score:.4f}")
+                    idle.append(agent)
+                
+                # Agents share knowledge on the evaluation-count or time schedule
+                due_by_count = (communication_every is not None
+                                and evaluations_since_sharing >= communication_every)
+                due_by_time = (communication_seconds is not None
+                               and time.monotonic() - last_sharing >= communication_seconds)
+                if due_by_count or due_by_time:
+                    self._communicate(evaluation=completed)
+                    evaluations_since_sharing = 0
+                    last_sharing = time.monotonic()
+                    if verbose:
+                        print(f"Evaluation {completed}: Agents shared knowledge. "
+                              f"Best score: {self.best_architecture.score:.4f}")
+                
+                # Hand work back to every agent that is waiting for it
+                waiting, idle = idle, []
+                for agent in waiting:
+                    if submitted >= max_evaluations or not submit(agent):
+                        idle.append(agent)
+        finally:
+            self._release_executor(executor)
         
         return self.best_architecture
     
+    def search_multi_fidelity(
+        self,
+        max_budget: float,
+        min_budget: float = 1,
+        eta: float = 3,
+        num_rounds: int = 1,
+        num_configs: Optional[int] = None,
+        communication_interval: int = 1,
+        verbose: bool = True
+    ) -> Architecture:
+        """
+        Run the search with successive halving or Hyperband.
+        
+        Here evaluation_fn is called as evaluation_fn(config, budget). Each
+        bracket starts agent proposals at a low budget and promotes the best
+        1/eta of every rung to an eta times larger budget, so only the most
+        promising configurations are evaluated at max_budget. Agents learn
+        from each configuration's score at the highest budget it reached;
+        the global best only considers full-budget scores. Budget-aware
+        results are cached under (config, budget).
+        
+        Args:
+            max_budget: Full evaluation budget (e.g. tour steps or max_tries)
+            min_budget: Smallest budget a configuration is evaluated with
+            eta: Promotion ratio between rungs
+            num_rounds: Hyperband iterations (or successive halving brackets
+                when num_configs is given)
+            num_configs: Run plain successive halving starting this many
+                configurations per bracket instead of Hyperband
+            communication_interval: Brackets between knowledge sharing
+            verbose: Whether to print progress
+        
+        Returns:
+            Best full-budget architecture found
+        """
+        if self.evaluation_fn is None:
+            raise ValueError("search_multi_fidelity requires an evaluation_fn taking a budget")
+        if num_configs is not None:
+            brackets = [successive_halving_rungs(num_configs, min_budget, max_budget, eta)]
+        else:
+            brackets = hyperband_brackets(min_budget, max_budget, eta)
+        
+        profiler = self.profiler
+        executor = self._create_executor()
+        bracket_number = 0
+        try:
+            for _ in range(num_rounds):
+                for rungs in brackets:
+                    self.iteration = bracket_number
+                    
+                    # Agents take turns proposing the bracket's configurations
+                    if profiler is not None:
+                        started = profiler.start('propose', iteration=bracket_number)
+                    candidates = []
+                    for position in range(rungs[0][0]):
+                        agent = self.agents[position % self.num_agents]
+                        architecture = self._propose_unique(agent, self.proposal_retries)
+                        if architecture is None:
+                            continue
+                        self._mark_evaluated(architecture.id)
+                        candidates.append((agent, architecture))
+                    if profiler is not None:
+                        profiler.stop('propose', started, iteration=bracket_number,
+                                      proposals=candidates)
+                    
+                    for rung, (_, budget) in enumerate(rungs):
+                        if not candidates:
+                            break
+                        if profiler is not None:
+                            started = profiler.start('evaluate', iteration=bracket_number,
+                                                     proposals=candidates, budget=budget)
+                        scores = self._evaluate_batch(
+                            executor, [architecture.config for _, architecture in candidates],
+                            budget=budget
+                        )
+                        self.budget_spent += budget * len(candidates)
+                        if profiler is not None:
+                            profiler.stop('evaluate', started, iteration=bracket_number,
+                                          proposals=candidates, scores=scores, budget=budget)
+                            profiler.count('evaluations', len(scores))
+                        
+                        # Stable sort keeps agent order among equal scores
+                        order = sorted(range(len(candidates)), key=lambda i: -scores[i])
+                        final = rung == len(rungs) - 1
+                        keep = len(candidates) if final else min(rungs[rung + 1][0], len(candidates))
+                        
+                        if profiler is not None:
+                            started = profiler.start('update', iteration=bracket_number)
+                        for i in sorted(order[keep:]) if not final else range(len(candidates)):
+                            agent, architecture = candidates[i]
+                            agent.update(architecture, scores[i])
+                            if final and self.archive is not None:
+                                self.archive.add(architecture)
+                        if final:
+                            best = order[0]
+                            if self.best_architecture is None or scores[best] > self.best_architecture.score:
+                                self.best_architecture = candidates[best][1]
+                                if verbose:
+                                    print(f"Bracket {bracket_number}, "
+                                          f"Agent {candidates[best][0].agent_id}: New best "
+                                          f"architecture with score {scores[best]:.4f} "
+                                          f"at budget {budget:g}")
+                        if profiler is not None:
+                            profiler.stop('update', started, iteration=bracket_number)
+                        candidates = [candidates[i] for i in sorted(order[:keep])]
+                    
+                    if (bracket_number + 1) % communication_interval == 0:
+                        self._communicate(iteration=bracket_number)
+                    bracket_number += 1
+        finally:
+            self._release_executor(executor)
+        
+        return self.best_architecture
+    
+    def _propose_unique(self, agent: Agent, retries: int) -> Optional[Architecture]:
+        """
+        Ask an agent for a proposal that has not been evaluated yet.
+        
+        Args:
+            agent: Agent to ask
+            retries: Extra proposals allowed after a duplicate
+        
+        Returns:
+            An unseen architecture, or None if the retry budget ran out
+        """
+        for attempt in range(retries + 1):
+            if attempt and len(self.evaluated_architectures) >= self.exhaustion_fraction * len(self.space):
+                # Nearly exhausted: rejection sampling would mostly miss
+                architecture = self._sample_unvisited()
+                if architecture is None:
+                    return None
+            else:
+                architecture = agent.propose_architecture()
+                if architecture.space is not self.space:
+                    # Custom agents may build Architecture(config), whose id is
+                    # a content digest; dedup, journal and events key on fingerprints
+                    architecture = Architecture(architecture.config, architecture.score, self.space)
+            self.num_proposals += 1
+            if architecture.id not in self.evaluated_architectures:
+                self.num_unique_proposals += 1
+                return architecture
+        return None
+    
+    def _sample_unvisited(self) -> Optional[Architecture]:
+        """Draw a random architecture that has not been evaluated yet."""
+        if self._unvisited is None:
+            self._unvisited = [
+                fingerprint for fingerprint in range(len(self.space))
+                if fingerprint not in self.evaluated_architectures
+            ]
+            self._unvisited_positions = {
+                fingerprint: position for position, fingerprint in enumerate(self._unvisited)
+            }
+        if not self._unvisited:
+            return None
+        fingerprint = random.choice(self._unvisited)
+        return Architecture.from_indices(self.space.unpack(fingerprint), self.space)
+    
+    def _mark_evaluated(self, architecture_id: int):
+        """Add an id to the seen-set, keeping the unvisited pool in sync."""
+        self.evaluated_architectures.add(architecture_id)
+        if self._unvisited is not None:
+            position = self._unvisited_positions.pop(architecture_id, None)
+            if position is not None:
+                # Swap-remove keeps deletion O(1)
+                last = self._unvisited.pop()
+                if position < len(self._unvisited):
+                    self._unvisited[position] = last
+                    self._unvisited_positions[last] = position
+    
+    def _submit_evaluation(
+        self,
+        executor: Optional[Executor],
+        config: Dict[str, Any]
+    ) -> Tuple[Future, bool]:
+        """
+        Start evaluating one configuration.
+        
+        Returns:
+            The future holding its score and whether it was served from cache
+        """
+        future = Future()
+        if self.cache is not None:
+            score = self.cache.get(config)
+            if score is not None:
+                future.set_result(score)
+                return future, True
+        if executor is not None:
+            return executor.submit(self.evaluation_fn, config), False
+        try:
+            future.set_result(self.evaluation_fn(config))
+        except Exception as exc:
+            future.set_exception(exc)
+        return future, False
+    
+    def _create_executor(self) -> Optional[Executor]:
+        """Return the executor used to evaluate proposals (None for serial)."""
+        if isinstance(self.executor, Executor):
+            return self.executor
+        if self.executor == 'thread':
+            return ThreadPoolExecutor(max_workers=self.max_workers)
+        if self.executor == 'process':
+            return ProcessPoolExecutor(max_workers=self.max_workers)
+        if self.executor == 'isolated':
+            return IsolatedProcessExecutor(
+                max_workers=self.max_workers, timeout=self.evaluation_timeout
+            )
+        return None
+    
+    def _release_executor(self, executor: Optional[Executor]):
+        """Shut down an executor created by _create_executor()."""
+        if executor is None or executor is self.executor:
+            return
+        if self.evaluation_timeout is not None and not isinstance(executor, IsolatedProcessExecutor):
+            # Evaluations that timed out may still be running; do not wait for them
+            executor.shutdown(wait=False, cancel_futures=True)
+        else:
+            executor.shutdown()
+    
+    def _score_batch(self, indices: np.ndarray) -> np.ndarray:
+        """
+        Score rows of configuration indices with batch_evaluation_fn.
+        
+        Rows found in the cache are left out of the batch passed to
+        batch_evaluation_fn; fresh scores are written back to the cache.
+        """
+        if self.cache is None:
+            scores = self._run_batch_evaluation(indices)
+            return np.full(len(indices), self.failure_score) if scores is None else scores
+        
+        configs = ConfigBatch(indices, self.space).configs()
+        cached = self.cache.get_many(configs)
+        missing = [i for i, score in enumerate(cached) if score is None]
+        scores = np.array([np.nan if score is None else score for score in cached])
+        if missing:
+            fresh = self._run_batch_evaluation(indices[missing])
+            if fresh is None:
+                scores[missing] = self.failure_score
+            else:
+                scores[missing] = fresh
+                self.cache.put_many(zip([configs[i] for i in missing], fresh.tolist()))
+        return scores
+    
+    def _run_batch_evaluation(self, indices: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Call batch_evaluation_fn, retrying a batch that raised.
+        
+        Returns:
+            One score per row, or None if every attempt failed and a
+            failure_score is set (every row then counts as a failed evaluation)
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                return np.asarray(
+                    self.batch_evaluation_fn(ConfigBatch(indices, self.space)), dtype=np.float64
+                )
+            except Exception:
+                if attempt < self.max_retries:
+                    self.num_retries += 1
+                elif self.failure_score is None:
+                    raise
+        self.num_failed_evaluations += len(indices)
+        return None
+    
+    def _evaluate_batch(
+        self,
+        executor: Optional[Executor],
+        configs: List[Dict[str, Any]],
+        budget: Optional[float] = None
+    ) -> List[float]:
+        """
+        Evaluate a batch of configurations, preserving their order.
+        
+        Configurations found in the cache are not passed to evaluation_fn;
+        fresh scores are written back to the cache.
+        
+        Args:
+            executor: Executor to run evaluations on, or None to run serially
+            configs: Configurations to evaluate
+            budget: Budget passed as evaluation_fn(config, budget), or None
+                for plain evaluation_fn(config) calls
+        
+        Returns:
+            Scores in the same order as configs
+        """
+        if self.cache is None:
+            scores = self._run_evaluations(executor, configs, budget)
+            return [self.failure_score if score is None else score for score in scores]
+        
+        # Scores at different budgets are cached as different entries
+        keys = configs if budget is None else [
+            dict(config, __budget__=budget) for config in configs
+        ]
+        scores = self.cache.get_many(keys)
+        missing = [i for i, score in enumerate(scores) if score is None]
+        fresh = self._run_evaluations(executor, [configs[i] for i in missing], budget)
+        for i, score in zip(missing, fresh):
+            scores[i] = self.failure_score if score is None else score
+        self.cache.put_many(
+            (keys[i], score) for i, score in zip(missing, fresh) if score is not None
+        )
+        return scores
+    
+    def _run_evaluations(
+        self,
+        executor: Optional[Executor],
+        configs: List[Dict[str, Any]],
+        budget: Optional[float] = None
+    ) -> List[float]:
+        """
+        Call evaluation_fn on every configuration, preserving their order.
+        
+        With a timeout, retries or a failure score configured, evaluations go
+        through _run_guarded() and failed ones come back as None.
+        """
+        if (self.evaluation_timeout is not None or self.max_retries
+                or self.failure_score is not None):
+            return self._run_guarded(executor, configs, budget)
+        if budget is not None:
+            if executor is None:
+                return [self.evaluation_fn(config, budget) for config in configs]
+            return list(executor.map(self.evaluation_fn, configs, [budget] * len(configs)))
+        if executor is None:
+            return [self.evaluation_fn(config) for config in configs]
+        return list(executor.map(self.evaluation_fn, configs))
+    
+    def _run_guarded(
+        self,
+        executor: Optional[Executor],
+        configs: List[Dict[str, Any]],
+        budget: Optional[float] = None
+    ) -> List[Optional[float]]:
+        """
+        Evaluate configurations with timeouts, retries and failure capture.
+        
+        Returns:
+            Scores in the same order as configs, None where an evaluation
+            failed on every attempt
+        """
+        arguments = [(config,) if budget is None else (config, budget) for config in configs]
+        results = [None] * len(configs)
+        attempts = [0] * len(configs)
+        waiting = deque(range(len(configs)))
+        pending = {}
+        # The isolated pool enforces the timeout itself by killing the worker
+        enforce_deadline = (self.evaluation_timeout is not None and executor is not None
+                            and not isinstance(executor, IsolatedProcessExecutor))
+        # Submit no more than the pool runs at once, so queued tasks are not
+        # mistaken for running ones (ProcessPoolExecutor marks one extra call
+        # as running); the standard pools record their size as _max_workers
+        limit = getattr(executor, '_max_workers', None) if enforce_deadline else None
+        
+        def start(i: int):
+            if executor is None:
+                future = Future()
+                try:
+                    future.set_result(self.evaluation_fn(*arguments[i]))
+                except Exception as exc:
+                    future.set_exception(exc)
+            else:
+                future = executor.submit(self.evaluation_fn, *arguments[i])
+            # The clock starts once the executor reports the task running
+            pending[future] = (i, None)
+        
+        def fail(i: int, error: BaseException):
+            if isinstance(error, EvaluationTimeout):
+                self.num_timeouts += 1
+            attempts[i] += 1
+            if attempts[i] <= self.max_retries:
+                self.num_retries += 1
+                waiting.append(i)
+            elif self.failure_score is None:
+                raise error
+            else:
+                self.num_failed_evaluations += 1
+        
+        while waiting or pending:
+            while waiting and (limit is None or len(pending) < limit):
+                start(waiting.popleft())
+            
+            now = time.monotonic()
+            if enforce_deadline:
+                for future, (i, deadline) in pending.items():
+                    if deadline is None and future.running():
+                        pending[future] = (i, now + self.evaluation_timeout)
+            deadlines = [deadline for _, deadline in pending.values() if deadline is not None]
+            timeout = max(min(deadlines) - now, 0) if deadlines else None
+            if enforce_deadline and len(deadlines) < len(pending):
+                # Look again soon for tasks that have started in the meantime
+                timeout = DEADLINE_POLL_INTERVAL if timeout is None else min(
+                    timeout, DEADLINE_POLL_INTERVAL
+                )
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                i, _ = pending.pop(future)
+                error = future.exception()
+                if error is None:
+                    results[i] = future.result()
+                else:
+                    fail(i, error)
+            
+            now = time.monotonic()
+            for future, (i, deadline) in list(pending.items()):
+                if deadline is not None and now >= deadline:
+                    del pending[future]
+                    future.cancel()
+                    fail(i, EvaluationTimeout(
+                        f"Evaluation exceeded {self.evaluation_timeout} seconds"
+                    ))
+        return results
+    
+    def get_state(self) -> Dict[str, Any]:
+        """Snapshot coordinator-level search state for checkpointing."""
+        return {
+            'best_architecture': self.best_architecture,
+            'num_proposals': self.num_proposals,
+            'num_unique_proposals': self.num_unique_proposals,
+            'proposal_history': list(self.proposal_history),
+            'unvisited': self._unvisited,
+            'topology': self.topology,
+            'archive': self.archive,
+            'failures': (self.num_failed_evaluations, self.num_retries, self.num_timeouts),
+        }
+    
+    def set_state(self, state: Dict[str, Any]):
+        """Restore state produced by get_state()."""
+        self.best_architecture = state['best_architecture']
+        self.num_proposals = state['num_proposals']
+        self.num_unique_proposals = state['num_unique_proposals']
+        self.proposal_history = list(state['proposal_history'])
+        self._unvisited = state['unvisited']
+        self.topology = state['topology']
+        self.archive = state['archive']
+        self.num_failed_evaluations, self.num_retries, self.num_timeouts = state['failures']
+        for agent in self.agents:
+            agent.archive = self.archive
+        self._unvisited_positions = None
+        if self._unvisited is not None:
+            self._unvisited_positions = {
+                fingerprint: position for position, fingerprint in enumerate(self._unvisited)
+            }
+    
+    def _communicate(self, **context: Any):
+        """Run one knowledge-sharing round, timing it when profiling."""
+        if self.profiler is None:
+            self._facilitate_communication()
+            return
+        started = self.profiler.start('communicate', **context)
+        self._facilitate_communication()
+        self.profiler.stop('communicate', started, **context)
+    
     def _facilitate_communication(self):
         """Facilitate knowledge sharing between agents."""
-        # Each agent shares with a random subset of other agents
-        for agent in self.agents:
-            num_connections = random.randint(1, len(self.agents) - 1)
-            other_agents = random.sample(
-                [a for a in self.agents if a != agent],
-                num_connections
-            )
-            for other_agent in other_agents:
-                agent.share_knowledge(other_agent)
+        if len(self.agents) > 1:
+            self.topology.communicate(self.agents)
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get search statistics."""
@@ -246,7 +2349,26 @@ class MultiAgentSearchCoordinator:
             'best_config': self.best_architecture.config if self.best_architecture else None,
             'num_evaluated': len(self.evaluated_architectures),
             'agent_best_scores': agent_best_scores,
-            'iterations': self.iteration + 1
+            'iterations': self.iteration + 1,
+            'cache_hits': self.cache.hits if self.cache is not None else 0,
+            'cache_misses': self.cache.misses if self.cache is not None else 0,
+            'num_proposals': self.num_proposals,
+            'unique_proposals': self.num_unique_proposals,
+            'proposal_yield': (
+                self.num_unique_proposals / self.num_proposals if self.num_proposals else 0.0
+            ),
+            'proposals_per_iteration': list(self.proposal_history),
+            'proposal_yield_per_iteration': [
+                unique / proposed if proposed else 0.0
+                for proposed, unique in self.proposal_history
+            ],
+            'budget_spent': self.budget_spent,
+            'failed_evaluations': self.num_failed_evaluations,
+            'retries': self.num_retries,
+            'timeouts': self.num_timeouts,
+            'agent_statistics': [agent.history.stats.to_dict() for agent in self.agents],
+            'elite_scores': self.archive.scores().tolist() if self.archive is not None else None,
+            'profile': self.profiler.summary() if self.profiler is not None else None
         }
 
 
@@ -295,6 +2417,37 @@ def example_evaluation_function(config: Dict[str, Any]) -> float:
     return max(0, min(1, score))
 
 
+def example_batch_evaluation_function(batch: ConfigBatch) -> np.ndarray:
+    """
+    Vectorized version of example_evaluation_function.
+    
+    Scores a whole batch of configurations with array arithmetic instead of
+    one Python call per configuration.
+    
+    Args:
+        batch: Batch of neural network configurations
+    
+    Returns:
+        Simulated performance scores (0-1), one per configuration
+    """
+    num_layers = batch['num_layers'].astype(np.float64)
+    layer_size = batch['layer_size'].astype(np.float64)
+    learning_rate = batch['learning_rate'].astype(np.float64)
+    activation = batch['activation']
+    
+    score = np.full(len(batch), 0.5)
+    score += np.minimum(num_layers * 0.05, 0.2)
+    score += np.minimum(layer_size / 512, 0.15)
+    score -= np.minimum(np.abs(learning_rate - 0.01) * 10, 0.2)
+    score += np.where(activation == 'relu', 0.1, np.where(activation == 'tanh', 0.05, 0.0))
+    
+    # Add some random noise, drawn from the global random stream's seed
+    rng = np.random.default_rng(random.getrandbits(64))
+    score += rng.uniform(-0.05, 0.05, size=len(batch))
+    
+    return np.clip(score, 0, 1)
+
+
 if __name__ == "__main__":
     # Define search space
     search_space = {
@@ -0,0 +1,84 @@
+"""
+Multi-Fidelity Scheduling
+
+Budget schedules for successive halving and Hyperband. Many configurations
+are evaluated at a small budget (e.g. few tour steps or a low max_tries) and
+only the best 1/eta of each rung is promoted to the next, eta times larger,
+budget, so full-cost evaluations are reserved for promising configurations.
+"""
+
+import math
+from typing import List, Tuple
+
+
+# A rung is (number of configurations, budget per configuration)
+Rung = Tuple[int, float]
+
+
+def successive_halving_rungs(
+    num_configs: int,
+    min_budget: float,
+    max_budget: float,
+    eta: float = 3
+) -> List[Rung]:
+    """
+    Plan one successive halving bracket.
+
+    Args:
+        num_configs: Configurations evaluated at the lowest budget
+        min_budget: Budget of the first rung
+        max_budget: Budget of the last rung
+        eta: Promotion ratio between rungs
+
+    Returns:
+        Rungs from the lowest to the full budget
+    """
+    if not 0 < min_budget <= max_budget:
+        raise ValueError("Budgets must satisfy 0 < min_budget <= max_budget")
+    if eta <= 1:
+        raise ValueError("eta must be greater than 1")
+
+    num_rungs = int(math.floor(math.log(max_budget / min_budget, eta) + 1e-9)) + 1
+    rungs = []
+    for i in range(num_rungs):
+        count = max(int(num_configs / eta ** i), 1)
+        budget = round(max_budget * eta ** (i - num_rungs + 1), 9)
+        # Keep whole budgets integral so they can be used as step counts
+        rungs.append((count, int(budget) if budget == int(budget) else budget))
+    return rungs
+
+
+def hyperband_brackets(min_budget: float, max_budget: float, eta: float = 3) -> List[List[Rung]]:
+    """
+    Plan the brackets of one Hyperband iteration.
+
+    The most aggressive bracket starts many configurations at min_budget;
+    the most conservative one evaluates a few configurations at max_budget
+    only, which hedges against low budgets being misleading.
+
+    Args:
+        min_budget: Smallest budget any configuration is evaluated with
+        max_budget: Full budget
+        eta: Promotion ratio between rungs
+
+    Returns:
+        One list of rungs per bracket, most aggressive first
+    """
+    if not 0 < min_budget <= max_budget:
+        raise ValueError("Budgets must satisfy 0 < min_budget <= max_budget")
+    if eta <= 1:
+        raise ValueError("eta must be greater than 1")
+
+    s_max = int(math.floor(math.log(max_budget / min_budget, eta) + 1e-9))
+    brackets = []
+    for s in range(s_max, -1, -1):
+        num_configs = int(math.ceil((s_max + 1) / (s + 1) * eta ** s))
+        brackets.append(successive_halving_rungs(
+            num_configs, max_budget * eta ** -s, max_budget, eta
+        ))
+    return brackets
+
+
+def bracket_cost(rungs: List[Rung]) -> float:
+    """Total budget a bracket spends."""
+    return sum(count * budget for count, budget in rungs)
@@ -4,111 +4,216 @@ Spinebil Integration Example
 This module demonstrates how the multi-agent architecture search framework
 can be integrated with the spinebil package for projection pursuit optimization.
 
-This is a conceptual example showing potential integration points.
+The projection pursuit examples run real tours (guided_tour.py) with the
+batched indices of projection_indices.py on a planted-structure dataset;
+the diagnostic threshold example is still simulated.
 """
 
 from multi_agent_search import MultiAgentSearchCoordinator
+from dataset_context import DatasetContext, resolve_context
+from guided_tour import GuidedTour, subspace_overlap
+from projection_indices import covariance, orthonormalize, stringy_index_from_covariance
+import numpy as np
 import random
 
 
+# Define search space for projection pursuit
+PROJECTION_PURSUIT_SEARCH_SPACE = {
+    # Index selection
+    'index_function': ['holes', 'central_mass', 'lda', 'pda', 'stringy'],
+    
+    # Tour parameters
+    'tour_path': ['guided', 'little', 'grand'],
+    
+    # Optimization parameters
+    'cooling': ['linear', 'exponential', 'geometric'],
+    'max_tries': [10, 25, 50, 100],
+    
+    # Index-specific parameters
+    'alpha': [0.1, 0.25, 0.5, 0.75, 1.0],
+    'lambda': [0.0, 0.5, 1.0, 2.0],
+}
+
+
+# Planted-structure dataset the projection pursuit configurations are scored on
+PROJECTION_PURSUIT_OBSERVATIONS_PER_CLASS = 100
+_PROJECTION_PURSUIT_CONTEXT = None
+
+
+def projection_pursuit_context():
+    """
+    6-variable data with three classes in a hidden plane.
+    
+    The classes sit at the corners of a triangle in one plane, the other
+    four directions are Gaussian noise, and the variables are a random
+    rotation of these six directions. The basis of the planted plane is
+    kept in the context's metadata under 'planted'.
+    
+    Returns:
+        The DatasetContext shared by every evaluation of this dataset
+    """
+    global _PROJECTION_PURSUIT_CONTEXT
+    if _PROJECTION_PURSUIT_CONTEXT is None:
+        rng = np.random.default_rng(2025)
+        labels = np.repeat([0, 1, 2], PROJECTION_PURSUIT_OBSERVATIONS_PER_CLASS)
+        angles = labels * 2 * np.pi / 3
+        data = rng.normal(size=(len(labels), 6))
+        data[:, :2] = 0.5 * data[:, :2] + 2.5 * np.column_stack([np.cos(angles), np.sin(angles)])
+        
+        # Rotate so the plane is not axis-parallel
+        rotation = orthonormalize(rng.normal(size=(6, 6)))
+        _PROJECTION_PURSUIT_CONTEXT = DatasetContext(
+            data @ rotation, labels, metadata={'planted': rotation.T[:, :2]}
+        )
+    return _PROJECTION_PURSUIT_CONTEXT
+
+
+def evaluate_projection_config(config, context=None):
+    """
+    Evaluate a projection pursuit configuration with a real tour.
+    
+    Runs the configured tour (index function, tour path, cooling schedule,
+    max_tries, alpha as the initial step size and lambda as the pda penalty,
+    capped at 1) on the sphered data, as for a tourr guided tour, and scores
+    how much of the planted plane the best projection recovers, from 0
+    (orthogonal) to 1 (found exactly). The stringy index, which measures
+    variance, tours the unsphered data instead.
+    
+    Args:
+        config: Projection pursuit configuration
+        context: DatasetContext (in memory or over a memory-mapped file,
+            see DatasetContext.from_file) or SharedDataset with a 'planted'
+            basis in its metadata (the planted-structure dataset if omitted)
+    """
+    return evaluate_projection_config_at_budget(config, PROJECTION_TOUR_STEPS, context)
+
+
+# Full tour length used as the budget for multi-fidelity evaluation
+PROJECTION_TOUR_STEPS = 81
+
+
+def evaluate_projection_config_at_budget(config, budget, context=None):
+    """
+    Evaluate a projection pursuit configuration on a tour of at most budget rounds.
+    
+    Short tours stop before they converge, so their projections recover
+    less of the planted plane, but bad configurations are already
+    recognisable. The sphered data, group scatter and prepared index come
+    from the dataset context, so they are computed once per dataset.
+    """
+    context = resolve_context(context if context is not None else projection_pursuit_context())
+    name = config['index_function']
+    if name == 'stringy':
+        # Sphered data has the same variance in every direction, which would
+        # make the stringy index constant, so it tours the raw data
+        index = context.index(name, sphered=False)
+        planted = orthonormalize(context.metadata['planted'])
+    else:
+        params = {'lambda_': min(config['lambda'], 1.0)} if name == 'pda' else {}
+        index = context.index(name, **params)
+        planted = context.cached('planted_sphered', lambda: orthonormalize(
+            np.linalg.solve(context.whitening(), context.metadata['planted'])
+        ))
+    tour = GuidedTour(
+        index,
+        tour_path=config['tour_path'],
+        cooling=config['cooling'],
+        alpha=config['alpha'],
+        max_tries=config['max_tries'],
+        max_steps=max(int(budget), 1),
+        rng=np.random.default_rng(random.getrandbits(64))
+    )
+    return subspace_overlap(tour.run().basis, planted)
+
+
+# Search space over real 2D projection planes of 4-dimensional data: each
+# dimension is one coefficient of the two (unnormalized) basis vectors
+PROJECTION_BASIS_COEFFICIENTS = [-1.0, -0.5, 0.0, 0.5, 1.0]
+PROJECTION_BASIS_SEARCH_SPACE = {
+    f'{vector}{component}': PROJECTION_BASIS_COEFFICIENTS
+    for vector in ('u', 'v') for component in range(4)
+}
+
+
+def make_stringy_batch_evaluation(data):
+    """
+    Build a batch evaluation function scoring projection planes of data.
+    
+    The data covariance is computed once; every call then orthonormalizes
+    the proposed bases and scores them all with the stringy index in a
+    single vectorized pass.
+    """
+    covariance_matrix = covariance(data)
+    names = list(PROJECTION_BASIS_SEARCH_SPACE)
+    
+    def evaluate(batch):
+        columns = np.column_stack([batch[name] for name in names])
+        bases = orthonormalize(columns.reshape(len(columns), 2, -1).transpose(0, 2, 1))
+        return stringy_index_from_covariance(covariance_matrix, bases)
+    
+    return evaluate
+
+
+# Search space for diagnostic thresholds
+DIAGNOSTIC_THRESHOLD_SEARCH_SPACE = {
+    'convergence_threshold': [1e-6, 1e-5, 1e-4, 1e-3],
+    'min_structure_score': [0.1, 0.2, 0.3, 0.4, 0.5],
+    'outlier_percentile': [0.90, 0.95, 0.99],
+    'min_projection_distance': [0.01, 0.05, 0.1, 0.2],
+    'stability_window': [5, 10, 20, 30]
+}
+
+
+def evaluate_thresholds(config):
+    """Simulated evaluation of diagnostic thresholds"""
+    score = 0.5
+    
+    # Convergence threshold (moderate is best)
+    if config['convergence_threshold'] == 1e-4:
+        score += 0.15
+    elif config['convergence_threshold'] == 1e-5:
+        score += 0.12
+    
+    # Structure score (higher threshold = stricter)
+    if config['min_structure_score'] >= 0.3:
+        score += 0.1
+    
+    # Outlier detection
+    if config['outlier_percentile'] == 0.95:
+        score += 0.1
+    
+    # Projection distance
+    if 0.05 <= config['min_projection_distance'] <= 0.1:
+        score += 0.12
+    
+    # Stability window
+    if 10 <= config['stability_window'] <= 20:
+        score += 0.08
+    
+    score += random.uniform(-0.03, 0.03)
+    return max(0, min(1, score))
+
+
 def example_projection_pursuit_optimization():
     """
     Example: Using multi-agent search to optimize projection pursuit parameters
     
-    In a real spinebil integration, this would:
-    1. Use actual tourr package functions
-    2. Evaluate real projection indices on actual data
-    3. Optimize parameters for visualization quality
+    Every configuration is scored by evaluate_projection_config, which runs
+    the configured tour with the batched indices on the planted-structure
+    dataset. The score is the share of the hidden class plane that the best
+    projection recovers.
     """
     print("="*70)
     print("Spinebil Integration: Projection Pursuit Parameter Optimization")
     print("="*70 + "\n")
     
-    # Define search space for projection pursuit
-    search_space = {
-        # Index selection
-        'index_function': ['holes', 'central_mass', 'lda', 'pda', 'stringy'],
-        
-        # Tour parameters
-        'tour_path': ['guided', 'little', 'grand'],
-        
-        # Optimization parameters
-        'cooling': ['linear', 'exponential', 'geometric'],
-        'max_tries': [10, 25, 50, 100],
-        
-        # Index-specific parameters
-        'alpha': [0.1, 0.25, 0.5, 0.75, 1.0],
-        'lambda': [0.0, 0.5, 1.0, 2.0],
-    }
-    
-    def evaluate_projection_config(config):
-        """
-        Simulated evaluation of projection pursuit configuration.
-        
-        In real spinebil integration, this would:
-        - Apply the configuration to actual data
-        - Run projection pursuit with specified parameters
-        - Calculate diagnostic metrics (structure found, tour quality, etc.)
-        - Return composite score
-        
-        This simulation mimics realistic preferences:
-        - stringy and holes indices often perform well
-        - guided tour is generally effective
-        - exponential cooling balances speed and quality
-        - moderate alpha values work best
-        """
-        score = 0.5
-        
-        # Index function effectiveness (simulated)
-        index_scores = {
-            'stringy': 0.15,
-            'holes': 0.14,
-            'central_mass': 0.12,
-            'lda': 0.10,
-            'pda': 0.08
-        }
-        score += index_scores.get(config['index_function'], 0.05)
-        
-        # Tour path preference
-        if config['tour_path'] == 'guided':
-            score += 0.12
-        elif config['tour_path'] == 'grand':
-            score += 0.08
-        
-        # Cooling schedule
-        cooling_scores = {
-            'exponential': 0.10,
-            'geometric': 0.08,
-            'linear': 0.05
-        }
-        score += cooling_scores.get(config['cooling'], 0.0)
-        
-        # Max tries (more is better, but diminishing returns)
-        if config['max_tries'] >= 50:
-            score += 0.10
-        elif config['max_tries'] >= 25:
-            score += 0.07
-        
-        # Alpha parameter (moderate values best)
-        if 0.25 <= config['alpha'] <= 0.75:
-            score += 0.08
-        
-        # Lambda parameter
-        if 0.5 <= config['lambda'] <= 1.0:
-            score += 0.06
-        
-        # Add realistic noise
-        score += random.uniform(-0.04, 0.04)
-        
-        return max(0, min(1, score))
-    
     # Create multi-agent coordinator
     print("Initializing multi-agent search...")
     print(f"Search space: {5 * 3 * 3 * 4 * 5 * 4} = 3,600 possible configurations")
     print("Using 6 agents (mix of random and greedy)\n")
     
     coordinator = MultiAgentSearchCoordinator(
-        search_space=search_space,
+        search_space=PROJECTION_PURSUIT_SEARCH_SPACE,
         evaluation_fn=evaluate_projection_config,
         num_agents=6,
         agent_types=['random', 'random', 'greedy', 'greedy', 'greedy', 'greedy']
@@ -145,6 +250,68 @@ def example_projection_pursuit_optimization():
     return best, coordinator
 
 
+def example_multi_fidelity_optimization():
+    """
+    Example: Hyperband over projection pursuit parameters, using tour length as budget
+    """
+    print("\n\n" + "="*70)
+    print("Spinebil Integration: Multi-Fidelity Projection Pursuit Optimization")
+    print("="*70 + "\n")
+    
+    coordinator = MultiAgentSearchCoordinator(
+        search_space=PROJECTION_PURSUIT_SEARCH_SPACE,
+        evaluation_fn=evaluate_projection_config_at_budget,
+        num_agents=6
+    )
+    
+    best = coordinator.search_multi_fidelity(
+        max_budget=PROJECTION_TOUR_STEPS,
+        min_budget=1,
+        eta=3,
+        verbose=False
+    )
+    
+    stats = coordinator.get_statistics()
+    print("Best configuration at the full tour length:")
+    for key, value in best.config.items():
+        print(f"  {key}: {value}")
+    print(f"\nScore: {best.score:.4f}")
+    print(f"Evaluated {stats['num_evaluated']} configurations using "
+          f"{stats['budget_spent'] / PROJECTION_TOUR_STEPS:.0f} full tours of budget")
+
+
+def example_real_projection_search():
+    """
+    Example: Searching projection planes of data scored by the real stringy index
+    """
+    print("\n\n" + "="*70)
+    print("Spinebil Integration: Stringy Index on Real Projections")
+    print("="*70 + "\n")
+    
+    # Four variables with a linear relation hidden between the first two
+    rng = np.random.default_rng(0)
+    x = rng.uniform(-1, 1, 2000)
+    data = np.column_stack([
+        x, x + rng.normal(0, 0.05, 2000), rng.normal(0, 0.5, (2000, 2))
+    ])
+    
+    coordinator = MultiAgentSearchCoordinator(
+        search_space=PROJECTION_BASIS_SEARCH_SPACE,
+        evaluation_fn=None,
+        batch_evaluation_fn=make_stringy_batch_evaluation(data),
+        num_agents=6,
+        agent_types=['random', 'greedy', 'tpe', 'evolutionary', 'tpe', 'evolutionary'],
+        batch_size=256
+    )
+    best = coordinator.search(num_iterations=20, communication_interval=5, verbose=False)
+    
+    stats = coordinator.get_statistics()
+    print(f"Best stringy index: {best.score:.4f} "
+          f"after scoring {stats['num_evaluated']} projections")
+    print(f"  u = {[best.config[f'u{i}'] for i in range(4)]}")
+    print(f"  v = {[best.config[f'v{i}'] for i in range(4)]}")
+
+
 def example_diagnostic_threshold_optimization():
     """
     Example: Optimizing diagnostic thresholds for projection pursuit
@@ -153,46 +320,8 @@ def example_diagnostic_threshold_optimization():
     print("Spinebil Integration: Diagnostic Threshold Optimization")
     print("="*70 + "\n")
     
-    # Search space for diagnostic thresholds
-    search_space = {
-        'convergence_threshold': [1e-6, 1e-5, 1e-4, 1e-3],
-        'min_structure_score': [0.1, 0.2, 0.3, 0.4, 0.5],
-        'outlier_percentile': [0.90, 0.95, 0.99],
-        'min_projection_distance': [0.01, 0.05, 0.1, 0.2],
-        'stability_window': [5, 10, 20, 30]
-    }
-    
-    def evaluate_thresholds(config):
-        """Simulated evaluation of diagnostic thresholds"""
-        score = 0.5
-        
-        # Convergence threshold (moderate is best)
-        if config['convergence_threshold'] == 1e-4:
-            score += 0.15
-        elif config['convergence_threshold'] == 1e-5:
-            score += 0.12
-        
-        # Structure score (higher threshold = stricter)
-        if config['min_structure_score'] >= 0.3:
-            score += 0.1
-        
-        # Outlier detection
-        if config['outlier_percentile'] == 0.95:
-            score += 0.1
-        
-        # Projection distance
-        if 0.05 <= config['min_projection_distance'] <= 0.1:
-            score += 0.12
-        
-        # Stability window
-        if 10 <= config['stability_window'] <= 20:
-            score += 0.08
-        
-        score += random.uniform(-0.03, 0.03)
-        return max(0, min(1, score))
-    
     coordinator = MultiAgentSearchCoordinator(
-        search_space=search_space,
+        search_space=DIAGNOSTIC_THRESHOLD_SEARCH_SPACE,
         evaluation_fn=evaluate_thresholds,
         num_agents=4
     )
@@ -258,7 +387,13 @@ if __name__ == "__main__":
     # Example 1: Projection pursuit optimization
     best_pp, coordinator_pp = example_projection_pursuit_optimization()
     
-    # Example 2: Diagnostic threshold optimization
+    # Example 2: Multi-fidelity projection pursuit optimization
+    example_multi_fidelity_optimization()
+    
+    # Example 3: Searching real projections with the stringy index
+    example_real_projection_search()
+    
+    # Example 4: Diagnostic threshold optimization
     example_diagnostic_threshold_optimization()
     
     # Show integration benefits
@@ -0,0 +1,132 @@
+"""
+Test suite for dataset-level precomputation and shared datasets
+"""
+
+import pickle
+import random
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import numpy as np
+from dataset_context import DatasetContext, SharedDataset, resolve_context
+from multi_agent_search import MultiAgentSearchCoordinator
+from projection_indices import make_index
+from spinebil_integration import (
+    PROJECTION_PURSUIT_SEARCH_SPACE,
+    evaluate_projection_config,
+    projection_pursuit_context
+)
+
+
+def shared_summary(handle):
+    """Attach in a worker and report what the worker sees"""
+    context = handle.attach()
+    context.sphered()
+    context.sphered()
+    return (float(context.data.sum()), context.data.flags.writeable,
+            np.bincount(context.labels).tolist(), context.cache_info()['hits'])
+
+
+class TestDatasetContext(unittest.TestCase):
+    """Test lazy, memoized preprocessing"""
+    
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.labels = np.repeat(['a', 'b'], 50)
+        self.data = rng.normal(size=(100, 4)) @ rng.normal(size=(4, 4))
+        self.data[self.labels == 'b', 0] += 3
+        self.context = DatasetContext(self.data, self.labels)
+    
+    def test_intermediates_computed_once(self):
+        """Test repeated requests hit the cache and sphering is correct"""
+        sphered = self.context.sphered()
+        self.assertIs(self.context.sphered(), sphered)
+        np.testing.assert_allclose(np.cov(sphered, rowvar=False), np.eye(4), atol=1e-10)
+        info = self.context.cache_info()
+        self.assertEqual(info['misses'], 5)
+        self.assertEqual(info['hits'], 1)
+    
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted first"""
+        context = DatasetContext(self.data, max_entries=2)
+        mean = context.mean()
+        context.covariance()
+        context.mean()
+        context.cached('extra', lambda: 1)
+        self.assertEqual(context.cache_info()['evictions'], 1)
+        self.assertIs(context.mean(), mean)
+        self.assertEqual(context.cache_info()['size'], 2)
+    
+    def test_indices_match_fresh_preparation(self):
+        """Test context-prepared indices equal indices prepared from scratch"""
+        bases = np.linalg.qr(np.random.default_rng(1).normal(size=(20, 4, 2)))[0]
+        sphered = self.context.sphered()
+        for name, params in [('holes', {}), ('central_mass', {}), ('lda', {}),
+                             ('pda', {'lambda_': 0.5})]:
+            labels = self.labels if name in ('lda', 'pda') else None
+            expected = make_index(name, sphered, labels, **params)(bases)
+            index = self.context.index(name, **params)
+            np.testing.assert_allclose(index(bases), expected, atol=1e-10)
+            self.assertIs(self.context.index(name, **params), index)
+        
+        stringy = self.context.index('stringy', sphered=False)
+        np.testing.assert_allclose(stringy(bases), make_index('stringy', self.data)(bases))
+        self.assertGreater(np.ptp(stringy(bases)), 0.01)
+        
+        with self.assertRaises(ValueError):
+            self.context.index('stringy')
+        with self.assertRaises(ValueError):
+            DatasetContext(self.data).index('lda')
+    
+    def test_neighbours(self):
+        """Test chunked nearest neighbours match a brute-force search"""
+        neighbours = self.context.neighbours(k=3, chunk_size=7)
+        points = self.context.sphered()
+        distances = ((points[:, None] - points[None]) ** 2).sum(axis=2)
+        np.fill_diagonal(distances, np.inf)
+        np.testing.assert_array_equal(neighbours, np.argsort(distances, axis=1)[:, :3])
+    
+    def test_pickle_drops_cache(self):
+        """Test a pickled context carries the data but not the cache"""
+        self.context.sphered()
+        copy = pickle.loads(pickle.dumps(self.context))
+        self.assertEqual(copy.cache_info()['size'], 0)
+        np.testing.assert_array_equal(copy.data, self.data)
+
+
+class TestSharedDataset(unittest.TestCase):
+    """Test sharing a dataset read-only with worker processes"""
+    
+    def test_workers_attach_without_copying(self):
+        """Test workers see the shared data read-only through a tiny handle"""
+        labels = np.repeat(['x', 'y', 'z'], [5, 3, 2])
+        data = np.random.default_rng(2).normal(size=(10, 3))
+        context = DatasetContext(data, labels)
+        with context.share() as handle:
+            self.assertLess(len(pickle.dumps(handle)), 1000)
+            with ProcessPoolExecutor(max_workers=2) as pool:
+                results = list(pool.map(shared_summary, [handle] * 4))
+            expected = (float(data.sum()), False, [5, 3, 2])
+            self.assertTrue(all(result[:3] == expected for result in results))
+            self.assertTrue(all(result[3] >= 1 for result in results))
+            self.assertIsInstance(resolve_context(handle), DatasetContext)
+            self.assertEqual(list(handle.classes), ['x', 'y', 'z'])
+    
+    def test_process_search_on_shared_dataset(self):
+        """Test a process-parallel sweep evaluates projection configs on a shared dataset"""
+        random.seed(0)
+        with projection_pursuit_context().share() as handle:
+            coordinator = MultiAgentSearchCoordinator(
+                search_space=PROJECTION_PURSUIT_SEARCH_SPACE,
+                evaluation_fn=partial(evaluate_projection_config, context=handle),
+                num_agents=2,
+                executor='process',
+                max_workers=2
+            )
+            best = coordinator.search(num_iterations=4, verbose=False)
+        self.assertTrue(0 <= best.score <= 1)
+        self.assertIsInstance(handle, SharedDataset)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,137 @@
+"""
+Test suite for memory-mapped datasets and streaming statistics
+"""
+
+import os
+import pickle
+import tempfile
+import unittest
+import numpy as np
+from dataset_context import DatasetContext
+from dataset_io import (
+    StreamingGroupMoments,
+    StreamingMoments,
+    iter_chunks,
+    open_dataset,
+    subsample
+)
+from projection_indices import group_scatter
+
+
+class TestStreamingStatistics(unittest.TestCase):
+    """Test chunked moments against whole-array results"""
+    
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.data = rng.normal(size=(1000, 4)) @ rng.normal(size=(4, 4)) + 100.0
+        self.labels = rng.integers(0, 3, 1000)
+    
+    def test_moments_match_numpy(self):
+        """Test chunked and merged moments equal np.cov and the mean"""
+        moments = StreamingMoments(4)
+        for chunk in iter_chunks(self.data, 97):
+            moments.update(chunk)
+        np.testing.assert_allclose(moments.mean, self.data.mean(axis=0))
+        np.testing.assert_allclose(moments.covariance(), np.cov(self.data, rowvar=False))
+        
+        left = StreamingMoments(4).update(self.data[:300])
+        right = StreamingMoments(4).update(self.data[300:])
+        np.testing.assert_allclose(left.merge(right).covariance(), moments.covariance())
+        with self.assertRaises(ValueError):
+            StreamingMoments(4).update(self.data[:1]).covariance()
+    
+    def test_group_scatter_matches(self):
+        """Test chunked group moments give the in-memory group scatter"""
+        moments = StreamingGroupMoments(4)
+        for chunk, labels in zip(iter_chunks(self.data, 128), iter_chunks(self.labels, 128)):
+            moments.update(chunk, labels)
+        for streamed, exact in zip(moments.scatter(), group_scatter(self.data, self.labels)):
+            np.testing.assert_allclose(streamed, exact, rtol=1e-9, atol=1e-6)
+    
+    def test_subsample(self):
+        """Test subsamples are distinct sorted rows and reproducible"""
+        sample, rows = subsample(self.data, 50, np.random.default_rng(1), chunk_size=16)
+        self.assertEqual(sample.shape, (50, 4))
+        self.assertEqual(len(set(rows.tolist())), 50)
+        self.assertTrue(np.all(np.diff(rows) > 0))
+        np.testing.assert_array_equal(sample, self.data[rows])
+        again, _ = subsample(self.data, 50, np.random.default_rng(1))
+        np.testing.assert_array_equal(again, sample)
+        self.assertEqual(len(subsample(self.data, 5000)[0]), 1000)
+
+
+class TestMappedContext(unittest.TestCase):
+    """Test streaming DatasetContexts over memory-mapped files"""
+    
+    def setUp(self):
+        rng = np.random.default_rng(2)
+        self.labels = np.repeat([0, 1], 1500)
+        self.data = rng.normal(size=(3000, 5))
+        self.data[self.labels == 1, 0] += 3
+        self.directory = tempfile.TemporaryDirectory()
+        self.npy_path = os.path.join(self.directory.name, 'data.npy')
+        np.save(self.npy_path, self.data)
+    
+    def tearDown(self):
+        self.directory.cleanup()
+    
+    def test_open_npy_and_raw(self):
+        """Test both file formats map the same rows without loading them"""
+        raw_path = os.path.join(self.directory.name, 'data.f32')
+        self.data.astype(np.float32).tofile(raw_path)
+        
+        mapped = open_dataset(self.npy_path)
+        self.assertIsInstance(mapped, np.memmap)
+        np.testing.assert_array_equal(mapped, self.data)
+        raw = open_dataset(raw_path, dtype='float32', num_variables=5)
+        self.assertEqual(raw.shape, (3000, 5))
+        np.testing.assert_allclose(raw, self.data, rtol=1e-6)
+        with self.assertRaises(ValueError):
+            open_dataset(raw_path)
+    
+    def test_streaming_context_matches_in_memory(self):
+        """Test moment-based results are exact and the rest use the subsample"""
+        streamed = DatasetContext.from_file(self.npy_path, self.labels,
+                                            chunk_size=256, sample_size=500)
+        in_memory = DatasetContext(self.data, self.labels)
+        self.assertTrue(streamed.streaming)
+        np.testing.assert_allclose(streamed.covariance(), in_memory.covariance())
+        np.testing.assert_allclose(streamed.mean(), in_memory.mean())
+        
+        bases = np.linalg.qr(np.random.default_rng(3).normal(size=(10, 5, 2)))[0]
+        np.testing.assert_allclose(streamed.index('lda')(bases), in_memory.index('lda')(bases))
+        np.testing.assert_allclose(streamed.index('stringy', sphered=False)(bases),
+                                   in_memory.index('stringy', sphered=False)(bases))
+        
+        self.assertEqual(streamed.sphered().shape, (500, 5))
+        self.assertEqual(streamed.neighbours(k=4).shape, (500, 4))
+        # Holes is estimated from the subsample
+        np.testing.assert_allclose(streamed.index('holes')(bases),
+                                   in_memory.index('holes')(bases), atol=0.05)
+    
+    def test_pickle_sends_mapping(self):
+        """Test a pickled file-backed context reopens its files and keeps only the moments"""
+        labels_path = os.path.join(self.directory.name, 'labels.npy')
+        np.save(labels_path, self.labels)
+        context = DatasetContext.from_file(self.npy_path, np.load(labels_path, mmap_mode='r'),
+                                           sample_size=1000)
+        covariance = context.covariance()
+        context.index('holes')
+        context.index('lda')
+        context.neighbours(k=4)
+        payload = pickle.dumps(context)
+        self.assertLess(len(payload), 5000)
+        
+        copy = pickle.loads(payload)
+        misses = copy.cache_info()['misses']
+        self.assertEqual(copy.cache_info()['size'], 2)
+        self.assertIsInstance(copy.data, np.memmap)
+        self.assertIsInstance(copy.labels, np.memmap)
+        np.testing.assert_array_equal(copy.data, self.data)
+        np.testing.assert_array_equal(copy.labels, self.labels)
+        np.testing.assert_array_equal(copy.covariance(), covariance)
+        self.assertEqual(copy.cache_info()['misses'], misses)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
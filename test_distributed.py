@@ -0,0 +1,168 @@
+"""
+Test suite for the SQLite-backed distributed evaluation queue
+"""
+
+import multiprocessing
+import os
+import random
+import tempfile
+import time
+import unittest
+from distributed import JobQueue, QueueExecutor, run_worker, function_name
+from multi_agent_search import MultiAgentSearchCoordinator
+
+
+def queue_eval(config):
+    """Module-level evaluation function importable by worker processes"""
+    return config['x'] * 0.1 + config['y'] * 0.01
+
+
+def budgeted_queue_eval(config, budget):
+    """Budget-aware evaluation whose score grows with the budget"""
+    return queue_eval(config) * budget / 9
+
+
+def failing_eval(config):
+    """Evaluation that always raises"""
+    raise RuntimeError('diverged')
+
+
+class TestJobQueue(unittest.TestCase):
+    """Test JobQueue leases"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'jobs.sqlite')
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def test_expired_lease_is_requeued(self):
+        """Test a job leased by a dead worker goes to the next worker"""
+        queue = JobQueue(self.path, lease_timeout=0.05)
+        job_id = queue.submit(function_name(queue_eval), {'x': 1, 'y': 2})
+        
+        self.assertEqual(queue.lease('dead-worker')[0], job_id)
+        self.assertIsNone(queue.lease('live-worker'))
+        time.sleep(0.1)
+        
+        leased = queue.lease('live-worker')
+        self.assertEqual(leased, (job_id, 'test_distributed:queue_eval', [{'x': 1, 'y': 2}]))
+        queue.complete(job_id, 0.12)
+        self.assertEqual(queue.finished([job_id]), [(job_id, 'done', 0.12, 'lease expired')])
+    
+    def test_failures_exhaust_attempts(self):
+        """Test a job that keeps failing is eventually marked failed"""
+        queue = JobQueue(self.path, max_attempts=2)
+        job_id = queue.submit(function_name(failing_eval), {'x': 1, 'y': 2})
+        
+        self.assertEqual(run_worker(self.path, max_jobs=2, poll_interval=0.01), 2)
+        (row,) = queue.finished([job_id])
+        self.assertEqual(row[1], 'failed')
+        self.assertIn('diverged', row[3])
+    
+    def test_local_functions_rejected(self):
+        """Test non-importable functions cannot be distributed"""
+        with self.assertRaises(ValueError):
+            function_name(lambda config: 0.0)
+
+
+class TestQueueExecutor(unittest.TestCase):
+    """Test running a coordinator against queue workers"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'jobs.sqlite')
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def test_futures_run_once_leased(self):
+        """Test futures stay pending, and cancellable, until a worker leases their job"""
+        executor = QueueExecutor(self.path, poll_interval=0.01)
+        try:
+            first = executor.submit(queue_eval, {'x': 1, 'y': 2})
+            second = executor.submit(queue_eval, {'x': 2, 'y': 2})
+            time.sleep(0.05)
+            self.assertFalse(first.running())
+            self.assertTrue(second.cancel())
+            
+            self.assertEqual(run_worker(self.path, max_jobs=1, poll_interval=0.01), 1)
+            self.assertAlmostEqual(first.result(timeout=5), 0.12)
+            time.sleep(0.05)
+            self.assertIsNone(JobQueue(self.path).lease('late-worker'))
+            self.assertEqual(JobQueue(self.path).counts(), {'done': 1, 'cancelled': 1})
+        finally:
+            executor.shutdown()
+    
+    def test_search_with_worker_processes(self):
+        """Test distributed search matches serial search"""
+        search_space = {'x': [1, 2, 3, 4, 5, 6], 'y': [10, 20, 30]}
+        executor = QueueExecutor(self.path, poll_interval=0.01)
+        workers = [
+            multiprocessing.Process(
+                target=run_worker, args=(self.path,),
+                kwargs={'poll_interval': 0.01, 'idle_timeout': 1.0}
+            )
+            for _ in range(2)
+        ]
+        for worker in workers:
+            worker.start()
+        
+        try:
+            histories = []
+            for backend in (executor, 'serial'):
+                random.seed(4)
+                coordinator = MultiAgentSearchCoordinator(
+                    search_space=search_space,
+                    evaluation_fn=queue_eval,
+                    num_agents=3,
+                    executor=backend
+                )
+                coordinator.search(num_iterations=4, verbose=False)
+                histories.append([[(a.id, a.score) for a in agent.history]
+                                  for agent in coordinator.agents])
+        finally:
+            executor.shutdown()
+            for worker in workers:
+                worker.join()
+        
+        self.assertEqual(histories[0], histories[1])
+        self.assertEqual(JobQueue(self.path).counts(), {'done': sum(map(len, histories[0]))})
+
+    
+    def test_multi_fidelity_search_with_worker_processes(self):
+        """Test budgets reach queue workers and match a serial multi-fidelity run"""
+        search_space = {'x': [1, 2, 3, 4, 5, 6], 'y': [10, 20, 30]}
+        executor = QueueExecutor(self.path, poll_interval=0.01)
+        worker = multiprocessing.Process(
+            target=run_worker, args=(self.path,),
+            kwargs={'poll_interval': 0.01, 'idle_timeout': 1.0}
+        )
+        worker.start()
+        
+        try:
+            results = []
+            for backend in (executor, 'serial'):
+                random.seed(6)
+                coordinator = MultiAgentSearchCoordinator(
+                    search_space=search_space,
+                    evaluation_fn=budgeted_queue_eval,
+                    num_agents=2,
+                    executor=backend
+                )
+                best = coordinator.search_multi_fidelity(
+                    max_budget=9, num_configs=9, verbose=False
+                )
+                results.append((best.config, best.score))
+        finally:
+            executor.shutdown()
+            worker.join()
+        
+        self.assertEqual(results[0], results[1])
+        self.assertGreater(JobQueue(self.path).counts()['done'], 9)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
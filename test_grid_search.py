@@ -0,0 +1,63 @@
+"""
+Test suite for the exhaustive grid search engine
+"""
+
+import unittest
+import numpy as np
+from grid_search import GridSearchEngine
+
+
+def separable_score(batch):
+    """Deterministic vectorized scorer with a unique optimum at a=7, b=2, c='z'"""
+    return (
+        -np.abs(batch['a'] - 7)
+        - np.abs(batch['b'] - 2.0)
+        + np.where(batch['c'] == 'z', 0.5, 0.0)
+    )
+
+
+class TestGridSearchEngine(unittest.TestCase):
+    """Test GridSearchEngine"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.search_space = {
+            'a': list(range(10)),
+            'b': [0.0, 1.0, 2.0, 3.0],
+            'c': ['x', 'y', 'z']
+        }
+    
+    def test_top_k_matches_brute_force(self):
+        """Test chunked top-k agrees with scoring the full product"""
+        engine = GridSearchEngine(self.search_space, separable_score, chunk_size=7)
+        top = engine.run(top_k=5)
+        
+        batch = next(GridSearchEngine(self.search_space, separable_score,
+                                      chunk_size=1000).iter_chunks())
+        expected = np.sort(separable_score(batch))[::-1][:5]
+        
+        self.assertEqual(engine.get_statistics()['num_evaluated'], 120)
+        self.assertEqual(top[0].config, {'a': 7, 'b': 2.0, 'c': 'z'})
+        np.testing.assert_allclose([arch.score for arch in top], expected)
+    
+    def test_chunks_cover_space_in_order(self):
+        """Test chunks enumerate consecutive fingerprints"""
+        engine = GridSearchEngine(self.search_space, separable_score, chunk_size=50)
+        chunks = list(engine.iter_chunks())
+        
+        self.assertEqual([len(chunk) for chunk in chunks], [50, 50, 20])
+        fingerprints = np.concatenate([engine.space.fingerprints(c.indices) for c in chunks])
+        np.testing.assert_array_equal(fingerprints, np.arange(120))
+    
+    def test_large_space_is_enumerated_lazily(self):
+        """Test a 10^7 space can be sliced without building the product"""
+        search_space = {f'p{i}': list(range(10)) for i in range(7)}
+        engine = GridSearchEngine(search_space, separable_score, chunk_size=1000)
+        
+        chunk = next(engine.iter_chunks(start=9_999_000))
+        self.assertEqual(len(chunk), 1000)
+        self.assertEqual(chunk.indices[-1].tolist(), [9] * 7)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,147 @@
+"""
+Test suite for the guided tour optimizer
+"""
+
+import random
+import unittest
+import numpy as np
+from guided_tour import GuidedTour, bases_nearby, cooling_factor, subspace_overlap
+from projection_indices import LDAIndex, random_bases
+from spinebil_integration import (
+    evaluate_projection_config,
+    evaluate_projection_config_at_budget,
+    projection_pursuit_context
+)
+
+
+def separated_classes(rng):
+    """Three classes separated in the plane of the first two variables"""
+    labels = np.repeat([0, 1, 2], 60)
+    data = rng.normal(size=(180, 5))
+    data[:, 0] += 3.0 * (labels == 1)
+    data[:, 1] += 3.0 * (labels == 2)
+    return data, labels
+
+
+class TestCooling(unittest.TestCase):
+    """Test cooling schedules and neighbourhood sampling"""
+    
+    def test_schedules(self):
+        """Test every schedule starts at 1 and decreases"""
+        for schedule in ('linear', 'exponential', 'geometric'):
+            factors = [cooling_factor(schedule, step, 20) for step in range(20)]
+            self.assertEqual(factors[0], 1.0)
+            self.assertTrue(all(a > b for a, b in zip(factors, factors[1:])))
+            self.assertGreater(factors[-1], 0)
+        with self.assertRaises(ValueError):
+            cooling_factor('logarithmic', 1, 10)
+    
+    def test_bases_nearby(self):
+        """Test candidates are orthonormal and closer for smaller steps"""
+        rng = np.random.default_rng(0)
+        basis = np.eye(6)[:, :2]
+        near = bases_nearby(basis, 0.05, 50, rng)
+        far = bases_nearby(basis, 0.9, 50, rng)
+        gram = np.swapaxes(near, 1, 2) @ near
+        np.testing.assert_allclose(gram, np.broadcast_to(np.eye(2), gram.shape), atol=1e-12)
+        self.assertGreater(np.mean([subspace_overlap(b, basis) for b in near]),
+                           np.mean([subspace_overlap(b, basis) for b in far]))
+
+
+class TestGuidedTour(unittest.TestCase):
+    """Test the tour paths on data with a known discriminating plane"""
+    
+    def setUp(self):
+        self.rng = np.random.default_rng(1)
+        data, labels = separated_classes(self.rng)
+        self.index = LDAIndex(data, labels)
+        self.target = np.eye(5)[:, :2]
+    
+    def test_guided_finds_plane(self):
+        """Test the guided tour converges to the separating plane"""
+        for cooling in ('linear', 'exponential', 'geometric'):
+            tour = GuidedTour(self.index, cooling=cooling, max_steps=200, rng=self.rng)
+            result = tour.run()
+            self.assertTrue(result.converged)
+            self.assertGreater(subspace_overlap(result.basis, self.target), 0.85)
+            self.assertEqual(result.num_evaluations, 1 + result.num_steps * tour.batch_size)
+            self.assertAlmostEqual(result.index_value, float(self.index(result.basis)))
+            self.assertEqual(result.trace[-1], max(result.trace))
+    
+    def test_annealing_keeps_best(self):
+        """Test accepting worse moves never loses the best basis found"""
+        result = GuidedTour(self.index, temperature=0.5, max_steps=60, rng=self.rng).run()
+        self.assertEqual(result.index_value, max(result.trace))
+    
+    def test_max_steps_and_tries(self):
+        """Test the tour stops at max_steps, or after max_tries failed rounds"""
+        result = GuidedTour(self.index, max_steps=3, rng=self.rng).run()
+        self.assertEqual(result.num_steps, 3)
+        self.assertFalse(result.converged)
+        
+        flat = GuidedTour(lambda bases: np.zeros(len(bases)), num_variables=5, max_tries=4,
+                          rng=self.rng).run()
+        self.assertEqual(flat.num_steps, 4)
+        self.assertTrue(flat.converged)
+    
+    def test_unguided_paths(self):
+        """Test the little tour visits every axis plane and the grand tour keeps its best"""
+        little = GuidedTour(self.index, tour_path='little', batch_size=4).run()
+        self.assertEqual(little.num_steps, 9)
+        self.assertTrue(little.converged)
+        self.assertAlmostEqual(subspace_overlap(little.basis, self.target), 1.0)
+        
+        grand = GuidedTour(self.index, tour_path='grand', max_tries=5, rng=self.rng).run()
+        self.assertTrue(all(a <= b for a, b in zip(grand.trace, grand.trace[1:])))
+    
+    def test_validation(self):
+        """Test unknown paths, schedules and plain functions without p are rejected"""
+        with self.assertRaises(ValueError):
+            GuidedTour(self.index, tour_path='planned')
+        with self.assertRaises(ValueError):
+            GuidedTour(self.index, cooling='quadratic')
+        with self.assertRaises(ValueError):
+            GuidedTour(lambda bases: np.zeros(len(bases)))
+
+
+class TestProjectionConfigEvaluation(unittest.TestCase):
+    """Test the spinebil evaluation backed by real tours"""
+    
+    CONFIG = {'index_function': 'lda', 'tour_path': 'guided', 'cooling': 'exponential',
+              'max_tries': 25, 'alpha': 0.5, 'lambda': 0.5}
+    
+    def test_discriminating_index_recovers_plane(self):
+        """Test a good configuration recovers the planted plane and is seed-reproducible"""
+        random.seed(0)
+        score = evaluate_projection_config(self.CONFIG)
+        self.assertGreater(score, 0.95)
+        random.seed(0)
+        self.assertEqual(evaluate_projection_config(self.CONFIG), score)
+        
+        poor = dict(self.CONFIG, index_function='central_mass')
+        self.assertLess(evaluate_projection_config(poor), score)
+    
+    def test_stringy_varies_across_bases(self):
+        """Test the stringy index toured by the evaluation is not flattened by sphering"""
+        context = projection_pursuit_context()
+        values = context.index('stringy', sphered=False)(
+            random_bases(6, 200, np.random.default_rng(0))
+        )
+        self.assertGreater(values.max() - values.min(), 0.1)
+        
+        random.seed(2)
+        scores = {evaluate_projection_config(dict(self.CONFIG, index_function='stringy'))
+                  for _ in range(3)}
+        self.assertTrue(all(0 <= score <= 1 for score in scores))
+    
+    def test_budget_limits_tour(self):
+        """Test every index and lambda value evaluates within [0, 1] at any budget"""
+        random.seed(1)
+        for name in ('holes', 'central_mass', 'lda', 'pda', 'stringy'):
+            for budget in (1, 81):
+                config = dict(self.CONFIG, index_function=name, **{'lambda': 2.0})
+                self.assertTrue(0 <= evaluate_projection_config_at_budget(config, budget) <= 1)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,305 @@
+"""
+Test suite for evaluation timeouts, retries and failure isolation
+"""
+
+import os
+import random
+import time
+import unittest
+from isolation import EvaluationTimeout, IsolatedProcessExecutor, WorkerCrashed
+from evaluation_cache import EvaluationCache
+from multi_agent_search import MultiAgentSearchCoordinator
+
+
+SEARCH_SPACE = {'x': list(range(5)), 'y': list(range(4))}
+
+
+def sleepy(seconds):
+    """Sleep, then return the worker's pid"""
+    time.sleep(seconds)
+    return os.getpid()
+
+
+def crash(_):
+    """Kill the worker process"""
+    os._exit(3)
+
+
+def raise_value_error(message):
+    """Raise an ordinary exception"""
+    raise ValueError(message)
+
+
+def hanging_eval(config):
+    """Never converges when y == 0"""
+    if config['y'] == 0:
+        time.sleep(60)
+    return config['x'] * 0.1 + config['y'] * 0.01
+
+
+def hanging_eval_short(config):
+    """Hangs for longer than the test timeout"""
+    time.sleep(2)
+    return 1.0
+
+
+def slow_eval(config):
+    """Healthy evaluation taking a good part of the test timeout"""
+    time.sleep(0.3)
+    return config['x'] * 0.1 + config['y'] * 0.01
+
+
+def failing_eval(config):
+    """Diverges for odd x"""
+    if config['x'] % 2:
+        raise RuntimeError('diverged')
+    return config['x'] * 0.1 + config['y'] * 0.01
+
+
+ATTEMPTS = {}
+
+
+def flaky_eval(config):
+    """Fails the first attempt of every configuration"""
+    key = (config['x'], config['y'])
+    ATTEMPTS[key] = ATTEMPTS.get(key, 0) + 1
+    if ATTEMPTS[key] == 1:
+        raise RuntimeError('transient')
+    return config['x'] * 0.1 + config['y'] * 0.01
+
+
+class TestIsolatedProcessExecutor(unittest.TestCase):
+    """Test the killable process pool"""
+    
+    def test_timeout_kills_only_the_runaway_worker(self):
+        """Test a hung task is killed while other tasks complete"""
+        executor = IsolatedProcessExecutor(max_workers=2, timeout=0.5)
+        try:
+            started = time.monotonic()
+            hung = executor.submit(sleepy, 60)
+            quick = [executor.submit(sleepy, 0.01) for _ in range(3)]
+            with self.assertRaises(EvaluationTimeout):
+                hung.result()
+            self.assertLess(time.monotonic() - started, 10)
+            self.assertTrue(all(isinstance(f.result(), int) for f in quick))
+            
+            # The replacement worker serves new tasks
+            self.assertIsInstance(executor.submit(sleepy, 0).result(), int)
+            self.assertEqual(executor.num_timeouts, 1)
+        finally:
+            executor.shutdown()
+    
+    def test_crash_and_errors_are_isolated(self):
+        """Test a dying worker or raising task only fails its own future"""
+        executor = IsolatedProcessExecutor(max_workers=1)
+        try:
+            crashed = executor.submit(crash, None)
+            failed = executor.submit(raise_value_error, 'bad')
+            ok = executor.submit(sleepy, 0)
+            with self.assertRaises(WorkerCrashed):
+                crashed.result()
+            with self.assertRaises(ValueError):
+                failed.result()
+            self.assertIsInstance(ok.result(), int)
+        finally:
+            executor.shutdown()
+
+    
+    def test_cancelled_task_does_not_stall_the_queue(self):
+        """Test tasks queued behind a cancelled one still run"""
+        executor = IsolatedProcessExecutor(max_workers=1)
+        try:
+            running = executor.submit(sleepy, 0.5)
+            cancelled = executor.submit(sleepy, 0)
+            queued = executor.submit(sleepy, 0)
+            self.assertTrue(cancelled.cancel())
+            self.assertIsInstance(queued.result(timeout=10), int)
+            self.assertIsInstance(running.result(), int)
+            self.assertTrue(cancelled.cancelled())
+        finally:
+            executor.shutdown()
+
+class TestFailureHandling(unittest.TestCase):
+    """Test timeouts, retries and failure scores in the coordinator"""
+    
+    def test_failure_score_keeps_search_running(self):
+        """Test failing evaluations get the failure score and are not cached"""
+        random.seed(1)
+        cache = EvaluationCache()
+        coordinator = MultiAgentSearchCoordinator(
+            search_space=SEARCH_SPACE,
+            evaluation_fn=failing_eval,
+            num_agents=4,
+            cache=cache,
+            failure_score=-1.0
+        )
+        best = coordinator.search(num_iterations=10, verbose=False)
+        stats = coordinator.get_statistics()
+        
+        self.assertEqual(best.config['x'] % 2, 0)
+        self.assertGreater(stats['failed_evaluations'], 0)
+        self.assertEqual(len(cache), stats['num_evaluated'] - stats['failed_evaluations'])
+        failed = [arch for agent in coordinator.agents for arch in agent.history
+                  if arch.config['x'] % 2]
+        self.assertTrue(failed)
+        self.assertTrue(all(arch.score == -1.0 for arch in failed))
+    
+    def test_errors_propagate_without_failure_score(self):
+        """Test the original behaviour is kept when no failure score is set"""
+        coordinator = MultiAgentSearchCoordinator(
+            search_space={'x': [1], 'y': [0]},
+            evaluation_fn=failing_eval,
+            num_agents=1,
+            max_retries=2
+        )
+        with self.assertRaises(RuntimeError):
+            coordinator.search(num_iterations=1, verbose=False)
+        self.assertEqual(coordinator.num_retries, 2)
+    
+    def test_retries(self):
+        """Test transient failures are retried within the budget"""
+        ATTEMPTS.clear()
+        random.seed(2)
+        coordinator = MultiAgentSearchCoordinator(
+            search_space=SEARCH_SPACE,
+            evaluation_fn=flaky_eval,
+            num_agents=3,
+            executor='thread',
+            max_retries=1,
+            failure_score=-1.0
+        )
+        coordinator.search(num_iterations=5, verbose=False)
+        stats = coordinator.get_statistics()
+        
+        self.assertEqual(stats['failed_evaluations'], 0)
+        self.assertEqual(stats['retries'], stats['num_evaluated'])
+        self.assertTrue(all(arch.score >= 0 for agent in coordinator.agents
+                            for arch in agent.history))
+    
+    def test_isolated_backend_kills_runaway_evaluations(self):
+        """Test hung evaluations are killed and scored without stalling the search"""
+        random.seed(3)
+        coordinator = MultiAgentSearchCoordinator(
+            search_space={'x': list(range(3)), 'y': [0, 1]},
+            evaluation_fn=hanging_eval,
+            num_agents=2,
+            executor='isolated',
+            max_workers=2,
+            evaluation_timeout=0.5,
+            failure_score=0.0,
+            proposal_retries=10
+        )
+        started = time.monotonic()
+        best = coordinator.search(num_iterations=3, verbose=False)
+        
+        self.assertLess(time.monotonic() - started, 20)
+        self.assertEqual(coordinator.get_statistics()['num_evaluated'], 6)
+        self.assertEqual(coordinator.num_timeouts, 3)
+        self.assertEqual(best.config, {'x': 2, 'y': 1})
+    
+    def test_thread_backend_stops_waiting(self):
+        """Test the thread backend abandons a hung evaluation after the timeout"""
+        coordinator = MultiAgentSearchCoordinator(
+            search_space={'x': [0], 'y': [0]},
+            evaluation_fn=hanging_eval_short,
+            num_agents=1,
+            executor='thread',
+            evaluation_timeout=0.2,
+            failure_score=0.0
+        )
+        started = time.monotonic()
+        coordinator.search(num_iterations=1, verbose=False)
+        self.assertLess(time.monotonic() - started, 1.5)
+        self.assertEqual(coordinator.num_timeouts, 1)
+    
+    def test_queued_evaluations_are_not_timed_out(self):
+        """Test the timeout only counts time spent running, not waiting for a worker"""
+        random.seed(6)
+        coordinator = MultiAgentSearchCoordinator(
+            search_space=SEARCH_SPACE,
+            evaluation_fn=slow_eval,
+            num_agents=6,
+            executor='thread',
+            max_workers=2,
+            evaluation_timeout=0.5,
+            failure_score=0.0
+        )
+        coordinator.search(num_iterations=2, verbose=False)
+        stats = coordinator.get_statistics()
+        
+        self.assertGreater(stats['num_evaluated'], 2 * 2)
+        self.assertEqual(stats['timeouts'], 0)
+        self.assertEqual(stats['failed_evaluations'], 0)
+    
+    def test_steady_state_failures(self):
+        """Test steady-state search records failure scores"""
+        random.seed(4)
+        coordinator = MultiAgentSearchCoordinator(
+            search_space=SEARCH_SPACE,
+            evaluation_fn=failing_eval,
+            num_agents=2,
+            executor='thread',
+            failure_score=-1.0
+        )
+        best = coordinator.search_steady_state(max_evaluations=12, verbose=False)
+        self.assertEqual(best.config['x'] % 2, 0)
+        self.assertGreater(coordinator.num_failed_evaluations, 0)
+
+    
+    def test_batched_failures(self):
+        """Test a raising batch is retried, then scored with the failure score"""
+        calls = []
+        
+        def failing_batch(batch):
+            calls.append(len(batch))
+            raise RuntimeError('diverged')
+        
+        random.seed(5)
+        cache = EvaluationCache()
+        coordinator = MultiAgentSearchCoordinator(
+            search_space=SEARCH_SPACE,
+            evaluation_fn=None,
+            batch_evaluation_fn=failing_batch,
+            batch_size=3,
+            num_agents=2,
+            cache=cache,
+            max_retries=1,
+            failure_score=0.0
+        )
+        best = coordinator.search(num_iterations=3, verbose=False)
+        stats = coordinator.get_statistics()
+        
+        self.assertEqual(best.score, 0.0)
+        self.assertEqual(len(calls), 2 * stats['retries'])
+        self.assertEqual(stats['failed_evaluations'], stats['num_evaluated'])
+        self.assertEqual(len(cache), 0)
+        
+        def flaky_batch(batch):
+            calls.append(len(batch))
+            if len(calls) % 2:
+                raise RuntimeError('transient')
+            return batch['x']
+        
+        calls.clear()
+        flaky = MultiAgentSearchCoordinator(
+            search_space=SEARCH_SPACE,
+            evaluation_fn=None,
+            batch_evaluation_fn=flaky_batch,
+            num_agents=1,
+            max_retries=1
+        )
+        best = flaky.search(num_iterations=2, verbose=False)
+        self.assertEqual(flaky.num_retries, 2)
+        self.assertEqual(flaky.num_failed_evaluations, 0)
+        self.assertEqual(best.score, best.config['x'])
+        
+        with self.assertRaises(ValueError):
+            MultiAgentSearchCoordinator(
+                search_space=SEARCH_SPACE,
+                evaluation_fn=None,
+                batch_evaluation_fn=failing_batch,
+                evaluation_timeout=1.0
+            )
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -2,13 +2,39 @@
 Test suite for Multi-Agent Architecture Search framework
 """
 
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from multi_agent_search import (
+    Agent,
     Architecture,
+    ArchitectureHistory,
+    EliteArchive,
+    SearchSpace,
     RandomSearchAgent,
     GreedySearchAgent,
-    MultiAgentSearchCoordinator
+    TPESearchAgent,
+    EvolutionarySearchAgent,
+    MultiAgentSearchCoordinator,
+    ConfigBatch,
+    example_evaluation_function,
+    example_batch_evaluation_function
 )
+import numpy as np
+from evaluation_cache import EvaluationCache, config_digest
+from instrumentation import SearchProfiler
+from event_log import read_events
+from multi_fidelity import bracket_cost, hyperband_brackets, successive_halving_rungs
+
+
+def deterministic_eval(config):
+    """Module-level evaluation function so it can be pickled to worker processes"""
+    return config['x'] * 0.1 + config['y'] * 0.01
 
 
 class TestArchitecture(unittest.TestCase):
@@ -42,6 +68,297 @@ class TestArchitecture(unittest.TestCase):
         self.assertNotEqual(arch1, arch3)
 
 
+class TestSearchSpace(unittest.TestCase):
+    """Test mixed-radix config fingerprints"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.space = SearchSpace({
+            'num_layers': [1, 2, 3],
+            'learning_rate': [0.001, 0.01],
+            'activation': ['relu', 'tanh', 'sigmoid', 'gelu']
+        })
+    
+    def test_fingerprints_are_a_bijection(self):
+        """Test every config gets a distinct fingerprint that decodes back"""
+        self.assertEqual(len(self.space), 24)
+        for fingerprint in range(len(self.space)):
+            config = self.space.decode(fingerprint)
+            self.assertEqual(self.space.encode(config), fingerprint)
+    
+    def test_fingerprint_stable_across_processes(self):
+        """Test fingerprints do not depend on PYTHONHASHSEED"""
+        config = {'num_layers': 3, 'learning_rate': 0.01, 'activation': 'gelu'}
+        script = (
+            "from multi_agent_search import SearchSpace\n"
+            "space = SearchSpace({'num_layers': [1, 2, 3], 'learning_rate': [0.001, 0.01],"
+            " 'activation': ['relu', 'tanh', 'sigmoid', 'gelu']})\n"
+            "print(space.encode({'num_layers': 3, 'learning_rate': 0.01, 'activation': 'gelu'}))"
+        )
+        for seed in ('1', '2'):
+            output = subprocess.check_output(
+                [sys.executable, '-c', script],
+                env=dict(os.environ, PYTHONHASHSEED=seed),
+                cwd=os.path.dirname(os.path.abspath(__file__))
+            )
+            self.assertEqual(int(output), self.space.encode(config))
+    
+    def test_invalid_value(self):
+        """Test values outside the space are rejected"""
+        with self.assertRaises(ValueError):
+            self.space.encode({'num_layers': 7, 'learning_rate': 0.01, 'activation': 'relu'})
+    
+    def test_architecture_ids(self):
+        """Test architectures compare equal across id schemes"""
+        config = {'num_layers': 2, 'learning_rate': 0.001, 'activation': 'tanh'}
+        indexed = Architecture.from_indices(self.space.indices_of(config), self.space)
+        self.assertEqual(indexed.id, self.space.encode(config))
+        self.assertEqual(indexed.config, config)
+        self.assertEqual(indexed, Architecture(dict(config), space=self.space))
+        self.assertEqual(indexed, Architecture(dict(config)))
+        self.assertEqual(hash(indexed), hash(Architecture(dict(config))))
+
+
+class TestArchitectureHistory(unittest.TestCase):
+    """Test the compact architecture representation and columnar history"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.space = SearchSpace({'a': [1, 2, 3], 'b': ['x', 'y']})
+    
+    def test_architecture_has_no_instance_dict(self):
+        """Test architectures use __slots__ and build configs on demand"""
+        arch = Architecture.from_indices([2, 1], self.space)
+        self.assertFalse(hasattr(arch, '__dict__'))
+        self.assertEqual(arch.indices, (2, 1))
+        self.assertEqual(arch.config, {'a': 3, 'b': 'y'})
+    
+    def test_history_round_trip(self):
+        """Test the history stores indices and scores column-wise"""
+        history = ArchitectureHistory(self.space, initial_capacity=1)
+        history.append(Architecture.from_indices([0, 1], self.space, 0.5))
+        history.append(Architecture({'a': 3, 'b': 'x'}, 0.9))
+        history.append(Architecture.from_indices([1, 0], self.space, 0.1))
+        
+        self.assertEqual(len(history), 3)
+        self.assertEqual(history.indices.tolist(), [[0, 1], [2, 0], [1, 0]])
+        self.assertEqual(history.scores.tolist(), [0.5, 0.9, 0.1])
+        self.assertEqual(history[1].config, {'a': 3, 'b': 'x'})
+        self.assertEqual(history[-1].score, 0.1)
+        self.assertEqual([arch.score for arch in history], [0.5, 0.9, 0.1])
+    
+    def _fill(self, history, rows, scores):
+        """Record rows one at a time and as a batch"""
+        for row, score in zip(rows[:3], scores[:3]):
+            history.append(Architecture.from_indices(row, self.space, score))
+        history.extend(np.array(rows[3:]), np.array(scores[3:]))
+    
+    def test_ring_policy(self):
+        """Test the ring policy keeps the most recent results in order"""
+        history = ArchitectureHistory(self.space, policy='ring', max_size=4)
+        rows = [[i % 3, i % 2] for i in range(7)]
+        self._fill(history, rows, [float(i) for i in range(7)])
+        
+        self.assertEqual(len(history), 4)
+        self.assertEqual(history.scores.tolist(), [3.0, 4.0, 5.0, 6.0])
+        self.assertEqual(history.indices.tolist(), rows[3:])
+        self.assertEqual(history[0].score, 3.0)
+        self.assertEqual(history.stats.count, 7)
+    
+    def test_top_k_policy(self):
+        """Test the top_k policy keeps only the best results"""
+        history = ArchitectureHistory(self.space, policy='top_k', max_size=3)
+        scores = [0.5, 0.1, 0.9, 0.3, 0.8, 0.2, 0.7]
+        self._fill(history, [[i % 3, i % 2] for i in range(7)], scores)
+        history.append(Architecture.from_indices([0, 0], self.space, 0.75))
+        
+        self.assertEqual(sorted(history.scores.tolist()), [0.75, 0.8, 0.9])
+        self.assertEqual(history.stats.best_score, 0.9)
+    
+    def test_spill_policy(self):
+        """Test the spill policy bounds memory but keeps every result"""
+        with tempfile.TemporaryDirectory() as directory:
+            history = ArchitectureHistory(self.space, policy='spill', max_size=2,
+                                          spill_path=os.path.join(directory, 'spill.bin'))
+            rows = [[i % 3, i % 2] for i in range(7)]
+            self._fill(history, rows, [float(i) for i in range(7)])
+            
+            self.assertLessEqual(len(history._scores), 2)
+            self.assertEqual(len(history), 7)
+            self.assertEqual(history.indices.tolist(), rows)
+            self.assertEqual([arch.score for arch in history], [float(i) for i in range(7)])
+            history.close()
+        
+        with self.assertRaises(ValueError):
+            ArchitectureHistory(self.space, policy='ring')
+    
+    def test_running_statistics(self):
+        """Test streaming statistics match the full list, including evicted rows"""
+        history = ArchitectureHistory(self.space, policy='ring', max_size=2)
+        rows = [[0, 1], [2, 0], [1, 1], [2, 1], [0, 0]]
+        scores = [0.5, 0.9, 0.1, np.nan, 0.4]
+        self._fill(history, rows, scores)
+        
+        valid = [score for score in scores if not np.isnan(score)]
+        self.assertEqual(history.stats.count, 4)
+        self.assertAlmostEqual(history.stats.mean, np.mean(valid))
+        self.assertAlmostEqual(history.stats.variance, np.var(valid, ddof=1))
+        self.assertEqual(history.stats.best_score, 0.9)
+        self.assertEqual(history.stats.best_indices, (2, 0))
+        self.assertEqual(history.stats.value_counts.tolist(), [[2, 1, 2], [2, 3, 0]])
+    
+    def test_coordinator_history_policy(self):
+        """Test the coordinator bounds agent histories and reports statistics"""
+        random.seed(3)
+        coordinator = MultiAgentSearchCoordinator(
+            search_space={'x': list(range(10)), 'y': list(range(10))},
+            evaluation_fn=deterministic_eval,
+            num_agents=2,
+            history_policy='top_k',
+            history_size=5
+        )
+        coordinator.search(num_iterations=20, verbose=False)
+        
+        stats = coordinator.get_statistics()
+        for agent, agent_stats in zip(coordinator.agents, stats['agent_statistics']):
+            self.assertLessEqual(len(agent.history), 5)
+            self.assertGreater(agent_stats['count'], 5)
+            self.assertEqual(agent_stats['best_score'], agent.history.scores.max())
+
+
+class TestEliteArchive(unittest.TestCase):
+    """Test the shared top-k elite archive"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.search_space = {
+            'x': list(range(10)),
+            'y': list(range(10))
+        }
+        self.space = SearchSpace(self.search_space)
+    
+    def test_keeps_top_k_distinct(self):
+        """Test the archive keeps the k best distinct architectures"""
+        archive = EliteArchive(self.space, capacity=3)
+        for x in [4, 1, 7, 9, 2, 7]:
+            archive.add(Architecture.from_indices([x, 0], self.space, x * 0.1))
+        
+        self.assertEqual(len(archive), 3)
+        self.assertEqual([a.config['x'] for a in archive.elites()], [9, 7, 4])
+        self.assertAlmostEqual(archive.threshold, 0.4)
+        self.assertEqual(archive.best().config, {'x': 9, 'y': 0})
+        self.assertNotIn(self.space.encode({'x': 1, 'y': 0}), archive)
+    
+    def test_add_batch(self):
+        """Test batches only admit rows that beat the threshold"""
+        archive = EliteArchive(self.space, capacity=2)
+        indices = np.array([[1, 1], [5, 5], [3, 3], [5, 5]])
+        self.assertEqual(archive.add_batch(indices, np.array([0.1, 0.5, 0.3, 0.5])), 3)
+        np.testing.assert_array_equal(archive.indices(), [[5, 5], [3, 3]])
+        np.testing.assert_array_equal(archive.scores(), [0.5, 0.3])
+    
+    def test_agents_read_shared_archive(self):
+        """Test greedy agents exploit elites from the shared archive"""
+        random.seed(6)
+        coordinator = MultiAgentSearchCoordinator(
+            search_space=self.search_space,
+            evaluation_fn=deterministic_eval,
+            num_agents=4,
+            agent_types=['greedy', 'tpe', 'evolutionary', 'random'],
+            elite_archive_size=5,
+            proposal_retries=2
+        )
+        self.assertTrue(all(agent.archive is coordinator.archive for agent in coordinator.agents))
+        best = coordinator.search(num_iterations=20, communication_interval=100, verbose=False)
+        
+        stats = coordinator.get_statistics()
+        self.assertEqual(len(stats['elite_scores']), 5)
+        self.assertEqual(stats['elite_scores'][0], best.score)
+        
+        greedy = coordinator.agents[0]
+        greedy.exploration_rate = 0.0
+        elites = {tuple(row) for row in coordinator.archive.indices().tolist()}
+        for _ in range(10):
+            indices = greedy.propose_architecture().indices
+            self.assertTrue(any(sum(a != b for a, b in zip(indices, elite)) <= 1
+                                for elite in elites))
+    
+    def test_archive_survives_resume(self):
+        """Test the archive is checkpointed and re-shared with agents"""
+        with tempfile.TemporaryDirectory() as directory:
+            random.seed(2)
+            first = MultiAgentSearchCoordinator(self.search_space, deterministic_eval,
+                                                agent_types=['greedy'] * 4, elite_archive_size=4)
+            first.search(num_iterations=6, verbose=False, checkpoint=directory)
+            
+            resumed = MultiAgentSearchCoordinator(self.search_space, deterministic_eval,
+                                                  agent_types=['greedy'] * 4, elite_archive_size=4)
+            resumed.search(num_iterations=6, verbose=False, resume_from=directory)
+        
+        self.assertEqual(resumed.archive.entries(), first.archive.entries())
+        self.assertTrue(all(agent.archive is resumed.archive for agent in resumed.agents))
+
+
+class ConfigAgent(Agent):
+    """Custom agent building plain Architecture(config) proposals"""
+    
+    def propose_architecture(self):
+        return Architecture({name: random.choice(values)
+                             for name, values in self.search_space.items()})
+    
+    def update(self, architecture, score):
+        architecture.score = score
+        self.history.append(architecture)
+
+
+class TestCustomAgents(unittest.TestCase):
+    """Test agents that build architectures without the search space"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.search_space = {'x': [1, 2, 3], 'y': [10, 20, 30]}
+        self.evaluated = []
+    
+    def _recording_eval(self, config):
+        self.evaluated.append((config['x'], config['y']))
+        return deterministic_eval(config)
+    
+    def _coordinator(self):
+        coordinator = MultiAgentSearchCoordinator(
+            search_space=self.search_space,
+            evaluation_fn=self._recording_eval,
+            num_agents=2,
+            agent_types=['random', 'random']
+        )
+        coordinator.agents[0] = ConfigAgent(0, coordinator.space)
+        return coordinator
+    
+    def test_duplicates_are_not_reevaluated(self):
+        """Test custom and built-in proposals share one seen-set"""
+        random.seed(5)
+        coordinator = self._coordinator()
+        coordinator.search(num_iterations=30, verbose=False)
+        
+        self.assertEqual(len(self.evaluated), len(set(self.evaluated)))
+        self.assertEqual(len(coordinator.evaluated_architectures), len(self.evaluated))
+        self.assertLessEqual(len(self.evaluated), 9)
+        self.assertTrue(all(0 <= fingerprint < 9
+                            for fingerprint in coordinator.evaluated_architectures))
+    
+    def test_checkpoint_resume(self):
+        """Test a checkpoint journaling custom proposals can be resumed"""
+        with tempfile.TemporaryDirectory() as directory:
+            random.seed(6)
+            first = self._coordinator()
+            first.search(num_iterations=3, verbose=False, checkpoint=directory)
+            
+            resumed = self._coordinator()
+            resumed.search(num_iterations=5, verbose=False, resume_from=directory)
+        
+        self.assertEqual(len(self.evaluated), len(set(self.evaluated)))
+        self.assertTrue(first.evaluated_architectures <= resumed.evaluated_architectures)
+
+
 class TestAgents(unittest.TestCase):
     """Test agent classes"""
     
@@ -120,6 +437,190 @@ class TestAgents(unittest.TestCase):
         self.assertEqual(agent2.best_architecture, arch1)
 
 
+class TestTPEAgent(unittest.TestCase):
+    """Test the surrogate-model (TPE) agent"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.search_space = {
+            'x': list(range(10)),
+            'y': list(range(10))
+        }
+    
+    def test_good_set_tracks_top_fraction(self):
+        """Test the incremental split always holds the top gamma fraction"""
+        random.seed(3)
+        agent = TPESearchAgent(0, self.search_space, gamma=0.25)
+        scores = []
+        for _ in range(40):
+            arch = agent.propose_architecture()
+            score = deterministic_eval(arch.config)
+            if arch.id not in {a.id for a in agent.history}:
+                scores.append(score)
+            agent.update(arch, score)
+            
+            good = sorted(entry[0] for entry in agent._good)
+            self.assertEqual(len(good), max(1, -(-len(scores) // 4)))
+            self.assertEqual(good, sorted(scores)[-len(good):])
+        self.assertEqual(agent._good_counts.sum() + agent._bad_counts.sum(), 2 * len(scores))
+    
+    def test_model_concentrates_proposals(self):
+        """Test proposals after warm-up favour the high-scoring region"""
+        random.seed(0)
+        agent = TPESearchAgent(0, self.search_space, min_observations=10)
+        # Stop warming up while the best region still has unobserved configs
+        for _ in range(20):
+            arch = agent.propose_architecture()
+            agent.update(arch, deterministic_eval(arch.config))
+        
+        proposals = agent.propose_batch(200)
+        self.assertEqual(proposals.shape, (200, 2))
+        self.assertGreater(proposals[:, 0].mean(), 6)
+        
+        # Already evaluated configs are not proposed again
+        fingerprints = SearchSpace(self.search_space).fingerprints(proposals).tolist()
+        self.assertFalse(agent._observed.intersection(fingerprints))
+        
+        random.seed(1)
+        coordinator = MultiAgentSearchCoordinator(
+            search_space=self.search_space,
+            evaluation_fn=deterministic_eval,
+            num_agents=1,
+            agent_types=['tpe']
+        )
+        coordinator.search(num_iterations=40, verbose=False)
+        self.assertGreater(coordinator.get_statistics()['proposal_yield'], 0.9)
+    
+    def test_share_knowledge_with_tpe_agent(self):
+        """Test TPE agents pass their good set to each other"""
+        agent1 = TPESearchAgent(0, self.search_space)
+        agent2 = TPESearchAgent(1, self.search_space)
+        agent1.update(Architecture({'x': 9, 'y': 9}), 0.99)
+        agent1.update(Architecture({'x': 0, 'y': 0}), 0.0)
+        agent2.update(Architecture({'x': 1, 'y': 1}), 0.11)
+        
+        agent1.share_knowledge(agent2)
+        
+        self.assertEqual(agent2.best_architecture.score, 0.99)
+        self.assertIn(SearchSpace(self.search_space).encode({'x': 9, 'y': 9}), agent2._observed)
+        self.assertEqual(max(entry[0] for entry in agent2._good), 0.99)
+    
+    def test_registered_agent_type(self):
+        """Test 'tpe' agents plug into the coordinator and checkpoints"""
+        random.seed(11)
+        coordinator = MultiAgentSearchCoordinator(
+            search_space=self.search_space,
+            evaluation_fn=deterministic_eval,
+            num_agents=2,
+            agent_types=['tpe', 'tpe'],
+            proposal_retries=3
+        )
+        self.assertIsInstance(coordinator.agents[0], TPESearchAgent)
+        with tempfile.TemporaryDirectory() as directory:
+            best = coordinator.search(num_iterations=30, verbose=False, checkpoint=directory)
+            restored = MultiAgentSearchCoordinator(
+                search_space=self.search_space,
+                evaluation_fn=deterministic_eval,
+                num_agents=2,
+                agent_types=['tpe', 'tpe']
+            )
+            restored.search(num_iterations=30, verbose=False, resume_from=directory)
+        self.assertGreater(best.score, 0.9)
+        
+        # The model is rebuilt from the journaled history, not pickled
+        original, agent = coordinator.agents[0], restored.agents[0]
+        self.assertNotIn('_observed', original.get_state())
+        self.assertNotIn('_good', original.get_state())
+        own = set(SearchSpace(self.search_space).fingerprints(original.history.indices).tolist())
+        self.assertEqual(agent._observed, own)
+        self.assertTrue(agent._observed <= original._observed)
+        self.assertEqual(agent._good_counts.sum() + agent._bad_counts.sum(),
+                         2 * len(agent._observed))
+
+
+class TestEvolutionaryAgent(unittest.TestCase):
+    """Test the population-based evolutionary agent"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.search_space = {
+            'x': list(range(10)),
+            'y': list(range(10)),
+            'z': ['a', 'b', 'c']
+        }
+    
+    def test_population_keeps_fittest_distinct(self):
+        """Test the population holds the best distinct architectures"""
+        agent = EvolutionarySearchAgent(0, self.search_space, population_size=4)
+        indices = np.array([[i, i, 0] for i in range(10)] + [[9, 9, 0]])
+        agent.update_batch(indices, indices[:, 0] * 0.1)
+        
+        self.assertEqual(sorted(agent._population[:, 0].tolist()), [6, 7, 8, 9])
+        self.assertEqual(len(agent.history), 11)
+        self.assertEqual(agent.best_architecture.config['x'], 9)
+    
+    def test_generation_is_valid_and_mutated(self):
+        """Test a generation is bred in one call, differs from parents and stays in range"""
+        random.seed(2)
+        agent = EvolutionarySearchAgent(0, self.search_space, population_size=8,
+                                        crossover_rate=0.0, mutation_rate=0.0)
+        agent.update_batch(np.array([[5, 5, 1], [5, 5, 2]]), np.array([1.0, 0.5]))
+        
+        generation = agent.propose_generation()
+        self.assertEqual(generation.shape, (8, 3))
+        self.assertTrue((generation < np.array([10, 10, 3])).all())
+        # Exactly one gene was forced to mutate, so at most one differs from a parent
+        differences = np.minimum((generation != [5, 5, 1]).sum(axis=1),
+                                 (generation != [5, 5, 2]).sum(axis=1))
+        self.assertTrue((differences <= 1).all())
+    
+    def test_scalar_proposals_drain_a_generation(self):
+        """Test propose_architecture hands out a buffered generation"""
+        random.seed(4)
+        agent = EvolutionarySearchAgent(0, self.search_space, population_size=5)
+        for _ in range(12):
+            arch = agent.propose_architecture()
+            agent.update(arch, deterministic_eval(arch.config))
+        self.assertLessEqual(len(agent._population), 5)
+        self.assertLess(len(agent._pending), 5)
+    
+    def test_migration_between_agents(self):
+        """Test evolutionary agents exchange their populations"""
+        agent1 = EvolutionarySearchAgent(0, self.search_space, population_size=3)
+        agent2 = EvolutionarySearchAgent(1, self.search_space, population_size=3)
+        agent1.update_batch(np.array([[9, 9, 0], [8, 8, 0]]), np.array([0.99, 0.88]))
+        agent2.update_batch(np.array([[0, 0, 0], [1, 1, 0]]), np.array([0.0, 0.11]))
+        
+        agent1.share_knowledge(agent2)
+        
+        self.assertEqual(agent2.best_architecture.score, 0.99)
+        self.assertEqual(sorted(agent2._fitness.tolist()), [0.11, 0.88, 0.99])
+    
+    def test_registered_agent_type(self):
+        """Test 'evolutionary' agents plug into scalar and batched search"""
+        random.seed(8)
+        coordinator = MultiAgentSearchCoordinator(
+            search_space={'x': list(range(10)), 'y': list(range(10))},
+            evaluation_fn=deterministic_eval,
+            num_agents=2,
+            agent_types=['evolutionary', 'evolutionary'],
+            proposal_retries=3
+        )
+        self.assertIsInstance(coordinator.agents[1], EvolutionarySearchAgent)
+        best = coordinator.search(num_iterations=30, verbose=False)
+        self.assertGreater(best.score, 0.85)
+        
+        batched = MultiAgentSearchCoordinator(
+            search_space={'x': list(range(10)), 'y': list(range(10))},
+            evaluation_fn=None,
+            batch_evaluation_fn=lambda batch: batch['x'] * 0.1 + batch['y'] * 0.01,
+            batch_size=10,
+            agent_types=['evolutionary'] * 4
+        )
+        best = batched.search(num_iterations=5, verbose=False)
+        self.assertGreater(best.score, 0.85)
+
+
 class TestCoordinator(unittest.TestCase):
     """Test MultiAgentSearchCoordinator"""
     
@@ -199,6 +700,676 @@ class TestCoordinator(unittest.TestCase):
         self.assertEqual(len(stats['agent_best_scores']), 2)
 
 
+class TestParallelEvaluation(unittest.TestCase):
+    """Test executor backends for MultiAgentSearchCoordinator"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.search_space = {
+            'x': [1, 2, 3, 4, 5, 6, 7, 8],
+            'y': [10, 20, 30, 40]
+        }
+    
+    def _run(self, executor, **kwargs):
+        random.seed(1234)
+        coordinator = MultiAgentSearchCoordinator(
+            search_space=self.search_space,
+            evaluation_fn=deterministic_eval,
+            num_agents=4,
+            executor=executor,
+            **kwargs
+        )
+        coordinator.search(num_iterations=15, communication_interval=5, verbose=False)
+        return [
+            [(arch.id, arch.score) for arch in agent.history]
+            for agent in coordinator.agents
+        ]
+    
+    def test_backends_match_serial(self):
+        """Test thread and process backends reproduce the serial trajectory"""
+        serial = self._run('serial')
+        self.assertEqual(self._run('thread', max_workers=4), serial)
+        self.assertEqual(self._run('process', max_workers=2), serial)
+    
+    def test_external_executor_not_shut_down(self):
+        """Test a user-supplied executor is reused and left running"""
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            self.assertEqual(self._run(pool), self._run('serial'))
+            self.assertEqual(pool.submit(sum, [1, 2]).result(), 3)
+    
+    def test_invalid_executor(self):
+        """Test unknown executor names are rejected"""
+        with self.assertRaises(ValueError):
+            MultiAgentSearchCoordinator(
+                search_space=self.search_space,
+                evaluation_fn=deterministic_eval,
+                executor='gpu'
+            )
+
+
+class TestSteadyStateSearch(unittest.TestCase):
+    """Test the barrier-free steady-state search mode"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.search_space = {
+            'x': [1, 2, 3, 4, 5, 6, 7, 8],
+            'y': [10, 20, 30, 40]
+        }
+    
+    def test_respects_evaluation_budget(self):
+        """Test steady-state search stops after max_evaluations"""
+        coordinator = MultiAgentSearchCoordinator(
+            search_space=self.search_space,
+            evaluation_fn=deterministic_eval,
+            num_agents=3,
+            executor='thread',
+            max_workers=3
+        )
+        
+        best = coordinator.search_steady_state(
+            max_evaluations=20, communication_every=5, verbose=False
+        )
+        
+        self.assertIsNotNone(best)
+        self.assertEqual(len(coordinator.evaluated_architectures), 20)
+        self.assertEqual(sum(len(agent.history) for agent in coordinator.agents), 20)
+    
+    def test_fast_agents_do_not_wait_for_slow_ones(self):
+        """Test fast agents keep proposing while a slow evaluation is in flight"""
+        slow = {'x': 1, 'y': 10}
+        finished = []
+        
+        def timed_eval(config):
+            time.sleep(0.5 if config == slow else 0.01)
+            finished.append((config == slow, time.monotonic()))
+            return deterministic_eval(config)
+        
+        random.seed(9)
+        coordinator = MultiAgentSearchCoordinator(
+            search_space=self.search_space,
+            evaluation_fn=timed_eval,
+            num_agents=3,
+            executor='thread',
+            max_workers=3
+        )
+        # The first agent starts with the slow configuration
+        first_proposal = coordinator.agents[0].propose_architecture
+        proposals = iter([Architecture(slow, space=coordinator.space)])
+        coordinator.agents[0].propose_architecture = lambda: next(proposals, None) or first_proposal()
+        
+        coordinator.search_steady_state(max_evaluations=15, verbose=False)
+        
+        slow_done = next(at for is_slow, at in finished if is_slow)
+        fast_before = sum(not is_slow and at < slow_done for is_slow, at in finished)
+        # Two agents each ran several evaluations during the slow one
+        self.assertGreaterEqual(fast_before, 10)
+        self.assertTrue(all(len(agent.history) >= 3 for agent in coordinator.agents[1:]))
+    
+    def test_stops_when_space_exhausted(self):
+        """Test steady-state search terminates once every config was seen"""
+        coordinator = MultiAgentSearchCoordinator(
+            search_space={'x': [1, 2], 'y': [10, 20]},
+            evaluation_fn=deterministic_eval,
+            num_agents=2
+        )
+        
+        best = coordinator.search_steady_state(
+            max_evaluations=100, max_proposal_attempts=200, verbose=False
+        )
+        
+        self.assertEqual(best.config, {'x': 2, 'y': 20})
+        self.assertEqual(len(coordinator.evaluated_architectures), 4)
+
+
+class TestEvaluationCache(unittest.TestCase):
+    """Test the persistent evaluation cache"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'scores.sqlite')
+        self.search_space = {
+            'x': [1, 2, 3, 4, 5, 6, 7, 8],
+            'y': [10, 20, 30, 40]
+        }
+        self.calls = 0
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def _counting_eval(self, config):
+        self.calls += 1
+        return deterministic_eval(config)
+    
+    def test_digest_is_order_independent(self):
+        """Test config digests ignore key order"""
+        self.assertEqual(config_digest({'a': 1, 'b': 0.5}), config_digest({'b': 0.5, 'a': 1}))
+        self.assertNotEqual(config_digest({'a': 1}), config_digest({'a': 2}))
+    
+    def test_scores_persist_across_instances(self):
+        """Test cached scores survive reopening the file"""
+        cache = EvaluationCache(self.path)
+        cache.put({'x': 1, 'y': 10}, 0.25)
+        cache.close()
+        
+        cache = EvaluationCache(self.path)
+        self.assertEqual(cache.get({'y': 10, 'x': 1}), 0.25)
+        self.assertIsNone(cache.get({'x': 2, 'y': 10}))
+        self.assertEqual(cache.get_statistics()['hits'], 1)
+        self.assertEqual(cache.get_statistics()['misses'], 1)
+        cache.close()
+    
+    def test_restarted_search_reuses_scores(self):
+        """Test a rerun with the same seed is served entirely from cache"""
+        for run in range(2):
+            random.seed(7)
+            coordinator = MultiAgentSearchCoordinator(
+                search_space=self.search_space,
+                evaluation_fn=self._counting_eval,
+                num_agents=3,
+                cache=self.path
+            )
+            coordinator.search(num_iterations=5, verbose=False)
+            stats = coordinator.get_statistics()
+            coordinator.cache.close()
+            if run == 0:
+                first_calls = self.calls
+                self.assertEqual(stats['cache_misses'], first_calls)
+        
+        self.assertEqual(self.calls, first_calls)
+        self.assertEqual(stats['cache_hits'], first_calls)
+        self.assertEqual(stats['cache_misses'], 0)
+    
+    def test_batched_search_uses_cache(self):
+        """Test batch evaluation only receives configs missing from the cache"""
+        def batch_fn(batch):
+            self.calls += len(batch)
+            return batch['x'] * 0.1 + batch['y'] * 0.001
+        
+        for run in range(2):
+            random.seed(3)
+            coordinator = MultiAgentSearchCoordinator(
+                search_space=self.search_space,
+                evaluation_fn=None,
+                batch_evaluation_fn=batch_fn,
+                batch_size=4,
+                num_agents=2,
+                cache=self.path
+            )
+            best = coordinator.search(num_iterations=3, verbose=False)
+            stats = coordinator.get_statistics()
+            if run == 0:
+                first_calls = self.calls
+                self.assertEqual(stats['cache_misses'], first_calls)
+                self.assertEqual(len(coordinator.cache), first_calls)
+                cached = coordinator.cache.get(best.config)
+                self.assertAlmostEqual(cached, best.score)
+            coordinator.cache.close()
+        
+        self.assertEqual(self.calls, first_calls)
+        self.assertEqual(stats['cache_hits'], first_calls)
+        self.assertEqual(stats['cache_misses'], 0)
+
+
+class TestDedupProposals(unittest.TestCase):
+    """Test dedup-aware proposal retries"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.search_space = {'x': [1, 2, 3, 4], 'y': [10, 20, 30]}
+    
+    def test_default_skips_duplicates(self):
+        """Test without retries duplicates still cost the agent its turn"""
+        random.seed(3)
+        coordinator = MultiAgentSearchCoordinator(
+            search_space=self.search_space,
+            evaluation_fn=deterministic_eval,
+            num_agents=4
+        )
+        coordinator.search(num_iterations=10, verbose=False)
+        stats = coordinator.get_statistics()
+        
+        self.assertEqual(stats['num_proposals'], 40)
+        self.assertEqual(stats['unique_proposals'], stats['num_evaluated'])
+        self.assertLess(stats['proposal_yield'], 1.0)
+        
+        per_iteration = stats['proposals_per_iteration']
+        self.assertEqual(len(per_iteration), 10)
+        self.assertTrue(all(proposed == 4 for proposed, _ in per_iteration))
+        self.assertEqual(sum(unique for _, unique in per_iteration), stats['num_evaluated'])
+        self.assertEqual(stats['proposal_yield_per_iteration'][0], 1.0)
+        # Duplicates pile up as the small space fills
+        self.assertLess(stats['proposal_yield_per_iteration'][-1], 1.0)
+    
+    def test_iteration_events_report_proposals(self):
+        """Test iteration events carry that iteration's proposal counts"""
+        random.seed(3)
+        coordinator = MultiAgentSearchCoordinator(
+            search_space=self.search_space,
+            evaluation_fn=None,
+            batch_evaluation_fn=lambda batch: batch['x'] + batch['y'] * 0.01,
+            batch_size=3,
+            num_agents=2
+        )
+        events = [event for event in coordinator.iter_search(num_iterations=4)
+                  if event['event'] == 'iteration']
+        
+        self.assertEqual([event['proposals'] for event in events], [6] * 4)
+        self.assertEqual([event['unique_proposals'] for event in events],
+                         [event['evaluations'] for event in events])
+        self.assertEqual(
+            [(event['proposals'], event['unique_proposals']) for event in events],
+            coordinator.get_statistics()['proposals_per_iteration']
+        )
+    
+    def test_retries_exhaust_space(self):
+        """Test retries plus unvisited sampling cover the whole space"""
+        random.seed(3)
+        coordinator = MultiAgentSearchCoordinator(
+            search_space=self.search_space,
+            evaluation_fn=deterministic_eval,
+            num_agents=4,
+            proposal_retries=3,
+            exhaustion_fraction=0.5
+        )
+        best = coordinator.search(num_iterations=3, verbose=False)
+        
+        self.assertEqual(len(coordinator.evaluated_architectures), 12)
+        self.assertEqual(best.config, {'x': 4, 'y': 30})
+        
+        # Once exhausted no further proposals are accepted
+        coordinator.search(num_iterations=1, verbose=False)
+        self.assertEqual(coordinator.get_statistics()['unique_proposals'], 12)
+
+
+class TestBatchEvaluation(unittest.TestCase):
+    """Test the vectorized batch evaluation path"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.search_space = {
+            'num_layers': [1, 2, 3, 4, 5, 6],
+            'layer_size': [32, 64, 128, 256, 512],
+            'learning_rate': [0.001, 0.005, 0.01, 0.05, 0.1],
+            'activation': ['relu', 'tanh', 'sigmoid']
+        }
+    
+    def test_config_batch_columns(self):
+        """Test batch columns map indices to values"""
+        space = SearchSpace(self.search_space)
+        batch = ConfigBatch(np.array([[0, 4, 2, 1], [5, 0, 0, 2]]), space)
+        self.assertEqual(batch['layer_size'].tolist(), [512, 32])
+        self.assertEqual(batch['activation'].tolist(), ['tanh', 'sigmoid'])
+        self.assertEqual(batch.configs()[1]['num_layers'], 6)
+    
+    def test_batch_fn_matches_scalar_fn(self):
+        """Test the vectorized example scorer agrees with the scalar one"""
+        space = SearchSpace(self.search_space)
+        indices = np.array([space.unpack(f) for f in range(len(space))])
+        batch = ConfigBatch(indices, space)
+        
+        random.seed(0)
+        batch_scores = example_batch_evaluation_function(batch)
+        random.seed(0)
+        scalar_scores = [example_evaluation_function(c) for c in batch.configs()]
+        
+        # Both add at most 0.05 of noise
+        np.testing.assert_allclose(batch_scores, scalar_scores, atol=0.1)
+    
+    def test_batched_search(self):
+        """Test whole iterations are routed through the batch function"""
+        calls = []
+        
+        def batch_fn(batch):
+            calls.append(len(batch))
+            return example_batch_evaluation_function(batch)
+        
+        random.seed(11)
+        coordinator = MultiAgentSearchCoordinator(
+            search_space=self.search_space,
+            evaluation_fn=None,
+            batch_evaluation_fn=batch_fn,
+            batch_size=16,
+            num_agents=4
+        )
+        best = coordinator.search(num_iterations=5, communication_interval=2, verbose=False)
+        stats = coordinator.get_statistics()
+        
+        self.assertEqual(len(calls), 5)
+        self.assertEqual(sum(calls), stats['num_evaluated'])
+        self.assertEqual(stats['num_proposals'], 5 * 4 * 16)
+        self.assertEqual(
+            sum(len(agent.history) for agent in coordinator.agents), stats['num_evaluated']
+        )
+        self.assertGreater(best.score, 0.8)
+        self.assertEqual(best.score, max(agent.best_architecture.score
+                                         for agent in coordinator.agents))
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Test per-phase profiling and hooks"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.search_space = {
+            'x': [1, 2, 3, 4, 5, 6, 7, 8],
+            'y': [10, 20, 30, 40]
+        }
+    
+    def test_profile_disabled_by_default(self):
+        """Test statistics carry no profile unless requested"""
+        coordinator = MultiAgentSearchCoordinator(
+            search_space=self.search_space,
+            evaluation_fn=deterministic_eval
+        )
+        coordinator.search(num_iterations=3, verbose=False)
+        self.assertIsNone(coordinator.profiler)
+        self.assertIsNone(coordinator.get_statistics()['profile'])
+    
+    def test_phase_summary(self):
+        """Test every phase of search() is timed"""
+        coordinator = MultiAgentSearchCoordinator(
+            search_space=self.search_space,
+            evaluation_fn=deterministic_eval,
+            num_agents=2,
+            profile=True
+        )
+        coordinator.search(num_iterations=10, communication_interval=5, verbose=False)
+        profile = coordinator.get_statistics()['profile']
+        
+        self.assertEqual(profile['phases']['propose']['calls'], 10)
+        self.assertEqual(profile['phases']['evaluate']['calls'], 10)
+        self.assertEqual(profile['phases']['update']['calls'], 10)
+        self.assertEqual(profile['phases']['communicate']['calls'], 2)
+        self.assertGreaterEqual(profile['phases']['fingerprint']['calls'], 20)
+        self.assertEqual(profile['counters']['evaluations'],
+                         coordinator.get_statistics()['num_evaluated'])
+    
+    def test_hooks(self):
+        """Test before/after hooks receive phase context"""
+        profiler = SearchProfiler()
+        events = []
+        profiler.add_hook('evaluate', lambda phase, ctx: events.append(('before', phase)),
+                          when='before')
+        profiler.add_hook('evaluate',
+                          lambda phase, elapsed, ctx: events.append(('after', len(ctx['scores']))))
+        fingerprints = []
+        profiler.add_hook('fingerprint', lambda phase, ctx: fingerprints.append('before'),
+                          when='before')
+        profiler.add_hook('fingerprint',
+                          lambda phase, elapsed, ctx: fingerprints.append(ctx['result']))
+        coordinator = MultiAgentSearchCoordinator(
+            search_space=self.search_space,
+            evaluation_fn=deterministic_eval,
+            num_agents=3,
+            profile=profiler
+        )
+        coordinator.search(num_iterations=2, verbose=False)
+        
+        self.assertEqual(events[0], ('before', 'evaluate'))
+        self.assertEqual(events[1][0], 'after')
+        self.assertEqual(len(events), 4)
+        
+        # Every phase in PHASES reaches its hooks, fingerprint included
+        self.assertEqual(len(fingerprints), 2 * profiler.calls['fingerprint'])
+        self.assertGreater(len(fingerprints), 0)
+        self.assertEqual(fingerprints[0], 'before')
+        self.assertTrue(all(0 <= fingerprint < len(coordinator.space)
+                            for fingerprint in fingerprints[1::2]))
+        with self.assertRaises(ValueError):
+            profiler.add_hook('train', print)
+
+
+def noisy_eval(config):
+    """Evaluation that draws from the global random stream"""
+    return deterministic_eval(config) + random.uniform(-0.05, 0.05)
+
+
+class TestCheckpointing(unittest.TestCase):
+    """Test checkpoint/resume of search()"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.search_space = {
+            'x': list(range(12)),
+            'y': [10, 20, 30, 40, 50]
+        }
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def _coordinator(self, **kwargs):
+        return MultiAgentSearchCoordinator(
+            search_space=self.search_space,
+            evaluation_fn=noisy_eval,
+            num_agents=4,
+            proposal_retries=2,
+            exhaustion_fraction=0.5,
+            **kwargs
+        )
+    
+    def _trajectory(self, coordinator):
+        return (
+            [[(arch.id, arch.score) for arch in agent.history] for agent in coordinator.agents],
+            [agent.best_architecture.id for agent in coordinator.agents],
+            coordinator.get_statistics()
+        )
+    
+    def test_resume_matches_uninterrupted_run(self):
+        """Test a resumed run reproduces an uninterrupted one exactly"""
+        random.seed(5)
+        uninterrupted = self._coordinator()
+        uninterrupted.search(num_iterations=20, communication_interval=3, verbose=False)
+        
+        directory = os.path.join(self.tmpdir.name, 'ckpt')
+        random.seed(5)
+        first = self._coordinator()
+        first.search(num_iterations=12, communication_interval=3, verbose=False,
+                     checkpoint=directory, checkpoint_interval=4)
+        
+        random.seed(999)  # The checkpoint must restore the random stream
+        resumed = self._coordinator()
+        resumed.search(num_iterations=20, communication_interval=3, verbose=False,
+                       resume_from=directory)
+        
+        self.assertEqual(self._trajectory(resumed), self._trajectory(uninterrupted))
+    
+    def test_incomplete_journal_tail_is_discarded(self):
+        """Test journal records past the snapshot are ignored on resume"""
+        directory = os.path.join(self.tmpdir.name, 'ckpt')
+        random.seed(1)
+        first = self._coordinator()
+        first.search(num_iterations=4, verbose=False, checkpoint=directory,
+                     checkpoint_interval=2)
+        with open(os.path.join(directory, 'journal.jsonl'), 'a') as journal:
+            journal.write('[0, 1, 0.5]\n')
+        
+        resumed = self._coordinator()
+        resumed.search(num_iterations=4, verbose=False, resume_from=directory)
+        self.assertEqual(resumed.evaluated_architectures, first.evaluated_architectures)
+        self.assertEqual(resumed.iteration, 3)
+
+
+def budgeted_eval(config, budget):
+    """Deterministic score that only reveals its full value at budget 9"""
+    return deterministic_eval(config) * budget / 9
+
+
+class TestMultiFidelity(unittest.TestCase):
+    """Test successive halving / Hyperband scheduling"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.search_space = {
+            'x': list(range(10)),
+            'y': list(range(10))
+        }
+    
+    def test_successive_halving_rungs(self):
+        """Test rung sizes shrink and budgets grow by eta"""
+        rungs = successive_halving_rungs(27, 1, 9, eta=3)
+        self.assertEqual(rungs, [(27, 1), (9, 3), (3, 9)])
+        self.assertEqual(bracket_cost(rungs), 81)
+        with self.assertRaises(ValueError):
+            successive_halving_rungs(10, 0, 9)
+    
+    def test_hyperband_brackets(self):
+        """Test Hyperband brackets end at the full budget"""
+        brackets = hyperband_brackets(1, 27, eta=3)
+        self.assertEqual(len(brackets), 4)
+        self.assertEqual(brackets[0][0], (27, 1))
+        self.assertEqual(brackets[-1], [(4, 27)])
+        for rungs in brackets:
+            self.assertEqual(rungs[-1][1], 27)
+    
+    def test_promotes_best_configs(self):
+        """Test only top configs reach the full budget and the best is full-budget"""
+        calls = []
+        
+        def tracked_eval(config, budget):
+            calls.append(budget)
+            return budgeted_eval(config, budget)
+        
+        random.seed(42)
+        coordinator = MultiAgentSearchCoordinator(
+            search_space=self.search_space,
+            evaluation_fn=tracked_eval,
+            num_agents=3,
+            proposal_retries=10
+        )
+        best = coordinator.search_multi_fidelity(
+            max_budget=9, min_budget=1, num_configs=27, verbose=False
+        )
+        
+        self.assertEqual(sorted(set(calls)), [1, 3, 9])
+        self.assertEqual(calls.count(1), 27)
+        self.assertEqual(calls.count(3), 9)
+        self.assertEqual(calls.count(9), 3)
+        self.assertEqual(coordinator.get_statistics()['budget_spent'], 81)
+        self.assertAlmostEqual(best.score, deterministic_eval(best.config))
+        
+        # Every proposal was fed back to an agent exactly once
+        self.assertEqual(sum(len(agent.history) for agent in coordinator.agents), 27)
+        self.assertEqual(coordinator.get_statistics()['num_evaluated'], 27)
+    
+    def test_hyperband_finds_good_config(self):
+        """Test Hyperband rounds find a strong config for less than full-cost sweeps"""
+        random.seed(0)
+        coordinator = MultiAgentSearchCoordinator(
+            search_space=self.search_space,
+            evaluation_fn=budgeted_eval,
+            num_agents=4,
+            executor='thread',
+            max_workers=2
+        )
+        best = coordinator.search_multi_fidelity(
+            max_budget=9, min_budget=1, num_rounds=2, verbose=False
+        )
+        stats = coordinator.get_statistics()
+        
+        self.assertGreater(best.score, 0.9)
+        self.assertLess(stats['budget_spent'], stats['num_evaluated'] * 9)
+    
+    def test_budgeted_results_are_cached_per_budget(self):
+        """Test the cache keeps separate scores per budget"""
+        random.seed(1)
+        cache = EvaluationCache()
+        coordinator = MultiAgentSearchCoordinator(
+            search_space=self.search_space,
+            evaluation_fn=budgeted_eval,
+            num_agents=2,
+            cache=cache,
+            proposal_retries=10
+        )
+        coordinator.search_multi_fidelity(max_budget=9, num_configs=9, verbose=False)
+        self.assertEqual(len(cache), 9 + 3 + 1)
+        
+        config = {'x': 9, 'y': 9}
+        self.assertNotIn(config, cache)
+
+
+class TestEventStream(unittest.TestCase):
+    """Test iter_search events and the JSON Lines event log"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.search_space = {
+            'x': list(range(10)),
+            'y': list(range(10))
+        }
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def test_iter_search_matches_search(self):
+        """Test the generator reports every evaluation and drives the same search"""
+        random.seed(21)
+        streamed = MultiAgentSearchCoordinator(self.search_space, deterministic_eval, num_agents=3)
+        events = list(streamed.iter_search(num_iterations=15, communication_interval=5))
+        
+        random.seed(21)
+        plain = MultiAgentSearchCoordinator(self.search_space, deterministic_eval, num_agents=3)
+        best = plain.search(num_iterations=15, communication_interval=5, verbose=False)
+        
+        evaluations = [e for e in events if e['event'] == 'evaluation']
+        self.assertEqual(len(evaluations), len(streamed.evaluated_architectures))
+        self.assertEqual(
+            [(e['fingerprint'], e['score']) for e in evaluations if e['agent_id'] == 1],
+            [(arch.id, arch.score) for arch in streamed.agents[1].history]
+        )
+        self.assertEqual(sum(e['event'] == 'iteration' for e in events), 15)
+        self.assertEqual(sum(e['event'] == 'communication' for e in events), 3)
+        self.assertEqual(events[-1]['event'], 'end')
+        self.assertEqual(events[-1]['best_fingerprint'], best.id)
+        self.assertEqual([e['score'] for e in events if e['event'] == 'new_best'][-1], best.score)
+    
+    def test_closing_generator_stops_search(self):
+        """Test a consumer can stop the search early"""
+        coordinator = MultiAgentSearchCoordinator(
+            self.search_space, deterministic_eval, num_agents=2, executor='thread'
+        )
+        stream = coordinator.iter_search(num_iterations=50, evaluations=False)
+        for event in stream:
+            self.assertNotEqual(event['event'], 'evaluation')
+            if event['event'] == 'iteration' and event['iteration'] == 2:
+                break
+        stream.close()
+        self.assertEqual(coordinator.iteration, 2)
+    
+    def test_event_log(self):
+        """Test search() appends a readable JSON Lines log"""
+        path = os.path.join(self.tmpdir.name, 'events.jsonl')
+        random.seed(4)
+        coordinator = MultiAgentSearchCoordinator(
+            search_space=self.search_space,
+            evaluation_fn=None,
+            batch_evaluation_fn=example_batch_evaluation_function_xy,
+            batch_size=5,
+            num_agents=2
+        )
+        coordinator.search(num_iterations=4, verbose=False, event_log=path)
+        
+        evaluations = list(read_events(path, 'evaluation'))
+        self.assertEqual(len(evaluations), len(coordinator.evaluated_architectures))
+        best = max(evaluations, key=lambda e: e['score'])
+        self.assertEqual(best['fingerprint'], coordinator.best_architecture.id)
+        self.assertEqual(list(read_events(path, 'end'))[0]['num_evaluated'],
+                         len(coordinator.evaluated_architectures))
+        
+        # A torn last line from a running writer is skipped
+        with open(path, 'a') as f:
+            f.write('{"event": "evalu')
+        self.assertEqual(len(list(read_events(path, 'evaluation'))), len(evaluations))
+
+
+def example_batch_evaluation_function_xy(batch):
+    """Vectorized form of deterministic_eval"""
+    return batch['x'] * 0.1 + batch['y'] * 0.01
+
+
 class TestIntegration(unittest.TestCase):
     """Integration tests"""
     
@@ -0,0 +1,171 @@
+"""
+Test suite for the batched projection pursuit indices
+"""
+
+import unittest
+import numpy as np
+from projection_indices import (
+    CentralMassIndex,
+    HolesIndex,
+    LDAIndex,
+    PDAIndex,
+    StringyIndex,
+    covariance,
+    eigenvalues_2x2,
+    group_scatter,
+    make_index,
+    orthonormalize,
+    random_bases,
+    sphere,
+    stringy_index,
+    stringy_index_from_covariance
+)
+
+
+def reference_lda(data, labels, basis):
+    """tourr's lda_pp computed on the projected data"""
+    projected = data @ basis
+    within = np.zeros((basis.shape[1], basis.shape[1]))
+    for label in np.unique(labels):
+        group = projected[labels == label]
+        centered = group - group.mean(axis=0)
+        within += centered.T @ centered
+    centered = projected - projected.mean(axis=0)
+    return 1 - np.linalg.det(within) / np.linalg.det(centered.T @ centered)
+
+
+class TestStringyIndex(unittest.TestCase):
+    """Test the batched closed-form stringy index"""
+    
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+    
+    def test_pattern_range(self):
+        """Test a line scores 1.0 and isotropic patterns score about 0.5"""
+        t = self.rng.uniform(0, 2 * np.pi, 2000)
+        x = self.rng.uniform(-1, 1, 2000)
+        identity = np.eye(2)
+        
+        self.assertAlmostEqual(stringy_index(np.column_stack([x, 2 * x]), identity), 1.0)
+        self.assertAlmostEqual(
+            stringy_index(np.column_stack([np.cos(t), np.sin(t)]), identity), 0.5, delta=0.03
+        )
+        self.assertAlmostEqual(
+            stringy_index(self.rng.uniform(-1, 1, (2000, 2)), identity), 0.5, delta=0.03
+        )
+    
+    def test_batched_matches_eigvalsh(self):
+        """Test the closed form agrees with a per-basis eigendecomposition"""
+        data = self.rng.standard_normal((500, 6)) @ self.rng.standard_normal((6, 6))
+        bases = random_bases(6, 200, self.rng)
+        values = stringy_index(data, bases)
+        
+        cov = np.cov(data, rowvar=False)
+        for basis, value in zip(bases, values):
+            eigenvalues = np.linalg.eigvalsh(basis.T @ cov @ basis)
+            self.assertAlmostEqual(value, eigenvalues[-1] / eigenvalues.sum())
+        self.assertTrue(np.all((values >= 0.5) & (values <= 1.0)))
+    
+    def test_single_basis_and_degenerate_projection(self):
+        """Test a single basis gives a scalar and a constant projection scores 0.5"""
+        data = np.column_stack([self.rng.normal(size=100), np.zeros(100), np.zeros(100)])
+        basis = np.array([[0.0, 0.0], [1.0, 0.0], [0.0, 1.0]])
+        self.assertEqual(np.ndim(stringy_index(data, basis)), 0)
+        self.assertEqual(stringy_index(data, basis), 0.5)
+        self.assertEqual(stringy_index_from_covariance(covariance(data), basis[None]).shape, (1,))
+    
+    def test_helpers(self):
+        """Test orthonormalization, eigenvalues and input validation"""
+        bases = orthonormalize(self.rng.standard_normal((50, 5, 2)))
+        gram = np.swapaxes(bases, 1, 2) @ bases
+        np.testing.assert_allclose(gram, np.broadcast_to(np.eye(2), gram.shape), atol=1e-12)
+        
+        matrices = np.array([[[2.0, 1.0], [1.0, 2.0]], [[1.0, 0.0], [0.0, 3.0]]])
+        np.testing.assert_allclose(eigenvalues_2x2(matrices), [[3.0, 1.0], [3.0, 1.0]])
+        
+        with self.assertRaises(ValueError):
+            covariance(np.ones(10))
+
+
+
+class TestIndexLibrary(unittest.TestCase):
+    """Test the dataset-prepared index classes"""
+    
+    def setUp(self):
+        self.rng = np.random.default_rng(1)
+        self.labels = np.repeat([0, 1, 2], 100)
+        self.data = self.rng.normal(size=(300, 5))
+        # Classes separated along the first variable only
+        self.data[:, 0] += self.labels * 4.0
+    
+    def test_lda_matches_projected_reference(self):
+        """Test the precomputed scatter gives the projected-data index"""
+        bases = np.concatenate([random_bases(5, 30, self.rng),
+                                orthonormalize(self.rng.standard_normal((10, 5, 3)))[:, :, :2]])
+        values = LDAIndex(self.data, self.labels)(bases)
+        for basis, value in zip(bases, values):
+            self.assertAlmostEqual(value, reference_lda(self.data, self.labels, basis))
+        
+        index = make_index('lda', self.data, self.labels)
+        separating = np.eye(5)[:, :2]
+        noise = np.eye(5)[:, 3:]
+        self.assertGreater(index(separating), 0.9)
+        self.assertLess(index(noise), 0.1)
+    
+    def test_pda_shrinkage(self):
+        """Test pda equals lda at lambda 0 and stays in [0, 1]"""
+        bases = random_bases(5, 20, self.rng)
+        np.testing.assert_allclose(PDAIndex(self.data, self.labels, lambda_=0.0)(bases),
+                                   LDAIndex(self.data, self.labels)(bases))
+        values = PDAIndex(self.data, self.labels, lambda_=0.9)(bases)
+        self.assertTrue(np.all((values >= 0) & (values <= 1)))
+        with self.assertRaises(ValueError):
+            PDAIndex(self.data, self.labels, lambda_=2.0)
+    
+    def test_holes_and_central_mass(self):
+        """Test the kernel indices match a per-basis loop and find their structure"""
+        # A hollow shell in the first two variables, Gaussian noise elsewhere
+        angle = self.rng.uniform(0, 2 * np.pi, 400)
+        data = np.column_stack([np.cos(angle), np.sin(angle), self.rng.normal(size=(400, 2))])
+        holes = HolesIndex(data)
+        holes.chunk_elements = 2000
+        bases = random_bases(4, 25, self.rng)
+        
+        sphered = sphere(data)
+        floor = np.exp(-1)
+        for basis, value in zip(bases, holes(bases)):
+            kernel = np.exp(-0.5 * ((sphered @ basis) ** 2).sum(axis=1)).mean()
+            self.assertAlmostEqual(value, (1 - kernel) / (1 - floor))
+        
+        hollow = np.eye(4)[:, :2]
+        gaussian = np.eye(4)[:, 2:]
+        self.assertGreater(holes(hollow), holes(gaussian))
+        central_mass = CentralMassIndex(data)
+        self.assertGreater(central_mass(gaussian), central_mass(hollow))
+        np.testing.assert_allclose(holes(bases) + central_mass(bases), 1.0)
+    
+    def test_stringy_class(self):
+        """Test the stringy class agrees with the function and needs 2D bases"""
+        bases = random_bases(5, 10, self.rng)
+        np.testing.assert_allclose(StringyIndex(self.data)(bases), stringy_index(self.data, bases))
+        with self.assertRaises(ValueError):
+            StringyIndex(self.data)(np.eye(5)[:, :3])
+    
+    def test_validation(self):
+        """Test unknown names, missing labels and mismatched bases are rejected"""
+        with self.assertRaises(ValueError):
+            make_index('skinny', self.data)
+        with self.assertRaises(ValueError):
+            make_index('pda', self.data)
+        with self.assertRaises(ValueError):
+            HolesIndex(self.data)(np.eye(4)[:, :2])
+        with self.assertRaises(ValueError):
+            group_scatter(self.data, np.zeros(300))
+        
+        within, between = group_scatter(self.data, self.labels)
+        centered = self.data - self.data.mean(axis=0)
+        np.testing.assert_allclose(within + between, centered.T @ centered)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
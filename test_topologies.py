@@ -0,0 +1,162 @@
+"""
+Test suite for agent communication topologies
+"""
+
+import random
+import tempfile
+import unittest
+from collections import Counter
+from multi_agent_search import Architecture, MultiAgentSearchCoordinator, RandomSearchAgent
+from topologies import (
+    IslandTopology,
+    KRegularTopology,
+    RandomTopology,
+    RingTopology,
+    StarTopology
+)
+
+
+SEARCH_SPACE = {'x': list(range(10)), 'y': list(range(10))}
+
+
+def topology_eval(config):
+    """Module-level evaluation function"""
+    return config['x'] * 0.1 + config['y'] * 0.01
+
+
+def make_agents(scores):
+    """Agents whose best architectures have the given scores"""
+    agents = []
+    for position, score in enumerate(scores):
+        agent = RandomSearchAgent(position, SEARCH_SPACE)
+        agent.update(Architecture({'x': position % 10, 'y': 0}), score)
+        agents.append(agent)
+    return agents
+
+
+class TestTopologies(unittest.TestCase):
+    """Test the (sender, receiver) pairs of each topology"""
+    
+    def test_ring(self):
+        """Test ring agents share with their k successors"""
+        pairs = list(RingTopology(k=2).pairs(make_agents([0.0] * 5)))
+        self.assertEqual(len(pairs), 10)
+        self.assertIn((4, 0), pairs)
+        self.assertIn((4, 1), pairs)
+        self.assertNotIn((0, 4), pairs)
+    
+    def test_k_regular(self):
+        """Test every agent sends to k distinct peers and the graph is kept"""
+        random.seed(0)
+        topology = KRegularTopology(k=3)
+        agents = make_agents([0.0] * 50)
+        pairs = list(topology.pairs(agents))
+        
+        senders = Counter(sender for sender, _ in pairs)
+        self.assertEqual(set(senders.values()), {3})
+        self.assertEqual(len(set(pairs)), len(pairs))
+        self.assertTrue(all(sender != receiver for sender, receiver in pairs))
+        self.assertEqual(list(topology.pairs(agents)), pairs)
+    
+    def test_star_uses_best_board(self):
+        """Test the best agent's architecture reaches everyone in n - 1 messages"""
+        agents = make_agents([0.2, 0.9, 0.1, 0.5])
+        pairs = list(StarTopology().pairs(agents))
+        self.assertEqual(pairs, [(1, 0), (1, 2), (1, 3)])
+        
+        StarTopology().communicate(agents)
+        self.assertEqual({agent.best_architecture.score for agent in agents}, {0.9})
+    
+    def test_island_migration(self):
+        """Test islands share internally and migrate on schedule"""
+        agents = make_agents([0.1, 0.2, 0.3, 0.9, 0.5, 0.6])
+        topology = IslandTopology(num_islands=2, migration_interval=2)
+        
+        topology.communicate(agents)
+        self.assertEqual([agent.best_architecture.score for agent in agents],
+                         [0.3, 0.3, 0.3, 0.9, 0.9, 0.9])
+        
+        topology.communicate(agents)
+        self.assertEqual({agent.best_architecture.score for agent in agents}, {0.9})
+    
+    def test_random_matches_original_sampling(self):
+        """Test the default topology draws the same peers as the original code"""
+        agents = make_agents([0.0] * 6)
+        random.seed(4)
+        pairs = list(RandomTopology().pairs(agents))
+        
+        random.seed(4)
+        expected = []
+        for sender, agent in enumerate(agents):
+            others = [a for a in agents if a is not agent]
+            for other in random.sample(others, random.randint(1, len(agents) - 1)):
+                expected.append((sender, agents.index(other)))
+        self.assertEqual(pairs, expected)
+
+
+class TestCoordinatorTopology(unittest.TestCase):
+    """Test topologies selected on the coordinator"""
+    
+    def test_many_agents_linear_messages(self):
+        """Test hundreds of agents communicate with O(n * k) share calls"""
+        random.seed(1)
+        coordinator = MultiAgentSearchCoordinator(
+            search_space=SEARCH_SPACE,
+            evaluation_fn=topology_eval,
+            num_agents=300,
+            topology=KRegularTopology(k=2)
+        )
+        calls = []
+        for agent in coordinator.agents:
+            agent.share_knowledge = lambda other, calls=calls: calls.append(other)
+        coordinator.search(num_iterations=1, communication_interval=1, verbose=False)
+        self.assertEqual(len(calls), 600)
+    
+    def test_topology_by_name(self):
+        """Test topologies are selectable by name and validated"""
+        coordinator = MultiAgentSearchCoordinator(
+            search_space=SEARCH_SPACE,
+            evaluation_fn=topology_eval,
+            num_agents=4,
+            topology='star'
+        )
+        self.assertIsInstance(coordinator.topology, StarTopology)
+        coordinator.search(num_iterations=10, communication_interval=2, verbose=False)
+        self.assertEqual(
+            {agent.best_architecture.score for agent in coordinator.agents
+             if agent.best_architecture is not None},
+            {max(a.best_architecture.score for a in coordinator.agents)}
+        )
+        
+        with self.assertRaises(ValueError):
+            MultiAgentSearchCoordinator(SEARCH_SPACE, topology_eval, topology='mesh')
+    
+    def test_resume_keeps_k_regular_graph(self):
+        """Test a resumed run reuses the checkpointed communication graph"""
+        def build():
+            return MultiAgentSearchCoordinator(
+                search_space=SEARCH_SPACE,
+                evaluation_fn=topology_eval,
+                num_agents=6,
+                topology='k_regular',
+                proposal_retries=2
+            )
+        
+        random.seed(9)
+        uninterrupted = build()
+        uninterrupted.search(num_iterations=12, communication_interval=2, verbose=False)
+        
+        with tempfile.TemporaryDirectory() as directory:
+            random.seed(9)
+            build().search(num_iterations=6, communication_interval=2, verbose=False,
+                           checkpoint=directory, checkpoint_interval=2)
+            resumed = build()
+            resumed.search(num_iterations=12, communication_interval=2, verbose=False,
+                           resume_from=directory)
+        
+        self.assertEqual(resumed.topology._neighbours, uninterrupted.topology._neighbours)
+        self.assertEqual(resumed.get_statistics(), uninterrupted.get_statistics())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
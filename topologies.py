@@ -0,0 +1,191 @@
+"""
+Communication Topologies
+
+Strategies deciding which agents share knowledge with which during a
+communication round. Agents are addressed by position, so a round never
+compares Architecture or Agent objects, and every topology except 'random'
+costs O(n * k) share_knowledge calls for n agents and k peers per agent.
+"""
+
+import random
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class Topology(ABC):
+    """Base class for communication topologies."""
+
+    @abstractmethod
+    def pairs(self, agents: List) -> Iterable[Tuple[int, int]]:
+        """
+        Yield the (sender, receiver) positions of one communication round.
+
+        Args:
+            agents: The coordinator's agents
+        """
+        pass
+
+    def communicate(self, agents: List):
+        """Run one communication round over agents."""
+        for sender, receiver in self.pairs(agents):
+            agents[sender].share_knowledge(agents[receiver])
+
+
+def _best_position(agents: List, positions: Iterable[int]) -> Optional[int]:
+    """Position of the agent with the highest best score, if any has one."""
+    best = None
+    best_score = None
+    for position in positions:
+        architecture = agents[position].best_architecture
+        if architecture is not None and (best is None or architecture.score > best_score):
+            best, best_score = position, architecture.score
+    return best
+
+
+class RandomTopology(Topology):
+    """
+    Every agent shares with a random subset of 1..n-1 other agents.
+
+    This is the original behaviour and costs O(n^2) per round on average;
+    peers are drawn by position so no agents are compared.
+    """
+
+    def pairs(self, agents: List) -> Iterable[Tuple[int, int]]:
+        num_agents = len(agents)
+        for sender in range(num_agents):
+            num_connections = random.randint(1, num_agents - 1)
+            for position in random.sample(range(num_agents - 1), num_connections):
+                # Skip over the sender's own position
+                yield sender, position if position < sender else position + 1
+
+
+class RingTopology(Topology):
+    """Every agent shares with the next k agents around a ring."""
+
+    def __init__(self, k: int = 1):
+        """
+        Args:
+            k: Successors each agent shares with
+        """
+        self.k = k
+
+    def pairs(self, agents: List) -> Iterable[Tuple[int, int]]:
+        num_agents = len(agents)
+        for sender in range(num_agents):
+            for offset in range(1, min(self.k, num_agents - 1) + 1):
+                yield sender, (sender + offset) % num_agents
+
+
+class KRegularTopology(Topology):
+    """
+    Every agent shares with k fixed random peers.
+
+    The graph is the union of k random permutations with self-loops
+    redirected, drawn once per agent count, so each agent sends and receives
+    about k messages per round. Set rewire to draw a fresh graph every round.
+    """
+
+    def __init__(self, k: int = 3, rewire: bool = False):
+        """
+        Args:
+            k: Peers each agent shares with
+            rewire: Whether to draw a new graph every round
+        """
+        self.k = k
+        self.rewire = rewire
+        self._neighbours: Optional[List[List[int]]] = None
+
+    def pairs(self, agents: List) -> Iterable[Tuple[int, int]]:
+        num_agents = len(agents)
+        if self.rewire or self._neighbours is None or len(self._neighbours) != num_agents:
+            self._neighbours = self._draw_graph(num_agents)
+        for sender, receivers in enumerate(self._neighbours):
+            for receiver in receivers:
+                yield sender, receiver
+
+    def _draw_graph(self, num_agents: int) -> List[List[int]]:
+        """Draw k out-neighbours per agent, avoiding self-loops and repeats."""
+        neighbours = [[] for _ in range(num_agents)]
+        if num_agents < 2:
+            return neighbours
+        for _ in range(min(self.k, num_agents - 1)):
+            permutation = list(range(num_agents))
+            random.shuffle(permutation)
+            for sender, receiver in enumerate(permutation):
+                if receiver == sender or receiver in neighbours[sender]:
+                    # Fall back to the next free position around the ring
+                    receiver = (sender + 1) % num_agents
+                    while receiver in neighbours[sender]:
+                        receiver = (receiver + 1) % num_agents
+                neighbours[sender].append(receiver)
+        return neighbours
+
+
+class StarTopology(Topology):
+    """
+    Agents exchange knowledge through a shared best-board.
+
+    The agent holding the best architecture posts it and every other agent
+    reads it, which is n - 1 messages per round.
+    """
+
+    def pairs(self, agents: List) -> Iterable[Tuple[int, int]]:
+        hub = _best_position(agents, range(len(agents)))
+        if hub is None:
+            return
+        for receiver in range(len(agents)):
+            if receiver != hub:
+                yield hub, receiver
+
+
+class IslandTopology(Topology):
+    """
+    Agents are split into islands that evolve mostly in isolation.
+
+    Within an island every round works like a star topology. Every
+    migration_interval rounds each island's best is also sent to all agents
+    of the next island, so diversity is kept between migrations.
+    """
+
+    def __init__(self, num_islands: int = 4, migration_interval: int = 5):
+        """
+        Args:
+            num_islands: Number of islands (at most one per agent)
+            migration_interval: Rounds between migrations
+        """
+        self.num_islands = num_islands
+        self.migration_interval = migration_interval
+        self.rounds = 0
+
+    def islands(self, num_agents: int) -> List[range]:
+        """Contiguous agent positions forming each island."""
+        num_islands = max(1, min(self.num_islands, num_agents))
+        bounds = [island * num_agents // num_islands for island in range(num_islands + 1)]
+        return [range(bounds[i], bounds[i + 1]) for i in range(num_islands)]
+
+    def pairs(self, agents: List) -> Iterable[Tuple[int, int]]:
+        self.rounds += 1
+        islands = self.islands(len(agents))
+        leaders = [_best_position(agents, island) for island in islands]
+        for island, leader in zip(islands, leaders):
+            if leader is None:
+                continue
+            for receiver in island:
+                if receiver != leader:
+                    yield leader, receiver
+
+        if len(islands) > 1 and self.rounds % self.migration_interval == 0:
+            for position, leader in enumerate(leaders):
+                if leader is None:
+                    continue
+                for receiver in islands[(position + 1) % len(islands)]:
+                    yield leader, receiver
+
+
+TOPOLOGIES: Dict[str, type] = {
+    'random': RandomTopology,
+    'ring': RingTopology,
+    'k_regular': KRegularTopology,
+    'star': StarTopology,
+    'island': IslandTopology,
+}